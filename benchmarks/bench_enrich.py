@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: enrich_pokemon_data.py against a local stand-in for PokéAPI.
+
+Writes PokéAPI-shaped responses for 1x and 4x copies of data/pokemon.json
+(see bench_pokemon_columns.py), serves them from fixture_server.py with
+injected latency and a share of 503 failures, and times, per size:
+
+    cold      every species fetched and mapped (empty checkpoint)
+    warm      a second run, where every response is a 304
+    resumed   a run cancelled halfway, then resumed from its checkpoint
+
+Each run's fields are checked against the records the fixtures came from.
+The 1x dataset is also fetched with --concurrency 1 for comparison.
+
+Usage:
+    python benchmarks/bench_enrich.py [--latency 0.1] [--failure-rate 0.02] [--rate 100]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from bench_pokemon_columns import scaled_records  # noqa: E402
+from enrich_pokemon_data import Enricher, apply_fields, write_fixtures  # noqa: E402
+from fixture_server import FixtureServer  # noqa: E402
+from pokemon_index import DATA_PATH  # noqa: E402
+
+SCALES = [1, 4]
+
+
+def enrich(server_url, ids, checkpoint, args, concurrency=None, timeout=None):
+    """One enrichment run. Returns (seconds, stats); stats is None if cancelled."""
+    enricher = Enricher(checkpoint, concurrency=concurrency or args.concurrency, rate=args.rate,
+                        burst=args.burst, backoff=0.05, mirror=server_url, verbose=False)
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            stats = asyncio.run(asyncio.wait_for(enricher.run(ids), timeout))
+    except asyncio.TimeoutError:
+        stats = None
+    return time.perf_counter() - start, stats
+
+
+def check(records, checkpoint):
+    """Assert the checkpointed fields reproduce the records."""
+    enriched = [{"id": record["id"], "name": record["name"]} for record in records]
+    apply_fields(enriched, checkpoint)
+    for original, result in zip(records, enriched):
+        for field, value in result.items():
+            if field != "categoryTag":
+                assert original.get(field) == value, (original["id"], field, value)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the Pokémon enrichment fetcher")
+    parser.add_argument("--latency", type=float, default=0.1, help="seconds per request")
+    parser.add_argument("--failure-rate", type=float, default=0.02, help="share of 503 answers")
+    parser.add_argument("--rate", type=float, default=100, help="requests per second")
+    parser.add_argument("--burst", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    with open(DATA_PATH, "r", encoding="utf-8") as f:
+        base = json.load(f)
+
+    print(f"{'species':>8}  {'workers':>7}  {'cold':>7}  {'warm':>7}  {'resumed':>13}  retries")
+    for scale in SCALES:
+        records = scaled_records(base, scale)
+        ids = [record["id"] for record in records]
+        with tempfile.TemporaryDirectory() as workdir:
+            write_fixtures(records, Path(workdir))
+            with FixtureServer(workdir, latency=args.latency, failure_rate=args.failure_rate) as server:
+                for concurrency in ([1, args.concurrency] if scale == 1 else [args.concurrency]):
+                    checkpoint = {"run": None, "species": {}}
+                    cold, stats = enrich(server.url, ids, checkpoint, args, concurrency)
+                    assert stats["failed"] == 0 and stats["changed"] == len(ids), stats
+                    check(records, checkpoint)
+                    retries = stats["retries"]
+                    if concurrency != args.concurrency:
+                        print(f"{len(ids):>8,}  {concurrency:>7}  {cold:>6.1f}s")
+                        continue
+                    warm, stats = enrich(server.url, ids, checkpoint, args)
+                    assert stats["unchanged"] == len(ids), stats
+
+                    checkpoint = {"run": None, "species": {}}
+                    first, _ = enrich(server.url, ids, checkpoint, args, timeout=cold / 2)
+                    second, stats = enrich(server.url, ids, checkpoint, args)
+                    assert stats["resumed"] > 0 and stats["failed"] == 0, stats
+                    check(records, checkpoint)
+                    print(f"{len(ids):>8,}  {concurrency:>7}  {cold:>6.1f}s  {warm:>6.1f}s  "
+                          f"{first:>4.1f}s + {second:>4.1f}s  {retries:>7}")
+
+
+if __name__ == "__main__":
+    main()
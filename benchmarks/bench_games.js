@@ -0,0 +1,455 @@
+// End-to-end benchmark: both games played headlessly on the scaled data
+// written by make_bench_data.py (1x, 10x, 100x).
+//
+// Each game and scale runs in its own Node process: the page's scripts
+// (the <script src> files, then the inline script) are evaluated in a vm
+// context with a minimal DOM, fetch() reads the built data files, and the
+// game is started and played by clicking option buttons, answering about
+// 70% of the questions correctly. Per run it reports
+//
+//     ttfq        time to first question: script evaluation, init() and
+//                 startGame() until the first options are rendered
+//     question    p50/p99 of nextQuestion()
+//     answer      p50/p99 of an option click (selectAnswer, medals, progress)
+//     functions   p50/p99 of the hot functions inside those two
+//     alloc       median bytes allocated per question (heap growth between
+//                 questions, skipping samples with a collection in between),
+//                 collections and their pause time during play, and heap
+//                 retained after play and a full collection
+//     flush       the batched progress write at the end (flushPendingWrites)
+//
+// Results are written as JSON (default .cache/bench/games-<commit>.json)
+// so runs can be compared between commits with --compare.
+//
+// Usage: node benchmarks/bench_games.js [--questions 2000] [--scales 1 10 100]
+//                                       [--out results.json] [--compare baseline.json]
+
+const childProcess = require('child_process');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const v8 = require('v8');
+const { PerformanceObserver, performance } = require('perf_hooks');
+
+const REPO_ROOT = path.resolve(__dirname, '..');
+const BENCH_DIR = path.join(REPO_ROOT, '.cache', 'bench');
+const CORRECT_SHARE = 0.7;
+
+// Page, hot functions, and how to read the right answer off the page state
+const GAMES = {
+    pokemon: {
+        page: 'pokemon-game.html',
+        functions: ['selectRandomPokemon', 'generateDecoys', 'renderOptions', 'checkMedals', 'saveProgress'],
+        correctLabel: 'currentPokemon.name + " / " + currentPokemon.germanName'
+    },
+    geo: {
+        page: 'geotriad-game/index.html',
+        functions: ['selectRandomCountry', 'renderOptions', 'checkMedals', 'saveProgress'],
+        methods: { getOptions: 'Object.values(GAME_MODES)' },
+        correctLabel: 'currentQuestion.correctAnswer'
+    }
+};
+
+// ===========================================
+// MINIMAL DOM
+// ===========================================
+
+// Methods live on prototypes so the shim itself adds little to the
+// allocation figures
+class ClassList {
+    constructor() { this.names = new Set(); }
+    add(...names) { names.forEach(name => this.names.add(name)); }
+    remove(...names) { names.forEach(name => this.names.delete(name)); }
+    contains(name) { return this.names.has(name); }
+    toggle(name, force) {
+        const on = force === undefined ? !this.names.has(name) : force;
+        if (on) this.names.add(name); else this.names.delete(name);
+        return on;
+    }
+}
+
+class Element {
+    constructor(tag) {
+        this.tagName = tag.toUpperCase();
+        this.children = [];
+        this.style = {};
+        this.attributes = {};
+        this.classList = new ClassList();
+        this.className = '';
+        this.disabled = false;
+        this.checked = false;
+        this.value = '';
+        this.text = '';
+    }
+    get textContent() { return this.text; }
+    set textContent(value) { this.children = []; this.text = String(value); }
+    get innerHTML() { return this.text; }
+    set innerHTML(value) { this.children = []; this.text = String(value); }
+    appendChild(child) { this.children.push(child); return child; }
+    append(...children) { this.children.push(...children); }
+    remove() {}
+    setAttribute(name, value) { this.attributes[name] = String(value); }
+    getAttribute(name) { return name in this.attributes ? this.attributes[name] : null; }
+    removeAttribute(name) { delete this.attributes[name]; }
+    addEventListener(type, listener) {
+        this.listeners = this.listeners || {};
+        (this.listeners[type] = this.listeners[type] || []).push(listener);
+    }
+    removeEventListener() {}
+    querySelector(selector) { return this.querySelectorAll(selector)[0] || null; }
+    querySelectorAll(selector) { return descendants(this).filter(node => matches(node, selector)); }
+    focus() {}
+    blur() {}
+    select() {}
+}
+
+function createElement(tag) {
+    return new Element(tag);
+}
+
+function descendants(root, out = []) {
+    root.children.forEach(child => {
+        out.push(child);
+        descendants(child, out);
+    });
+    return out;
+}
+
+function matches(element, selector) {
+    if (selector.startsWith('.')) {
+        return element.className.split(' ').includes(selector.slice(1)) || element.classList.contains(selector.slice(1));
+    }
+    if (selector.startsWith('[')) return selector.slice(1, -1) in element.attributes;
+    return element.tagName === selector.toUpperCase();
+}
+
+function createDocument() {
+    const byId = new Map();
+    const body = createElement('body');
+    return {
+        body,
+        documentElement: createElement('html'),
+        visibilityState: 'visible',
+        getElementById(id) {
+            if (!byId.has(id)) {
+                const element = createElement('div');
+                element.id = id;
+                body.appendChild(element);
+                byId.set(id, element);
+            }
+            return byId.get(id);
+        },
+        querySelector(selector) { return body.querySelector(selector); },
+        querySelectorAll(selector) { return body.querySelectorAll(selector); },
+        createElement,
+        addEventListener() {},
+        removeEventListener() {}
+    };
+}
+
+function createStorage() {
+    const items = new Map();
+    return {
+        getItem: key => (items.has(key) ? items.get(key) : null),
+        setItem: (key, value) => { items.set(key, String(value)); },
+        removeItem: key => { items.delete(key); },
+        clear: () => items.clear()
+    };
+}
+
+// A browser-like global scope for one page, fetching from siteDir
+function createPageContext(pageDir, siteDir) {
+    const windowListeners = {};
+    const context = {
+        console: { log() {}, info() {}, warn: console.warn, error: console.error },
+        performance,
+        setTimeout,
+        clearTimeout,
+        setInterval,
+        clearInterval,
+        queueMicrotask,
+        structuredClone,
+        URL,
+        URLSearchParams,
+        Blob,
+        TextEncoder,
+        document: createDocument(),
+        localStorage: createStorage(),
+        navigator: { language: 'en-US', languages: ['en-US'] },
+        alert: message => { throw new Error(`alert: ${message}`); },
+        confirm: () => true,
+        Image: class {
+            decode() { return Promise.resolve(); }
+        },
+        fetch: async url => {
+            const file = path.join(siteDir, path.relative(REPO_ROOT, path.resolve(pageDir, url)));
+            const body = await fs.promises.readFile(file, 'utf8');
+            return { ok: true, status: 200, json: async () => JSON.parse(body), text: async () => body };
+        }
+    };
+    context.window = context;
+    context.self = context;
+    context.addEventListener = (type, listener) => {
+        (windowListeners[type] = windowListeners[type] || []).push(listener);
+    };
+    context.removeEventListener = () => {};
+    context.matchMedia = () => ({ matches: false, addEventListener() {} });
+    context.dispatch = type => (windowListeners[type] || []).map(listener => listener({ type }));
+    return vm.createContext(context);
+}
+
+// The page's <script src> files and its inline script, in document order
+function pageScripts(pagePath) {
+    const html = fs.readFileSync(pagePath, 'utf8');
+    const scripts = [];
+    const pattern = /<script(?:\s+src="([^"]+)")?\s*>([\s\S]*?)<\/script>/g;
+    let match;
+    while ((match = pattern.exec(html)) !== null) {
+        if (match[1]) {
+            const file = path.resolve(path.dirname(pagePath), match[1]);
+            scripts.push({ file, source: fs.readFileSync(file, 'utf8') });
+        } else {
+            scripts.push({ file: pagePath, source: match[2] });
+        }
+    }
+    return scripts;
+}
+
+// ===========================================
+// ONE RUN (child process)
+// ===========================================
+
+function percentile(sorted, q) {
+    return sorted.length ? sorted[Math.min(sorted.length - 1, Math.floor(q * sorted.length))] : 0;
+}
+
+function summarize(samples) {
+    const sorted = Float64Array.from(samples).sort();
+    return {
+        p50: Number(percentile(sorted, 0.5).toFixed(4)),
+        p99: Number(percentile(sorted, 0.99).toFixed(4)),
+        count: sorted.length
+    };
+}
+
+function heapUsed() {
+    return v8.getHeapStatistics().used_heap_size;
+}
+
+async function settle() {
+    await new Promise(resolve => setImmediate(resolve));
+}
+
+async function run(gameName, scale, questions) {
+    const game = GAMES[gameName];
+    const siteDir = path.join(BENCH_DIR, `${scale}x`);
+    const pagePath = path.join(REPO_ROOT, game.page);
+    const scripts = pageScripts(pagePath);
+
+    const start = performance.now();
+    const context = createPageContext(path.dirname(pagePath), siteDir);
+    scripts.forEach(script => vm.runInContext(script.source, context, { filename: script.file }));
+    const evaluated = performance.now();
+    await Promise.all(context.dispatch('load'));
+    const initialized = performance.now();
+    context.startGame();
+    await settle();
+    const options = context.document.getElementById('optionsContainer').children.length;
+    if (options === 0) throw new Error(`${gameName} ${scale}x: no options rendered`);
+    const firstQuestion = performance.now();
+
+    // Time the hot functions in place: top-level declarations are properties
+    // of the page's global object, mode methods are swapped on their objects
+    const timings = {};
+    context.__time = (name, fn) => function (...args) {
+        const begin = performance.now();
+        try {
+            return fn.apply(this, args);
+        } finally {
+            timings[name].push(performance.now() - begin);
+        }
+    };
+    game.functions.forEach(name => {
+        timings[name] = [];
+        vm.runInContext(`${name} = __time('${name}', ${name});`, context);
+    });
+    Object.entries(game.methods || {}).forEach(([name, owners]) => {
+        timings[name] = [];
+        vm.runInContext(`${owners}.forEach(owner => { owner.${name} = __time('${name}', owner.${name}); });`, context);
+    });
+    const correctLabel = new vm.Script(game.correctLabel);
+
+    const questionTimes = [];
+    const answerTimes = [];
+    const allocations = [];
+    const collections = [];
+    const observer = new PerformanceObserver(list => list.getEntries().forEach(entry => collections.push(entry.duration)));
+    observer.observe({ entryTypes: ['gc'] });
+
+    if (typeof global.gc === 'function') global.gc();
+    const heapBefore = heapUsed();
+    let correct = 0;
+    for (let i = 0; i < questions; i++) {
+        const before = heapUsed();
+        const t0 = performance.now();
+        await context.nextQuestion();
+        const t1 = performance.now();
+
+        const label = correctLabel.runInContext(context);
+        const buttons = context.document.getElementById('optionsContainer').children;
+        const answerCorrectly = Math.random() < CORRECT_SHARE;
+        const button = buttons.find(b => (b.textContent === label) === answerCorrectly) || buttons[0];
+        const t2 = performance.now();
+        button.onclick();
+        const t3 = performance.now();
+        const after = heapUsed();
+
+        if (button.textContent === label) correct++;
+        questionTimes.push(t1 - t0);
+        answerTimes.push(t3 - t2);
+        if (after >= before) allocations.push(after - before);
+    }
+    // gc entries are delivered from a timer, not at the end of the loop
+    await new Promise(resolve => setTimeout(resolve, 50));
+    observer.disconnect();
+
+    const flushStart = performance.now();
+    context.flushPendingWrites();
+    const flushMs = performance.now() - flushStart;
+
+    let retainedBytes = null;
+    if (typeof global.gc === 'function') {
+        global.gc();
+        retainedBytes = heapUsed() - heapBefore;
+    }
+
+    const functions = {};
+    Object.entries(timings).forEach(([name, samples]) => { functions[name] = summarize(samples); });
+    return {
+        game: gameName,
+        scale,
+        questions,
+        correct,
+        ttfq: {
+            totalMs: Number((firstQuestion - start).toFixed(3)),
+            evaluateMs: Number((evaluated - start).toFixed(3)),
+            initMs: Number((initialized - evaluated).toFixed(3)),
+            firstQuestionMs: Number((firstQuestion - initialized).toFixed(3))
+        },
+        questionMs: summarize(questionTimes),
+        answerMs: summarize(answerTimes),
+        functions,
+        alloc: {
+            bytesPerQuestionP50: Math.round(percentile(Float64Array.from(allocations).sort(), 0.5)),
+            collections: collections.length,
+            collectionMs: Number(collections.reduce((sum, ms) => sum + ms, 0).toFixed(3)),
+            retainedBytes
+        },
+        flushMs: Number(flushMs.toFixed(3))
+    };
+}
+
+// ===========================================
+// DRIVER
+// ===========================================
+
+function parseArgs(argv) {
+    const args = { questions: 2000, scales: [1, 10, 100], games: Object.keys(GAMES), out: null, compare: null };
+    for (let i = 0; i < argv.length; i++) {
+        const flag = argv[i];
+        const values = [];
+        while (i + 1 < argv.length && !argv[i + 1].startsWith('--')) values.push(argv[++i]);
+        if (flag === '--questions') args.questions = parseInt(values[0], 10);
+        else if (flag === '--scales') args.scales = values.map(Number);
+        else if (flag === '--games') args.games = values;
+        else if (flag === '--out') args.out = values[0];
+        else if (flag === '--compare') args.compare = values[0];
+        else if (flag === '--child') args.child = values;
+        else throw new Error(`unknown option ${flag}`);
+    }
+    return args;
+}
+
+function gitCommit() {
+    try {
+        return childProcess.execSync('git rev-parse --short HEAD', { cwd: REPO_ROOT }).toString().trim()
+            + (childProcess.execSync('git status --porcelain', { cwd: REPO_ROOT }).toString().trim() ? '-dirty' : '');
+    } catch (error) {
+        return 'unknown';
+    }
+}
+
+function runChild(game, scale, questions) {
+    return new Promise((resolve, reject) => {
+        const child = childProcess.fork(__filename, ['--child', game, String(scale), '--questions', String(questions)],
+            { execArgv: ['--expose-gc'] });
+        child.once('message', resolve);
+        child.once('exit', code => { if (code) reject(new Error(`${game} ${scale}x exited with ${code}`)); });
+    });
+}
+
+function change(before, after) {
+    if (!before) return '';
+    const ratio = (after - before) / before;
+    return ` (${ratio >= 0 ? '+' : ''}${(ratio * 100).toFixed(0)}%)`;
+}
+
+function printResult(result, baseline) {
+    const base = baseline || {};
+    const field = (value, old, unit) => `${value}${unit}${change(old, value)}`;
+    console.log(`${result.game.padEnd(8)} ${String(result.scale + 'x').padStart(4)}  `
+        + `ttfq ${field(result.ttfq.totalMs.toFixed(1), base.ttfq && base.ttfq.totalMs, 'ms')}  `
+        + `question p50 ${field(result.questionMs.p50.toFixed(3), base.questionMs && base.questionMs.p50, 'ms')} `
+        + `p99 ${result.questionMs.p99.toFixed(3)}ms  `
+        + `answer p50 ${field(result.answerMs.p50.toFixed(3), base.answerMs && base.answerMs.p50, 'ms')} `
+        + `p99 ${result.answerMs.p99.toFixed(3)}ms  `
+        + `alloc ${field((result.alloc.bytesPerQuestionP50 / 1024).toFixed(1), base.alloc && base.alloc.bytesPerQuestionP50 / 1024, ' KiB')}/q`);
+}
+
+async function main() {
+    const args = parseArgs(process.argv.slice(2));
+    if (args.child) {
+        const [game, scale] = args.child;
+        process.send(await run(game, Number(scale), args.questions));
+        process.exit(0);
+    }
+
+    const missing = args.scales.filter(scale => !fs.existsSync(path.join(BENCH_DIR, `${scale}x`)));
+    if (missing.length) {
+        console.error(`✗ No data for ${missing.join(', ')}x: run python benchmarks/make_bench_data.py first`);
+        process.exit(1);
+    }
+    const baseline = args.compare ? JSON.parse(fs.readFileSync(args.compare, 'utf8')) : null;
+    const findBaseline = result => baseline && baseline.results.find(old =>
+        old.game === result.game && old.scale === result.scale);
+
+    const report = {
+        commit: gitCommit(),
+        date: new Date().toISOString(),
+        node: process.version,
+        questions: args.questions,
+        results: []
+    };
+    for (const game of args.games) {
+        for (const scale of args.scales) {
+            const result = await runChild(game, scale, args.questions);
+            report.results.push(result);
+            printResult(result, findBaseline(result));
+        }
+    }
+
+    const out = args.out || path.join(BENCH_DIR, `games-${report.commit}.json`);
+    fs.mkdirSync(path.dirname(out), { recursive: true });
+    fs.writeFileSync(out, JSON.stringify(report, null, 2) + '\n');
+    console.log(`✓ Results written to ${path.relative(process.cwd(), out)}`
+        + (baseline ? ` (compared with ${baseline.commit})` : ''));
+}
+
+if (require.main === module) {
+    main().catch(error => {
+        console.error(error);
+        process.exit(1);
+    });
+}
+
+module.exports = { run, pageScripts, createPageContext };
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark: sequential vs concurrent source fetching in generate_geo_data.py.
+
+Serves stand-ins for the three remote sources from a local fixture server with
+injected latency and times generate_geo_json() with 1 and 3 workers. Each run
+uses an empty HTTP cache so every source really goes over the wire.
+
+Usage:
+    python benchmarks/bench_geo_fetch.py [--latency 0.5] [--runs 3]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+GEO_DIR = REPO_ROOT / "geotriad-game" / "data"
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(GEO_DIR))
+
+import generate_geo_data as gen  # noqa: E402
+from fixture_server import FixtureServer  # noqa: E402
+from http_cache import HttpCache  # noqa: E402
+
+
+def write_fixtures(root: Path):
+    """Recreate the three remote sources from the committed datasets."""
+    geo = json.loads((GEO_DIR / "geo.json").read_text(encoding="utf-8"))
+    continents = json.loads((GEO_DIR / "continents.json").read_text(encoding="utf-8"))
+    fixtures = {
+        gen.COUNTRIES_JSON_URL: [
+            {"alpha2": c["id"], "name": c["country_en"], "capital": c["capital_en"],
+             "region": c["region_en"], "flag": c["flag"]} for c in geo
+        ],
+        gen.GERMAN_COUNTRIES_URL: [
+            {"alpha2": c["id"], "name": c["country_de"], "capital": c["capital_de"]} for c in geo
+        ],
+        gen.CONTINENT_MAPPING_URL: continents,
+    }
+    for url, data in fixtures.items():
+        path = root / url.split("://", 1)[1]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def time_run(server_url: str, workers: int) -> float:
+    """Time one generator run against an empty cache."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        gen.http_cache = HttpCache(cache_dir=Path(cache_dir), mirror=server_url)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = gen.generate_geo_json(workers)
+        elapsed = time.perf_counter() - start
+    assert result, "generator produced no data"
+    return elapsed
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark geo source fetching")
+    parser.add_argument("--latency", type=float, default=0.5,
+                        help="seconds of injected latency per request")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        write_fixtures(Path(workdir) / "fixtures")
+        # Point at a missing continents.json so the continent mapping is fetched too
+        gen.CONTINENTS_PATH = Path(workdir) / "continents.json"
+        with FixtureServer(Path(workdir) / "fixtures", latency=args.latency) as server:
+            results = {}
+            for workers in (1, 3):
+                results[workers] = min(time_run(server.url, workers) for _ in range(args.runs))
+
+    print(f"Injected latency: {args.latency:.2f}s per request, best of {args.runs}")
+    print(f"  sequential (1 worker):  {results[1]:.3f}s")
+    print(f"  concurrent (3 workers): {results[3]:.3f}s")
+    print(f"  speedup: {results[1] / results[3]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
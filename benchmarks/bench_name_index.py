@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark: typed-answer matching through the trigram name index versus
+comparing the answer with every name.
+
+Builds the Pokémon name index (English and German names) over 1x, 10x and
+100x copies of data/pokemon.json (see bench_pokemon_columns.py) and
+reports, for a few misspelled answers, the time to resolve the finished
+answer by scan and by index, and the mean suggest() time per keystroke.
+
+Usage:
+    python benchmarks/bench_name_index.py [--repeat 20]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from bench_pokemon_columns import SCALES, scaled_records  # noqa: E402
+from build_artifacts import pokemon_name_index  # noqa: E402
+from name_index import NameIndex, edit_distance, fold, typo_tolerance  # noqa: E402
+from pokemon_index import DATA_PATH  # noqa: E402
+
+ANSWERS = ["pikatchu", "Glurack", "bisasam", "Shiggy", "relaxxo", "Mewto"]
+
+
+def scan_match(data, text):
+    """Targets of the closest keys, by edit distance against every name."""
+    key = fold(text)
+    limit = typo_tolerance(key)
+    best, targets = limit, []
+    for candidate, target in zip(data["keys"], data["targets"]):
+        distance = edit_distance(key, candidate, limit)
+        if distance < best:
+            best, targets = distance, []
+        if distance == best and target not in targets:
+            targets.append(target)
+    return targets
+
+
+def time_per_call(function, repeat):
+    """Mean wall time of function() in microseconds."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the typed-answer name index")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with open(DATA_PATH, "r", encoding="utf-8") as f:
+        base = json.load(f)
+
+    print(f"{'names':>7}  {'scan match':>11} {'index match':>12}  speedup  {'suggest/key':>11}")
+    for scale in SCALES:
+        index = NameIndex(pokemon_name_index(scaled_records(base, scale)))
+        data = index.index["name"]
+
+        def scan_all():
+            return [scan_match(data, answer) for answer in ANSWERS]
+
+        def index_all():
+            return [index.match("name", answer) for answer in ANSWERS]
+
+        def keystrokes():
+            for answer in ANSWERS:
+                for end in range(1, len(answer) + 1):
+                    index.suggest("name", answer[:end])
+
+        assert [sorted(t) for t in scan_all()] == [sorted(t) for t in index_all()]
+        strokes = sum(len(answer) for answer in ANSWERS)
+        scan_us = time_per_call(scan_all, args.repeat) / len(ANSWERS)
+        index_us = time_per_call(index_all, args.repeat) / len(ANSWERS)
+        suggest_us = time_per_call(keystrokes, args.repeat) / strokes
+        print(f"{len(data['keys']):>7,}  {scan_us:>9.0f}µs {index_us:>10.0f}µs  {scan_us / index_us:>6.1f}x  "
+              f"{suggest_us:>9.0f}µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark: json.load of pokemon.json versus the mmap'd columnar export.
+
+Builds 1x, 10x and 100x copies of the dataset (extra copies get new ids and
+names), then times opening each format and two typical batch queries:
+
+    filter     names of Water types heavier than 50 kg
+    aggregate  mean weight
+
+Usage:
+    python benchmarks/bench_pokemon_columns.py [--runs 5]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from pokemon_columns import DATA_PATH, PokemonColumns, encode_columns  # noqa: E402
+
+SCALES = [1, 10, 100]
+
+
+def scaled_records(records, scale):
+    """records repeated scale times with unique ids and names."""
+    result = []
+    for copy in range(scale):
+        for record in records:
+            if copy:
+                record = {**record, "id": record["id"] + copy * len(records),
+                          "name": f"{record['name']} {copy}", "germanName": f"{record['germanName']} {copy}"}
+            result.append(record)
+    return result
+
+
+def json_queries(path):
+    with open(path, "r", encoding="utf-8") as f:
+        records = json.load(f)
+    heavy_water = [r["name"] for r in records if "Water" in r["type"] and r["weightHg"] > 500]
+    mean_weight = sum(r["weightHg"] for r in records) / len(records)
+    return len(heavy_water), mean_weight
+
+
+def column_queries(path):
+    with PokemonColumns(path) as pokemon:
+        weights = pokemon.column("weightHg")
+        heavy_water = [pokemon.value("name", row) for row in pokemon.rows_where("type", "Water")
+                       if weights[row] > 500]
+        mean_weight = sum(weights) / len(pokemon)
+    return len(heavy_water), mean_weight
+
+
+def json_open(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return len(json.load(f))
+
+
+def column_open(path):
+    with PokemonColumns(path) as pokemon:
+        return len(pokemon)
+
+
+def best_of(runs, function, path):
+    """Best wall time in ms and the last result."""
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = function(path)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the columnar Pokémon export")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with open(DATA_PATH, "r", encoding="utf-8") as f:
+        records = json.load(f)
+
+    print(f"{'rows':>7} {'json':>10} {'cols':>9}  {'open json':>10} {'open cols':>10}  "
+          f"{'query json':>11} {'query cols':>11}  speedup")
+    with tempfile.TemporaryDirectory() as workdir:
+        for scale in SCALES:
+            data = scaled_records(records, scale)
+            json_path = Path(workdir) / f"pokemon-{scale}.json"
+            cols_path = Path(workdir) / f"pokemon-{scale}.cols"
+            json_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+            cols_path.write_bytes(encode_columns(data))
+
+            open_json, _ = best_of(args.runs, json_open, json_path)
+            open_cols, _ = best_of(args.runs, column_open, cols_path)
+            query_json, expected = best_of(args.runs, json_queries, json_path)
+            query_cols, result = best_of(args.runs, column_queries, cols_path)
+            assert result == expected, (result, expected)
+
+            print(f"{len(data):>7,} {json_path.stat().st_size:>10,} {cols_path.stat().st_size:>9,}  "
+                  f"{open_json:>8.2f}ms {open_cols:>8.3f}ms  {query_json:>9.2f}ms {query_cols:>9.2f}ms  "
+                  f"{query_json / query_cols:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
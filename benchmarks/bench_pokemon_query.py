@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark: compound Pokémon queries through PokemonIndex versus linear scans.
+
+Runs a few typical filtered-mode queries over 1x, 10x and 100x copies of
+data/pokemon.json (see bench_pokemon_columns.py) and reports the mean time
+per query for a list-comprehension scan and for the index.
+
+Usage:
+    python benchmarks/bench_pokemon_query.py [--repeat 200]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from bench_pokemon_columns import SCALES, scaled_records  # noqa: E402
+from pokemon_index import DATA_PATH, PokemonIndex  # noqa: E402
+
+# name: (linear scan, indexed query); both return matching rows
+QUERIES = {
+    "Water from Johto": (
+        lambda records, index: [row for row, r in enumerate(records)
+                                if "Water" in r["type"] and r["region"] == "Johto"],
+        lambda records, index: index.where(type="Water", region="Johto"),
+    ),
+    "Fire or Dragon, mountain": (
+        lambda records, index: [row for row, r in enumerate(records)
+                                if ("Fire" in r["type"] or "Dragon" in r["type"]) and r["habitat"] == "mountain"],
+        lambda records, index: index.where(type=["Fire", "Dragon"], habitat="mountain"),
+    ),
+    "Rock, >= 100 kg": (
+        lambda records, index: [row for row, r in enumerate(records)
+                                if "Rock" in r["type"] and r["weightHg"] >= 1000],
+        lambda records, index: sorted(set(index.where(type="Rock")) & set(index.between("weightHg", 1000))),
+    ),
+}
+
+
+def time_per_call(function, repeat):
+    """Mean wall time of function() in microseconds."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark PokemonIndex queries")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    with open(DATA_PATH, "r", encoding="utf-8") as f:
+        base = json.load(f)
+
+    print(f"{'rows':>7}  {'query':<26} {'matches':>7} {'scan':>10} {'index':>10}  speedup")
+    for scale in SCALES:
+        records = scaled_records(base, scale)
+        start = time.perf_counter()
+        index = PokemonIndex(records)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        for name, (scan, indexed) in QUERIES.items():
+            expected = scan(records, index)
+            assert sorted(indexed(records, index)) == expected, name
+            scan_us = time_per_call(lambda: scan(records, index), args.repeat)
+            index_us = time_per_call(lambda: indexed(records, index), args.repeat)
+            print(f"{len(records):>7,}  {name:<26} {len(expected):>7,} {scan_us:>8.1f}µs "
+                  f"{index_us:>8.1f}µs  {scan_us / index_us:>6.1f}x")
+
+        print(f"{'':>7}  (index built in {build_ms:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
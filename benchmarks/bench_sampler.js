@@ -0,0 +1,63 @@
+// Micro-benchmark: per-question selection cost of the old filter-based
+// selectRandomPokemon()/generateDecoys() versus js/sampler.js.
+//
+// Usage: node benchmarks/bench_sampler.js [questions]
+
+const { createSampler } = require('../js/sampler.js');
+
+const QUESTIONS = parseInt(process.argv[2], 10) || 20000;
+const SIZES = [251, 1000, 10000];
+const RECENT_LIMIT = 10;
+
+// The original implementation, kept here as the baseline
+function legacyQuestion(pokemonData, recentPokemon) {
+    const availablePokemon = pokemonData.filter(p => !recentPokemon.includes(p.id));
+    const pool = availablePokemon.length > 0 ? availablePokemon : pokemonData;
+    const pokemon = pool[Math.floor(Math.random() * pool.length)];
+    recentPokemon.push(pokemon.id);
+    if (recentPokemon.length > RECENT_LIMIT) {
+        recentPokemon.shift();
+    }
+
+    const decoys = [];
+    const available = pokemonData.filter(p => p.id !== pokemon.id);
+    while (decoys.length < 2 && available.length > 0) {
+        const index = Math.floor(Math.random() * available.length);
+        decoys.push(available[index]);
+        available.splice(index, 1);
+    }
+    return decoys.length;
+}
+
+function samplerQuestion(sampler) {
+    const pokemon = sampler.draw();
+    return sampler.sample(2, [pokemon.id]).length;
+}
+
+function time(fn) {
+    // Warm up the JIT before measuring
+    for (let i = 0; i < 1000; i++) fn();
+    const start = process.hrtime.bigint();
+    for (let i = 0; i < QUESTIONS; i++) fn();
+    return Number(process.hrtime.bigint() - start) / QUESTIONS;
+}
+
+function run(size) {
+    const pokemonData = Array.from({ length: size }, (_, i) => ({ id: i + 1, name: `Pokemon ${i + 1}` }));
+    const recentPokemon = [];
+    const sampler = createSampler(pokemonData, { recentLimit: RECENT_LIMIT, keyOf: p => p.id });
+    return {
+        legacy: time(() => legacyQuestion(pokemonData, recentPokemon)),
+        fast: time(() => samplerQuestion(sampler))
+    };
+}
+
+// One untimed pass over every size so both paths are fully optimized
+SIZES.forEach(run);
+
+console.log(`${QUESTIONS} questions per run, recency window ${RECENT_LIMIT}`);
+console.log(`${'entries'.padStart(8)} ${'legacy ns/q'.padStart(12)} ${'sampler ns/q'.padStart(13)} ${'speedup'.padStart(8)}`);
+for (const size of SIZES) {
+    const { legacy, fast } = run(size);
+    console.log(`${String(size).padStart(8)} ${legacy.toFixed(0).padStart(12)} ${fast.toFixed(0).padStart(13)} ${(legacy / fast).toFixed(1).padStart(7)}x`);
+}
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark: static_server.py serving every precached file of a site.
+
+Loads the URLs listed in a site's precache-manifest.js (dist/ from
+build_site.py by default, or the repository) over keep-alive connections
+from several client threads, and reports per scenario requests per second,
+p50/p99 latency and bytes on the wire:
+
+    identity      no Accept-Encoding
+    gzip / br     precompressed siblings negotiated
+    no hot cache  br with the in-memory cache disabled (every body from disk)
+    revalidate    br with If-None-Match for every URL (all 304)
+
+Usage:
+    python benchmarks/bench_static_server.py [DIRECTORY] [--rounds 20] [--clients 8]
+"""
+
+import argparse
+import http.client
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from static_server import StaticServer  # noqa: E402
+
+DIST_DIR = REPO_ROOT / "dist"
+
+
+def precache_urls(directory: Path):
+    """URLs from a site's precache-manifest.js."""
+    script = (directory / "precache-manifest.js").read_text(encoding="utf-8")
+    manifest = json.loads(script[script.index("{"):script.rindex("}") + 1])
+    return ["/" + url for url in manifest["urls"]]
+
+
+def client(port, urls, rounds, encoding, etags):
+    """One keep-alive client fetching urls rounds times. Returns (latencies, bytes)."""
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    latencies = []
+    received = 0
+    for _ in range(rounds):
+        for url in urls:
+            headers = {"Accept-Encoding": encoding} if encoding else {}
+            if etags:
+                headers["If-None-Match"] = etags[url]
+            start = time.perf_counter()
+            connection.request("GET", url, headers=headers)
+            response = connection.getresponse()
+            body = response.read()
+            latencies.append(time.perf_counter() - start)
+            received += len(body)
+            assert response.status == (304 if etags else 200), (url, response.status)
+    connection.close()
+    return latencies, received
+
+
+def run(directory, urls, args, encoding, cache_bytes=None, revalidate=False):
+    """One scenario. Returns (requests/s, p50 ms, p99 ms, bytes per round)."""
+    options = {} if cache_bytes is None else {"cache_bytes": cache_bytes}
+    with StaticServer(directory, **options) as server:
+        etags = None
+        if revalidate:
+            etags = {}
+            for url in urls:
+                connection = http.client.HTTPConnection("127.0.0.1", server.port)
+                connection.request("GET", url, headers={"Accept-Encoding": encoding})
+                response = connection.getresponse()
+                response.read()
+                etags[url] = response.getheader("ETag")
+                connection.close()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(args.clients) as pool:
+            results = list(pool.map(lambda _: client(server.port, urls, args.rounds, encoding, etags),
+                                    range(args.clients)))
+        elapsed = time.perf_counter() - start
+    latencies = sorted(latency for result, _ in results for latency in result)
+    received = sum(size for _, size in results)
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+    return len(latencies) / elapsed, p50, p99, received // (args.clients * args.rounds)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark static_server.py")
+    parser.add_argument("directory", type=Path, nargs="?", default=DIST_DIR if DIST_DIR.exists() else REPO_ROOT)
+    parser.add_argument("--rounds", type=int, default=20, help="times each client fetches every URL")
+    parser.add_argument("--clients", type=int, default=8)
+    args = parser.parse_args()
+
+    urls = precache_urls(args.directory)
+    print(f"{len(urls)} URLs from {args.directory}, {args.clients} clients x {args.rounds} rounds\n")
+    print(f"{'scenario':<14} {'req/s':>9} {'p50':>9} {'p99':>9} {'bytes/round':>12}")
+    scenarios = [
+        ("identity", {"encoding": None}),
+        ("gzip", {"encoding": "gzip"}),
+        ("br", {"encoding": "br, gzip"}),
+        ("no hot cache", {"encoding": "br, gzip", "cache_bytes": 0}),
+        ("revalidate", {"encoding": "br, gzip", "revalidate": True}),
+    ]
+    for name, options in scenarios:
+        rate, p50, p99, size = run(args.directory, urls, args, **options)
+        print(f"{name:<14} {rate:>9,.0f} {p50:>7.2f}ms {p99:>7.2f}ms {size:>12,}")
+
+
+if __name__ == "__main__":
+    main()
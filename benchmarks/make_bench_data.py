@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Synthetic game data for the end-to-end benchmarks (bench_games.js).
+
+Scales data/pokemon.json and geotriad-game/data/geo.json to 1x, 10x and 100x
+(copies with unique ids and names, see bench_pokemon_columns.py) and runs
+the build_artifacts.py projections on them, so each scale gets the files the
+pages actually download, laid out as in the repository:
+
+    .cache/bench/<scale>x/data/pokemon/manifest.json, shards, attachments
+    .cache/bench/<scale>x/geotriad-game/data/geo.core.json, geo.<lang>.json, ...
+
+The hard-mode decoy table is left out (its pairwise scoring is quadratic and
+the benchmark plays without hard mode), as are the .br siblings.
+
+Usage:
+    python benchmarks/make_bench_data.py [--scales 1 10 100]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+import build_artifacts  # noqa: E402
+from bench_pokemon_columns import SCALES, scaled_records  # noqa: E402
+
+BENCH_DIR = REPO_ROOT / ".cache" / "bench"
+OUTPUT_KEYS = ["output", "locale_output", "attachment_output"]
+
+
+def scaled_countries(countries, scale):
+    """countries repeated scale times with unique ids and names."""
+    result = []
+    for copy in range(scale):
+        for country in countries:
+            if copy:
+                country = {
+                    **country,
+                    "id": f"{country['id']}{copy}",
+                    **{key: f"{value} {copy}" for key, value in country.items()
+                       if key.startswith(("country_", "capital_")) and value},
+                }
+            result.append(country)
+    return result
+
+
+def bench_projection(projection, site: Path, source: Path):
+    """projection rebased onto a benchmark site, reading source."""
+    rebased = {key: value for key, value in projection.items() if key != "artwork"}
+    rebased["source"] = source
+    for key in OUTPUT_KEYS:
+        if key in rebased:
+            rebased[key] = site / Path(str(rebased[key])).relative_to(REPO_ROOT)
+    rebased["attachments"] = {key: builder for key, builder in projection.get("attachments", {}).items()
+                              if key != "decoys"}
+    return rebased
+
+
+def build_site(scale: int, pokemon, countries) -> Path:
+    """Write one scale's sources and artifacts. Returns the site directory."""
+    site = BENCH_DIR / f"{scale}x"
+    sources = {
+        "pokemon-game": (site / "pokemon.json", scaled_records(pokemon, scale)),
+        "geotriad": (site / "geo.json", scaled_countries(countries, scale)),
+    }
+    projections = []
+    for projection in build_artifacts.PROJECTIONS:
+        path, records = sources[projection["name"]]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(records, ensure_ascii=False), encoding="utf-8")
+        rebased = bench_projection(projection, site, path)
+        Path(str(rebased["output"])).parent.mkdir(parents=True, exist_ok=True)
+        if "shard_by" in rebased:
+            rebased["output"].mkdir(parents=True, exist_ok=True)
+        projections.append(rebased)
+    with contextlib.redirect_stdout(io.StringIO()):
+        build_artifacts.build_projections(projections)
+    return site
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Write scaled game data for bench_games.js")
+    parser.add_argument("--scales", type=int, nargs="+", default=SCALES)
+    args = parser.parse_args()
+
+    # .br siblings are irrelevant here and slow at 100x
+    build_artifacts.brotli = None
+    pokemon = json.loads((REPO_ROOT / "data" / "pokemon.json").read_text(encoding="utf-8"))
+    countries = json.loads((REPO_ROOT / "geotriad-game" / "data" / "geo.json").read_text(encoding="utf-8"))
+    for scale in args.scales:
+        start = time.perf_counter()
+        site = build_site(scale, pokemon, countries)
+        print(f"✓ {scale}x: {len(pokemon) * scale:,} Pokémon, {len(countries) * scale:,} countries "
+              f"in {site.relative_to(REPO_ROOT)} ({time.perf_counter() - start:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Game Data Artifacts
+Emits the compact files the games actually download.
+
+For each game a projection keeps only the fields its page reads, serialized
+as minified JSON, plus precompressed .gz and .br siblings for static hosts.
+Projections with "shard_by" are split into content-hashed shards (e.g. one
+per region) described by a small manifest.json, so a game can start on the
+first shard while the rest stream in; "attachments" add further
+content-hashed files built from the full source records to the manifest
+(the attribute index from pokemon_index.py, the hard-mode decoy table from
+pokemon_decoys.py, the typed-answer name index from name_index.py, the medal
+table from medals.py); other projections write them to "attachment_output"
+(e.g. geo.names.json).
+Projections with "index" are wrapped
+as {"<records>": [...], "index": {...}} with lookup tables prebuilt here
+instead of in the browser. Projections with "locales" are split into a
+language-neutral core file and one small string file per locale (e.g.
+geo.de.json), so a page downloads only the languages it shows; strings
+missing from a locale fall back to English here. When build_artwork.py has produced
+data/artwork-manifest.json, the Pokémon projection points imageUrl at the
+local mirror and adds a WebP imageSrcset. A size report compares every
+artifact with its pretty-printed source.
+
+The source datasets are checked with validate_data.py first; the build
+stops if any rule reports an error.
+
+Finally precache-manifest.js lists the pages and data files the service
+worker (sw.js) caches on install, under a version derived from their
+content hashes, so any rebuilt artifact or edited page rolls the cache.
+
+Usage:
+    python build_artifacts.py
+"""
+
+import gzip
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from build_utils import REPO_ROOT, dump_min_json, sha256_hex, write_if_changed
+from medals import compile_medals
+from name_index import build_name_index
+from pokemon_decoys import neighbor_table
+from pokemon_index import PokemonIndex
+from validate_data import validate
+
+try:
+    import brotli
+except ImportError:  # optional: only needed for the .br siblings
+    brotli = None
+
+# Fields read by each game page; everything else stays in the source dataset
+PROJECTIONS = [
+    {
+        "name": "pokemon-game",
+        "source": REPO_ROOT / "data" / "pokemon.json",
+        "output": REPO_ROOT / "data" / "pokemon",
+        "fields": ["id", "name", "germanName", "region", "imageUrl"],
+        "shard_by": "region",
+        "attachments": {"index": "pokemon_query_index", "decoys": "pokemon_decoy_table",
+                        "names": "pokemon_name_index", "medals": "pokemon_medals"},
+        "artwork": REPO_ROOT / "data" / "artwork-manifest.json",
+    },
+    {
+        "name": "geotriad",
+        "source": REPO_ROOT / "geotriad-game" / "data" / "geo.json",
+        "output": REPO_ROOT / "geotriad-game" / "data" / "geo.core.json",
+        "fields": ["id", "continent", "flag", "tags"],
+        "locales": "geo_locales",
+        "locale_output": REPO_ROOT / "geotriad-game" / "data" / "geo.{lang}.json",
+        "index": "geo_option_index",
+        "attachments": {"names": "geo_name_index", "medals": "geo_medals"},
+        "attachment_output": REPO_ROOT / "geotriad-game" / "data" / "geo.{key}.json",
+    },
+]
+
+
+def project(records: List[Dict], fields: List[str]) -> List[Dict]:
+    """Keep only the given fields, dropping empty lists (e.g. "tags": [])."""
+    return [
+        {field: record[field] for field in fields if field in record and record[field] != []}
+        for record in records
+    ]
+
+
+# Files precached by sw.js (globs relative to the repository root)
+PRECACHE_GLOBS = [
+    "pokemon-game.html",
+    "add-subtract.html",
+    "add-subtract-mission.html",
+    "geotriad-game/index.html",
+    "geotriad-game/data/geo.core.json",
+    # Only the languages the page offers; other locales load on demand
+    "geotriad-game/data/geo.en.json",
+    "geotriad-game/data/geo.de.json",
+    "geotriad-game/data/geo.names.json",
+    "geotriad-game/data/geo.medals.json",
+    "data/pokemon/*.json",
+    "js/*.js",
+]
+# Matched above but loaded by no page (pokemon_index.py's browser build)
+PRECACHE_EXCLUDE = ["js/pokemon-index.js", "data/pokemon/index.*.json"]
+# Directory URLs that serve an index.html, precached alongside it
+PRECACHE_INDEX_URLS = ["geotriad-game/"]
+PRECACHE_MANIFEST_PATH = REPO_ROOT / "precache-manifest.js"
+
+
+# Per-row strings moved from the GeoTriad core file into the locale files
+GEO_LOCALIZED_FIELDS = ["country", "capital"]
+
+
+def continent_key(name: str) -> str:
+    """Language-neutral continent key, e.g. "North America" -> "north-america"."""
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def geo_locales(countries: List[Dict]):
+    """Split geo.json columns by language. Returns (core records, {lang: strings}).
+
+    Every locale found in the data (country_<lang> columns) gets
+    {"continents": {key: name}, "country": [...], "capital": [...]}, with the
+    lists in core row order.
+    """
+    langs = sorted({key.split("_", 1)[1] for country in countries
+                    for key in country if key.startswith("country_")})
+    core = [{**country, "continent": continent_key(country["continent_en"])} for country in countries]
+    locales = {}
+    for lang in langs:
+        strings = {"continents": {}, **{field: [] for field in GEO_LOCALIZED_FIELDS}}
+        for country in countries:
+            strings["continents"].setdefault(
+                continent_key(country["continent_en"]),
+                country.get(f"continent_{lang}") or country["continent_en"],
+            )
+            for field in GEO_LOCALIZED_FIELDS:
+                strings[field].append(country.get(f"{field}_{lang}") or country[f"{field}_en"])
+        strings["continents"] = dict(sorted(strings["continents"].items()))
+        locales[lang] = strings
+    return core, locales
+
+
+def geo_option_index(countries: List[Dict]) -> Dict:
+    """Option lookups for GeoTriad; country references are row numbers."""
+    by_continent: Dict[str, List[int]] = {}
+    for row, country in enumerate(countries):
+        by_continent.setdefault(country["continent"], []).append(row)
+    return {
+        "continents": sorted(by_continent),
+        "byContinent": dict(sorted(by_continent.items())),
+    }
+
+
+def pokemon_name_index(records: List[Dict]) -> Dict:
+    """Typed-answer index: English and German names, targets are Pokémon ids."""
+    return build_name_index({
+        "name": [(record["id"], record.get(field)) for record in records for field in ("name", "germanName")],
+    })
+
+
+def geo_name_index(countries: List[Dict]) -> Dict:
+    """Typed-answer index for countries and capitals in every language; targets are rows."""
+    langs = sorted({key.split("_", 1)[1] for country in countries
+                    for key in country if key.startswith("country_")})
+    return build_name_index({
+        field: [(row, country.get(f"{field}_{lang}")) for row, country in enumerate(countries) for lang in langs]
+        for field in GEO_LOCALIZED_FIELDS
+    })
+
+
+# Builders referenced by name from PROJECTIONS
+INDEX_BUILDERS = {
+    "geo_option_index": ("countries", geo_option_index),
+}
+LOCALE_BUILDERS = {
+    "geo_locales": geo_locales,
+}
+# Attachment builders return None when they cannot run here (e.g. no NumPy)
+ATTACHMENT_BUILDERS = {
+    "pokemon_query_index": lambda records: PokemonIndex(records).browser_index(),
+    "pokemon_decoy_table": neighbor_table,
+    "pokemon_name_index": pokemon_name_index,
+    "geo_name_index": geo_name_index,
+    "pokemon_medals": lambda records: compile_medals("pokemon", records),
+    "geo_medals": lambda countries: compile_medals("geo", countries),
+}
+
+
+def apply_artwork(records: List[Dict], manifest_path: Path) -> int:
+    """Point records at mirrored artwork, if build_artwork.py has run. Returns matches."""
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return 0
+    matched = 0
+    for record in records:
+        entry = manifest.get(str(record["id"]))
+        if entry:
+            record["imageUrl"] = entry["src"]
+            record["imageSrcset"] = entry["srcset"]["webp"]
+            matched += 1
+    return matched
+
+
+def emit(path: Path, data: bytes) -> Dict[str, int]:
+    """Write data and its precompressed siblings. Returns sizes by encoding."""
+    sizes = {"raw": len(data)}
+    changed = write_if_changed(path, data)
+
+    gz_path = path.with_name(path.name + ".gz")
+    if changed or not gz_path.exists():
+        write_if_changed(gz_path, gzip.compress(data, compresslevel=9, mtime=0))
+    sizes["gzip"] = gz_path.stat().st_size
+
+    if brotli is not None:
+        br_path = path.with_name(path.name + ".br")
+        if changed or not br_path.exists():
+            write_if_changed(br_path, brotli.compress(data, quality=11))
+        sizes["br"] = br_path.stat().st_size
+    return sizes
+
+
+def shard_filename(key: str, data: bytes) -> str:
+    """Content-hashed shard name, e.g. "kanto.1a2b3c4d.json"."""
+    slug = re.sub(r"[^a-z0-9]+", "-", key.lower()).strip("-")
+    return f"{slug}.{sha256_hex(data)[:8]}.json"
+
+
+def emit_shards(projection: Dict, records: List[Dict],
+                attachments: Optional[Dict[str, Optional[Dict]]] = None) -> List[Dict]:
+    """Split records by projection["shard_by"] and write shards plus manifest.
+
+    attachments maps manifest keys to payloads; a None payload keeps the
+    file the previous manifest listed under that key, if it still exists.
+    """
+    out_dir = projection["output"]
+    manifest_path = out_dir / "manifest.json"
+    previous = {}
+    if manifest_path.exists():
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            previous = json.load(f)
+    key_field = projection["shard_by"]
+    groups: Dict[str, List[Dict]] = {}
+    for record in records:
+        groups.setdefault(record[key_field], []).append(record)
+
+    rows = []
+    shards = []
+    for key, group in groups.items():
+        data = dump_min_json(group)
+        filename = shard_filename(key, data)
+        sizes = emit(out_dir / filename, data)
+        shards.append({key_field: key, "file": filename, "count": len(group), "bytes": len(data)})
+        rows.append({"artifact": str((out_dir / filename).relative_to(REPO_ROOT)), **sizes})
+
+    # Shards are listed in dataset order, so the first one is the one to load first
+    manifest = {"total": len(records), "shards": shards}
+    for key, payload in (attachments or {}).items():
+        if payload is None:
+            kept = previous.get(key)
+            if kept and (out_dir / kept["file"]).exists():
+                manifest[key] = kept
+            print(f"✗ Could not rebuild the {key} attachment (is NumPy installed?); "
+                  f"{'keeping ' + kept['file'] if key in manifest else 'leaving it out'}")
+            continue
+        data = dump_min_json(payload)
+        filename = shard_filename(key, data)
+        manifest[key] = {"file": filename, "bytes": len(data)}
+        rows.append({"artifact": str((out_dir / filename).relative_to(REPO_ROOT)),
+                     **emit(out_dir / filename, data)})
+    rows.append({"artifact": str(manifest_path.relative_to(REPO_ROOT)),
+                 **emit(manifest_path, dump_min_json(manifest))})
+
+    # Remove shards from earlier builds that no manifest refers to any more
+    keep = {shard["file"] for shard in shards} | {"manifest.json"}
+    keep.update(manifest[key]["file"] for key in attachments or {} if key in manifest)
+    for path in out_dir.iterdir():
+        if path.name.split(".json", 1)[0] + ".json" not in keep:
+            path.unlink()
+    return rows
+
+
+def attachment_path(projection: Dict, key: str) -> Path:
+    """Output path of an attachment of an unsharded projection."""
+    pattern = Path(str(projection["attachment_output"]))
+    return pattern.with_name(pattern.name.format(key=key))
+
+
+def emit_locales(projection: Dict, locales: Dict[str, Dict]) -> List[Dict]:
+    """Write one string file per locale and drop files of removed locales."""
+    pattern = Path(str(projection["locale_output"]))
+    # Attachments may share the locale file pattern (geo.names.json)
+    keep = {projection["output"].name} | {
+        attachment_path(projection, key).name for key in projection.get("attachments", {})
+    }
+    rows = []
+    for lang, strings in locales.items():
+        path = pattern.with_name(pattern.name.format(lang=lang))
+        keep.add(path.name)
+        rows.append({"artifact": f"  {path.relative_to(REPO_ROOT)}",
+                     **emit(path, dump_min_json(strings))})
+    for path in pattern.parent.glob(pattern.name.format(lang="*") + "*"):
+        if path.name.split(".json", 1)[0] + ".json" not in keep:
+            path.unlink()
+    return rows
+
+
+def print_report(rows: List[Dict]):
+    """Print the size report table."""
+    print(f"\n{'artifact':<40} {'source':>9} {'min':>9} {'gzip':>9} {'br':>9}  saved")
+    for row in rows:
+        br = f"{row['br']:>9,}" if "br" in row else f"{'-':>9}"
+        source = f"{row['source']:>9,}" if "source" in row else f"{'':>9}"
+        saved = ""
+        if "source" in row:
+            saved = f"{1 - min(row.get('br', row['gzip']), row['gzip']) / row['source']:.0%}"
+        print(f"{row['artifact']:<40} {source} {row['raw']:>9,} "
+              f"{row['gzip']:>9,} {br}  {saved}")
+    if brotli is None:
+        print("\n(install the 'brotli' package to also emit .br files)")
+
+
+def build_projections(projections: List[Dict] = PROJECTIONS) -> List[Dict]:
+    """Build every per-game projection. Returns report rows."""
+    rows = []
+    for projection in projections:
+        source_bytes = projection["source"].read_bytes()
+        records = json.loads(source_bytes)
+        attachments = {
+            key: ATTACHMENT_BUILDERS[builder](records)
+            for key, builder in projection.get("attachments", {}).items()
+        }
+        locales = {}
+        if "locales" in projection:
+            records, locales = LOCALE_BUILDERS[projection["locales"]](records)
+        records = project(records, projection["fields"])
+        if "artwork" in projection:
+            matched = apply_artwork(records, projection["artwork"])
+            if matched:
+                print(f"✓ Using mirrored artwork for {matched}/{len(records)} records")
+        if "shard_by" in projection:
+            shard_rows = emit_shards(projection, records, attachments)
+            total = {encoding: sum(row.get(encoding, 0) for row in shard_rows)
+                     for encoding in shard_rows[0] if encoding != "artifact"}
+            rows.extend(shard_rows)
+            rows.append({"artifact": f"  {projection['name']} (all shards)",
+                         "source": len(source_bytes), **total})
+            continue
+        if "index" in projection:
+            key, builder = INDEX_BUILDERS[projection["index"]]
+            payload = {key: records, "index": builder(records)}
+        else:
+            payload = records
+        sizes = emit(projection["output"], dump_min_json(payload))
+        rows.append({
+            "artifact": str(projection["output"].relative_to(REPO_ROOT)),
+            "source": len(source_bytes),
+            **sizes,
+        })
+        for key, attachment in attachments.items():
+            path = attachment_path(projection, key)
+            if attachment is not None:
+                rows.append({"artifact": f"  {path.relative_to(REPO_ROOT)}",
+                             **emit(path, dump_min_json(attachment))})
+        if locales:
+            rows.extend(emit_locales(projection, locales))
+    return rows
+
+
+def precache_manifest(files: List[Tuple[str, bytes]], index_urls: List[str]) -> Dict:
+    """Manifest for sw.js: the urls, versioned by their content hashes."""
+    fingerprint = "\n".join(f"{url} {sha256_hex(data)}" for url, data in files)
+    version = sha256_hex(fingerprint.encode("utf-8"))[:12]
+    return {"version": version, "urls": [url for url, _ in files] + index_urls}
+
+
+def precache_script(manifest: Dict, generator: str = "build_artifacts.py") -> bytes:
+    """precache-manifest.js source for a manifest."""
+    return (
+        f"// Generated by {generator} - do not edit.\n"
+        f"self.PRECACHE = {json.dumps(manifest, indent=2)};\n"
+    ).encode("utf-8")
+
+
+def precache_paths(patterns: List[str] = PRECACHE_GLOBS) -> List[Path]:
+    """Files matching patterns, minus PRECACHE_EXCLUDE."""
+    excluded = {path for pattern in PRECACHE_EXCLUDE for path in REPO_ROOT.glob(pattern)}
+    return sorted({path for pattern in patterns for path in REPO_ROOT.glob(pattern)} - excluded)
+
+
+def build_precache_manifest() -> str:
+    """Write precache-manifest.js for sw.js. Returns the cache version."""
+    files = [(path.relative_to(REPO_ROOT).as_posix(), path.read_bytes()) for path in precache_paths()]
+    manifest = precache_manifest(files, PRECACHE_INDEX_URLS)
+    if write_if_changed(PRECACHE_MANIFEST_PATH, precache_script(manifest)):
+        print(f"✓ Service worker precache version {manifest['version']} ({len(manifest['urls'])} files)")
+    return manifest["version"]
+
+
+def main():
+    """Main entry point."""
+    # Artifact rules are skipped: they compare against the files rebuilt below
+    if not validate(["pokemon", "geo"], verbose=False):
+        raise SystemExit(1)
+    rows = build_projections()
+    print_report(rows)
+    build_precache_manifest()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Pokémon Artwork Mirror
+Downloads (or ingests from a local directory) the artwork referenced by
+data/pokemon.json once, and writes resized WebP/AVIF variants with
+content-hashed filenames to assets/artwork/.
+
+The result is data/artwork-manifest.json, keyed by Pokémon id:
+
+    {"25": {"src": "assets/artwork/pikachu-320.1a2b3c4d.webp",
+            "srcset": {"webp": "… 160w, … 320w, … 640w", "avif": "…"},
+            "width": 640, "height": 640}}
+
+build_artifacts.py picks the manifest up and points the game projection at
+the local files. Requires Pillow (pip install pillow); AVIF output is
+skipped if this Pillow build has no AVIF support.
+
+Usage:
+    python build_artwork.py [--source-dir DIR] [--offline] [--mirror URL]
+"""
+
+import argparse
+import io
+import json
+import re
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional
+
+from build_utils import REPO_ROOT, sha256_hex, write_if_changed
+from http_cache import HttpCache, add_cache_arguments, cache_from_args
+
+try:
+    from PIL import Image, features
+except ImportError:  # reported in main(); the rest of the build does not need Pillow
+    Image = None
+
+DATA_PATH = REPO_ROOT / "data" / "pokemon.json"
+ARTWORK_DIR = REPO_ROOT / "assets" / "artwork"
+MANIFEST_PATH = REPO_ROOT / "data" / "artwork-manifest.json"
+
+# The game shows artwork at up to 400 CSS pixels; 640w covers 1.6x screens
+WIDTHS = [160, 320, 640]
+DEFAULT_WIDTH = 320
+FORMATS = {
+    "webp": {"format": "WEBP", "quality": 80, "method": 6},
+    "avif": {"format": "AVIF", "quality": 60},
+}
+
+
+def artwork_slug(pokemon: Dict) -> str:
+    """Filesystem-safe slug from the artwork URL, e.g. "mr-mime"."""
+    basename = pokemon["imageUrl"].rsplit("/", 1)[-1].rsplit(".", 1)[0]
+    return re.sub(r"[^a-z0-9]+", "-", basename.lower()).strip("-") or str(pokemon["id"])
+
+
+def read_source(pokemon: Dict, source_dir: Optional[Path], http_cache: HttpCache) -> Optional[bytes]:
+    """Original artwork bytes from the local directory or the (cached) web."""
+    if source_dir:
+        basename = pokemon["imageUrl"].rsplit("/", 1)[-1]
+        candidates = [source_dir / basename] + [
+            source_dir / f"{pokemon['id']}.{ext}" for ext in ("png", "jpg", "webp")
+        ]
+        for path in candidates:
+            if path.is_file():
+                return path.read_bytes()
+        return None
+    try:
+        return http_cache.get(pokemon["imageUrl"], timeout=30)
+    except (urllib.error.URLError, OSError) as e:
+        print(f"✗ Error fetching {pokemon['imageUrl']}: {e}")
+        return None
+
+
+def render_variants(pokemon: Dict, source: bytes, formats) -> Dict:
+    """Resize source into every width/format. Returns the manifest entry."""
+    slug = artwork_slug(pokemon)
+    source_hash = sha256_hex(source)
+    image = None
+    srcset = {}
+    largest = (0, 0)
+
+    for ext in formats:
+        options = FORMATS[ext]
+        entries = []
+        for width in WIDTHS:
+            # Name depends on the source bytes and encoder settings, so an
+            # existing file can be reused without decoding anything
+            digest = sha256_hex(f"{source_hash}:{width}:{options}".encode("utf-8"))[:8]
+            filename = f"{slug}-{width}.{digest}.{ext}"
+            path = ARTWORK_DIR / filename
+            if image is None:
+                # Opening only parses the header; pixels are decoded on first resize
+                image = Image.open(io.BytesIO(source))
+            # Never upscale: small originals simply cap the srcset
+            target_width = min(width, image.width)
+            target_height = round(image.height * target_width / image.width)
+            if not path.exists():
+                if image.mode not in ("RGB", "RGBA"):
+                    image = image.convert("RGBA")
+                resized = image.resize((target_width, target_height), Image.LANCZOS)
+                buffer = io.BytesIO()
+                resized.save(buffer, **options)
+                write_if_changed(path, buffer.getvalue())
+            entries.append(f"{ARTWORK_DIR.relative_to(REPO_ROOT).as_posix()}/{filename} {target_width}w")
+            largest = max(largest, (target_width, target_height))
+            if target_width < width:
+                break
+        srcset[ext] = ", ".join(entries)
+
+    default = next(
+        (entry for entry in srcset["webp"].split(", ") if entry.endswith(f" {DEFAULT_WIDTH}w")),
+        srcset["webp"].split(", ")[-1],
+    )
+    return {
+        "src": default.rsplit(" ", 1)[0],
+        "srcset": srcset,
+        "width": largest[0],
+        "height": largest[1],
+    }
+
+
+def load_manifest() -> Dict:
+    """The manifest written by the previous run, or {}."""
+    try:
+        with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def variant_files(entry: Dict):
+    """File names of every variant a manifest entry refers to."""
+    return [
+        item.split(" ", 1)[0].rsplit("/", 1)[-1]
+        for srcset in entry["srcset"].values()
+        for item in srcset.split(", ")
+    ]
+
+
+def build_artwork(source_dir: Optional[Path], http_cache: HttpCache, workers: int = 8) -> Dict:
+    """Mirror all artwork and return the manifest."""
+    previous = load_manifest()
+    with open(DATA_PATH, "r", encoding="utf-8") as f:
+        pokemon_data = json.load(f)
+
+    formats = ["webp"] + (["avif"] if features.check("avif") else [])
+    if "avif" not in formats:
+        print("✗ Pillow was built without AVIF support, writing WebP only")
+
+    def process(pokemon):
+        source = read_source(pokemon, source_dir, http_cache)
+        if source is None:
+            return pokemon["id"], None
+        return pokemon["id"], render_variants(pokemon, source, formats)
+
+    manifest = {}
+    missing = []
+    kept = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for pokemon_id, entry in pool.map(process, pokemon_data):
+            if entry is None:
+                # A failed download (e.g. a transient 5xx) keeps the variants
+                # mirrored by an earlier run instead of losing the artwork
+                entry = previous.get(str(pokemon_id))
+                if entry and all((ARTWORK_DIR / name).exists() for name in variant_files(entry)):
+                    kept.append(pokemon_id)
+                else:
+                    missing.append(pokemon_id)
+                    continue
+            manifest[str(pokemon_id)] = entry
+
+    # Drop variants no manifest entry refers to any more
+    referenced = {name for entry in manifest.values() for name in variant_files(entry)}
+    for path in ARTWORK_DIR.iterdir():
+        if path.name not in referenced:
+            path.unlink()
+
+    print(f"✓ Mirrored artwork for {len(manifest)} Pokémon into {ARTWORK_DIR.relative_to(REPO_ROOT)}")
+    if kept:
+        print(f"✗ Kept the previous artwork for {len(kept)} Pokémon that failed to download: "
+              f"{', '.join(map(str, kept[:10]))}{' …' if len(kept) > 10 else ''}")
+    if missing:
+        print(f"✗ No artwork for {len(missing)} Pokémon: {', '.join(map(str, missing[:10]))}"
+              f"{' …' if len(missing) > 10 else ''}")
+    return manifest
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Mirror and resize Pokémon artwork")
+    parser.add_argument("--source-dir", type=Path, default=None,
+                        help="ingest originals from this directory instead of downloading")
+    parser.add_argument("--workers", type=int, default=8)
+    add_cache_arguments(parser)
+    args = parser.parse_args()
+
+    if Image is None:
+        print("✗ build_artwork.py needs Pillow: pip install pillow")
+        raise SystemExit(1)
+
+    http_cache = cache_from_args(args)
+    http_cache.verbose = False
+    ARTWORK_DIR.mkdir(parents=True, exist_ok=True)
+    manifest = build_artwork(args.source_dir, http_cache, args.workers)
+    write_if_changed(MANIFEST_PATH, json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8"))
+    print(f"✓ Written {MANIFEST_PATH.relative_to(REPO_ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Pokémon Data Build
+Builds data/pokemon.json from the per-generation modules in pokemon_sources/.
+
+Records are upserted by id, so running the build any number of times gives
+the same file. Every source module and every produced record is hashed; on
+a no-op run nothing is recomputed and the output is only rewritten when its
+bytes change.
+
+Usage:
+    python build_pokemon_data.py [--force]
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from build_utils import REPO_ROOT, sha256_hex, write_if_changed
+from pokemon_sources import discover_sources
+
+DATA_PATH = REPO_ROOT / "data" / "pokemon.json"
+BUILD_CACHE_PATH = REPO_ROOT / ".cache" / "pokemon-build.json"
+
+IMAGE_URL_TEMPLATE = "https://img.pokemondb.net/artwork/large/{slug}.jpg"
+
+
+def record_hash(record: Dict) -> str:
+    """Content hash of a record, independent of key order."""
+    return sha256_hex(json.dumps(record, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+
+
+def serialize(pokemon_data: List[Dict]) -> bytes:
+    """Serialize the dataset exactly as it is committed."""
+    return json.dumps(pokemon_data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def load_build_cache() -> Dict:
+    """Load stage and record hashes from the previous build."""
+    try:
+        with open(BUILD_CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_build_cache(cache: Dict):
+    """Persist stage and record hashes for the next build."""
+    write_if_changed(BUILD_CACHE_PATH, json.dumps(cache, indent=2, sort_keys=True).encode("utf-8"))
+
+
+def source_records(module) -> List[Dict]:
+    """Expand a declarative source module into the fields it owns."""
+    slugs = getattr(module, "IMAGE_SLUGS", {})
+    records = []
+    for pokemon in module.POKEMON:
+        slug = slugs.get(pokemon["id"], pokemon["name"].lower().replace("'", ""))
+        records.append({
+            "id": pokemon["id"],
+            "name": pokemon["name"],
+            "germanName": pokemon["germanName"],
+            "region": module.REGION,
+            "imageUrl": IMAGE_URL_TEMPLATE.format(slug=slug),
+        })
+    return records
+
+
+def load_existing(path: Path) -> Optional[bytes]:
+    """Current output bytes, or None if the file does not exist."""
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def index_by_id(pokemon_data: List[Dict]) -> Dict[int, Dict]:
+    """Index records by id, collapsing duplicates left by older scripts."""
+    by_id = {}
+    duplicates = 0
+    for pokemon in pokemon_data:
+        if pokemon["id"] in by_id:
+            duplicates += 1
+            continue
+        by_id[pokemon["id"]] = pokemon
+    if duplicates:
+        print(f"✗ Dropped {duplicates} duplicate records")
+    return by_id
+
+
+def build(force: bool = False) -> bool:
+    """Run the build. Returns True if data/pokemon.json was rewritten."""
+    sources = discover_sources()
+    stage_hashes = {
+        module.__name__: sha256_hex(Path(module.__file__).read_bytes()) for module in sources
+    }
+    existing_bytes = load_existing(DATA_PATH)
+    output_hash = sha256_hex(existing_bytes) if existing_bytes is not None else None
+
+    cache = {} if force else load_build_cache()
+    output_untouched = output_hash is not None and cache.get("output") == output_hash
+    if output_untouched and cache.get("stages") == stage_hashes:
+        print(f"✓ {DATA_PATH.relative_to(REPO_ROOT)} is up to date")
+        return False
+
+    by_id = index_by_id(json.loads(existing_bytes) if existing_bytes else [])
+    previous_record_hashes = cache.get("records", {}) if output_untouched else {}
+    previous_stages = cache.get("stages", {}) if output_untouched else {}
+    record_hashes = {}
+    owner = {}
+
+    for module in sources:
+        stage = module.__name__
+        records = source_records(module)
+        upserted = 0
+        stage_unchanged = previous_stages.get(stage) == stage_hashes[stage]
+        for record in records:
+            key = str(record["id"])
+            if key in owner:
+                raise ValueError(f"Pokémon #{key} defined in both {owner[key]} and {stage}")
+            owner[key] = stage
+
+            digest = record_hash(record)
+            record_hashes[key] = digest
+            if stage_unchanged and record["id"] in by_id:
+                continue
+            if previous_record_hashes.get(key) == digest and record["id"] in by_id:
+                continue
+            if record["id"] in by_id:
+                by_id[record["id"]].update(record)
+            else:
+                by_id[record["id"]] = record
+            upserted += 1
+
+        status = "unchanged" if stage_unchanged and not upserted else f"{upserted} upserted"
+        print(f"  {stage.rsplit('.', 1)[-1]} ({module.REGION}): {len(records)} records, {status}")
+
+    pokemon_data = [by_id[pokemon_id] for pokemon_id in sorted(by_id)]
+    output = serialize(pokemon_data)
+    changed = write_if_changed(DATA_PATH, output)
+
+    save_build_cache({
+        "stages": stage_hashes,
+        "records": record_hashes,
+        "output": sha256_hex(output),
+    })
+
+    if changed:
+        print(f"✓ Wrote {len(pokemon_data)} Pokémon to {DATA_PATH.relative_to(REPO_ROOT)}")
+    else:
+        print(f"✓ {DATA_PATH.relative_to(REPO_ROOT)} unchanged ({len(pokemon_data)} Pokémon)")
+    return changed
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Build data/pokemon.json")
+    parser.add_argument("--force", action="store_true",
+                        help="ignore the build cache and recompute every stage")
+    args = parser.parse_args()
+    build(force=args.force)
+
+
+if __name__ == "__main__":
+    main()
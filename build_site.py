@@ -0,0 +1,785 @@
+#!/usr/bin/env python3
+"""
+Static Site Build
+Emits dist/, a deployable copy of the games that shares one cached copy of
+the design system instead of repeating it in every page.
+
+Every page inlines its own <style> built from game-design-system.md, and the
+games load the same js/ files. Here:
+
+    CSS   The pages' style sheets are split into rules. Rules that appear
+          (after minification) in two or more pages go to
+          assets/shared.<hash>.css sheets, one per set of pages having them,
+          so no page loads another page's rules; the rest of each page goes
+          to assets/<page>.<hash>.css. The page inlines only its critical
+          CSS: the rules whose selectors match the markup visible on load
+          (hidden screens and modals excluded). It loads its sheets without
+          blocking rendering. A page whose first visit would not get lighter
+          that way (measured, counting REQUEST_OVERHEAD per sheet) keeps all
+          of its CSS inline.
+    JS    The js/ files are bundled by the set of pages using them: files
+          every game loads form one assets/shared.<hash>.js, files only the
+          Pokémon and GeoTriad games load another, and so on, so each bundle
+          is downloaded once and no page loads code it does not run. The js/
+          files only declare functions and constants when they load, so their
+          order within a bundle does not matter.
+    HTML  Comments are dropped and whitespace runs collapsed (except inside
+          <pre>, <textarea>, <script> and <style>).
+
+Asset names carry their content hash, so they can be served with a
+far-future immutable Cache-Control header. Pages, data and sw.js keep their
+names. Every text file gets .gz and .br siblings as in build_artifacts.py, and dist/
+gets its own precache-manifest.js.
+
+Shared sheets load before the page's own sheet. A shared rule stays in the
+own sheet as well when an earlier rule of the page sets an overlapping
+property (or shorthand) and would otherwise load after it, whatever the two
+selectors and media, so the split cannot change which declaration wins.
+
+The report compares, per page, what a first visit downloads (compressed)
+with what it downloads after another game has been played (shared assets
+cached), and with the unbuilt page. It is also written to
+dist/build-report.json.
+
+Usage:
+    python build_site.py [--out dist]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+import build_artifacts
+from build_utils import REPO_ROOT, sha256_hex, write_if_changed
+
+DIST_DIR = REPO_ROOT / "dist"
+ASSET_DIR = "assets"
+PAGES = [
+    {"path": "pokemon-game.html", "name": "pokemon-game"},
+    {"path": "geotriad-game/index.html", "name": "geotriad"},
+    {"path": "add-subtract.html", "name": "add-subtract"},
+    {"path": "add-subtract-mission.html", "name": "add-subtract-mission"},
+]
+# Copied unchanged (with compressed siblings); the pages and js/ are rebuilt
+STATIC_GLOBS = [
+    pattern for pattern in build_artifacts.PRECACHE_GLOBS
+    if pattern not in {page["path"] for page in PAGES} and not pattern.startswith("js/")
+] + ["sw.js"]
+# Copied unchanged and not compressed
+BINARY_GLOBS = ["assets/artwork/**/*"]
+# At-rules whose blocks hold rules, split like the top level
+NESTED_AT_RULES = ("@media", "@supports")
+# Elements hidden on load: screens other than the active one, and modals
+HIDDEN_CLASSES = {"screen": "active", "modal": "active"}
+VOID_ELEMENTS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link",
+                 "meta", "source", "track", "wbr"}
+ALWAYS_CRITICAL = {"html", "body", "*", ":root"}
+
+
+# ===========================================
+# CSS
+# ===========================================
+
+def minify_css(css: str) -> str:
+    """css without comments and redundant whitespace; strings are kept."""
+    out = []
+    strings: List[str] = []
+    i = 0
+    while i < len(css):
+        char = css[i]
+        if css.startswith("/*", i):
+            end = css.find("*/", i + 2)
+            i = len(css) if end < 0 else end + 2
+            continue
+        if char in "\"'":
+            end = i + 1
+            while end < len(css) and css[end] != char:
+                end += 2 if css[end] == "\\" else 1
+            strings.append(css[i:end + 1])
+            out.append(f"\0{len(strings) - 1}\0")
+            i = end + 1
+            continue
+        if char.isspace():
+            while i < len(css) and css[i].isspace():
+                i += 1
+            # Whitespace on both sides of a comment collapses to one space too
+            if not out or out[-1] != " ":
+                out.append(" ")
+            continue
+        out.append(char)
+        i += 1
+    text = "".join(out)
+    text = re.sub(r" ?([{};,]) ?", r"\1", text)
+    text = re.sub(r"([{;][\w-]+) ?: ", r"\1:", text).replace(";}", "}").strip()
+    return re.sub(r"\0(\d+)\0", lambda match: strings[int(match.group(1))], text)
+
+
+def split_blocks(css: str) -> List[Tuple[str, str]]:
+    """Top-level (prelude, body) pairs of minified css."""
+    blocks = []
+    depth = 0
+    start = 0
+    brace = None
+    in_string = None
+    for i, char in enumerate(css):
+        if in_string:
+            if char == in_string and css[i - 1] != "\\":
+                in_string = None
+        elif char in "\"'":
+            in_string = char
+        elif char == "{":
+            if depth == 0:
+                brace = i
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                blocks.append((css[start:brace].strip(), css[brace + 1:i]))
+                start = i + 1
+    return blocks
+
+
+def parse_rules(css: str) -> List[Dict]:
+    """Rules of a style sheet in order: {"media", "selector", "body", "text"}."""
+    rules = []
+    for prelude, body in split_blocks(minify_css(css)):
+        if prelude.startswith(NESTED_AT_RULES):
+            for selector, inner in split_blocks(body):
+                rules.append({"media": prelude, "selector": selector, "body": inner,
+                              "text": f"{selector}{{{inner}}}"})
+        else:
+            rules.append({"media": None, "selector": prelude, "body": body,
+                          "text": f"{prelude}{{{body}}}"})
+    return rules
+
+
+def rule_key(rule: Dict) -> Tuple[Optional[str], str]:
+    """Identity of a rule across pages."""
+    return rule["media"], rule["text"]
+
+
+def declarations(body: str) -> List[str]:
+    """A rule body's "property:value" declarations in order (split outside strings and parentheses)."""
+    parts = []
+    depth = 0
+    quote = None
+    start = 0
+    for i, char in enumerate(body):
+        if quote:
+            if char == quote and body[i - 1] != "\\":
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == ";" and depth == 0:
+            parts.append(body[start:i])
+            start = i + 1
+    parts.append(body[start:])
+    return [part for part in parts if ":" in part]
+
+
+def property_name(declaration: str) -> str:
+    return declaration.split(":", 1)[0]
+
+
+def properties(rule: Dict) -> Set[str]:
+    """Property names a rule sets."""
+    return {property_name(declaration) for declaration in declarations(rule["body"])}
+
+
+def make_rule(media: Optional[str], selector: str, body: List[str]) -> Dict:
+    """A rule from its declarations, as parse_rules() returns it."""
+    text = ";".join(body)
+    return {"media": media, "selector": selector, "body": text, "text": f"{selector}{{{text}}}"}
+
+
+def overlaps(first: Set[str], second: Set[str]) -> bool:
+    """Whether two property sets touch a common property, counting shorthands."""
+    return any(a == b or a.startswith(b + "-") or b.startswith(a + "-") for a in first for b in second)
+
+
+def selector_subjects(selector: str) -> Optional[List[Tuple[Tuple[int, int, int], Dict]]]:
+    """(specificity, subject) of each selector in a selector list, or None for @-rules.
+
+    The subject is what the last compound selector requires of the element
+    it styles: "tag", "ids", "classes" and "pseudo" (its pseudo-element).
+    """
+    if selector.startswith("@"):
+        return None
+    result = []
+    for part in re.split(r",(?![^(]*\))", selector):
+        part = re.sub(r":(before|after|first-line|first-letter)\b", r"::\1", part)
+        counted = re.sub(r":where\([^()]*\)", "", part)
+        # :not(), :is() and :has() count as their (here simple) argument
+        counted = re.sub(r":(?:not|is|has)\(([^()]*)\)", r" \1", counted)
+        counted = re.sub(r"\([^()]*\)", "", counted)
+        counted = re.sub(r"\[[^\]]*\]", ".a", counted)
+        specificity = (len(re.findall(r"#[\w-]+", counted)),
+                       len(re.findall(r"(?<!:)[.:][\w-]+", counted)),
+                       len(re.findall(r"(?:^|[\s>+~])[a-zA-Z][\w-]*", counted)) + counted.count("::"))
+        compound = re.split(r"[\s>+~]+", re.sub(r"\([^()]*\)", "", part).strip())[-1]
+        tag = re.match(r"[a-zA-Z][\w-]*", compound)
+        pseudo = re.search(r"::([\w-]+)", compound)
+        result.append((specificity, {
+            "tag": tag.group(0).lower() if tag else None,
+            "ids": set(re.findall(r"#([\w-]+)", compound)),
+            "classes": set(re.findall(r"\.([\w-]+)", compound)),
+            "pseudo": pseudo.group(1) if pseudo else None,
+        }))
+    return result
+
+
+def element_classes(sources: List[str]) -> Optional[Dict[str, Set[str]]]:
+    """Classes each class is given together with, from a page's markup and scripts.
+
+    "*" marks a class added with classList, which may join any other. None
+    where a class is set from something other than a literal.
+    """
+    if any(re.search(r"className\s*\+?=(?!=)\s*[^'\"`\s]|setAttribute\(\s*['\"]class", source)
+           for source in sources):
+        return None
+    together: Dict[str, Set[str]] = {}
+    for source in sources:
+        values = re.findall(r"\bclass=\"([^\"]*)\"|\bclass='([^']*)'"
+                            r"|className\s*=\s*(?:'([^']*)'|\"([^\"]*)\"|`([^`]*)`)", source)
+        for value in ("".join(groups) for groups in values):
+            # A template's ${...} contributes the string literals in it
+            names = set(re.findall(r"[\w-]+", re.sub(r"\$\{[^}]*\}", " ", value)))
+            for expression in re.findall(r"\$\{([^}]*)\}", value):
+                names.update(name for quoted in re.findall(r"'([^']*)'|\"([^\"]*)\"", expression)
+                             for name in "".join(quoted).split())
+            for name in names:
+                together.setdefault(name, set()).update(names)
+        for name in re.findall(r"classList\.(?:add|toggle|replace)\(\s*['\"]([\w-]+)", source):
+            together.setdefault(name, set()).add("*")
+    return together
+
+
+def same_element(first: Dict, second: Dict, classes: Optional[Dict[str, Set[str]]]) -> bool:
+    """Whether two selector subjects can style the same element (or pseudo-element)."""
+    if first["pseudo"] != second["pseudo"]:
+        return False
+    if first["tag"] and second["tag"] and first["tag"] != second["tag"]:
+        return False
+    if first["ids"] and second["ids"] and first["ids"] != second["ids"]:
+        return False
+    if classes is None:
+        return True
+    return all(
+        one == two or one not in classes or two not in classes
+        or "*" in classes[one] or "*" in classes[two] or two in classes[one]
+        for one in first["classes"] for two in second["classes"])
+
+
+def conflicts(first: Dict, second: Dict, classes: Optional[Dict[str, Set[str]]] = None) -> bool:
+    """Whether the order of two rules can change what they style.
+
+    Only declarations of one property, on one element, with equal
+    specificity (and importance) are decided by order; classes is the page's
+    element_classes(). !important and @-rules conflict whenever their
+    properties overlap.
+    """
+    if not overlaps(properties(first), properties(second)):
+        return False
+    ones, twos = selector_subjects(first["selector"]), selector_subjects(second["selector"])
+    if ones is None or twos is None or "!important" in first["body"] + second["body"]:
+        return True
+    return any(one == two and same_element(subject, other, classes)
+               for one, subject in ones for two, other in twos)
+
+
+def serialize_rules(rules: List[Dict]) -> str:
+    """Style sheet for rules, regrouping consecutive rules of one @media."""
+    out = []
+    media = None
+    for rule in rules:
+        if rule["media"] != media:
+            if media:
+                out.append("}")
+            if rule["media"]:
+                out.append(f"{rule['media']}{{")
+            media = rule["media"]
+        out.append(rule["text"])
+    if media:
+        out.append("}")
+    return "".join(out)
+
+
+# ===========================================
+# HTML
+# ===========================================
+
+class VisibleMarkup(HTMLParser):
+    """Tags, classes and ids of the elements visible when a page loads."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.stack: List[Tuple[str, bool]] = []
+        self.tags: Set[str] = set()
+        self.classes: Set[str] = set()
+        self.ids: Set[str] = set()
+
+    def handle_starttag(self, tag, attrs):
+        attributes = dict(attrs)
+        classes = (attributes.get("class") or "").split()
+        style = (attributes.get("style") or "").replace(" ", "")
+        parent_hidden = bool(self.stack and self.stack[-1][1])
+        hidden = parent_hidden or "hidden" in attributes or "display:none" in style or any(
+            name in classes and shown not in classes for name, shown in HIDDEN_CLASSES.items())
+        # A hidden element's own rules count: they are what hides it
+        if not parent_hidden:
+            self.tags.add(tag)
+            self.classes.update(classes)
+            if attributes.get("id"):
+                self.ids.add(attributes["id"])
+        if tag not in VOID_ELEMENTS:
+            self.stack.append((tag, hidden))
+
+    def handle_endtag(self, tag):
+        while self.stack:
+            if self.stack.pop()[0] == tag:
+                break
+
+
+def visible_markup(html: str) -> VisibleMarkup:
+    """Parse html for its visible tags, classes and ids."""
+    parser = VisibleMarkup()
+    parser.feed(re.sub(r"<(script|style)\b.*?</\1>", "", html, flags=re.S))
+    return parser
+
+
+def selector_matches(selector: str, markup: VisibleMarkup) -> bool:
+    """Whether a selector only names visible tags, classes and ids."""
+    if selector in ALWAYS_CRITICAL:
+        return True
+    plain = re.sub(r"::?[\w-]+(\([^)]*\))?|\[[^\]]*\]", "", selector)
+    if any(name not in markup.classes for name in re.findall(r"\.([\w-]+)", plain)):
+        return False
+    if any(name not in markup.ids for name in re.findall(r"#([\w-]+)", plain)):
+        return False
+    for compound in re.split(r"[\s>+~]+", plain):
+        tag = re.match(r"[a-zA-Z][\w-]*", compound)
+        if tag and tag.group(0).lower() not in markup.tags | {"html", "body"}:
+            return False
+    return True
+
+
+def is_critical(rule: Dict, markup: VisibleMarkup) -> bool:
+    """Whether a rule styles markup visible on load."""
+    if rule["selector"].startswith("@"):
+        return rule["selector"].startswith("@font-face")
+    return any(selector_matches(part.strip(), markup) for part in rule["selector"].split(","))
+
+
+def minify_html(html: str) -> str:
+    """html without comments and whitespace runs, keeping preformatted blocks."""
+    kept: List[str] = []
+
+    def keep(match):
+        kept.append(match.group(0))
+        return f"\0{len(kept) - 1}\0"
+
+    html = re.sub(r"<(pre|textarea|script|style)\b.*?</\1>", keep, html, flags=re.S | re.I)
+    html = re.sub(r"<!--(?!\[if).*?-->", "", html, flags=re.S)
+    html = re.sub(r"\s+", " ", html)
+    html = re.sub(r"\s*(<(?:/?(?:html|head|body|meta|link|title|div|ul|li|h[1-6]|p|form|section|"
+                  r"header|footer|main|nav)\b|!DOCTYPE)[^>]*>)\s*", r"\1", html, flags=re.I)
+    return re.sub(r"\0(\d+)\0", lambda match: kept[int(match.group(1))], html).strip()
+
+
+# ===========================================
+# BUILD
+# ===========================================
+
+def hashed_name(stem: str, suffix: str, data: bytes) -> str:
+    """Content-hashed asset name, e.g. "shared.1a2b3c4d.css"."""
+    return f"{stem}.{sha256_hex(data)[:8]}{suffix}"
+
+
+class SiteBuilder:
+    """Writes dist/ and remembers every file for the report and the precache."""
+
+    def __init__(self, out_dir: Path):
+        self.out_dir = out_dir
+        self.files: Dict[str, bytes] = {}
+        self.sizes: Dict[str, Dict[str, int]] = {}
+
+    def emit(self, url: str, data: bytes, compress: bool = True):
+        """Write one file (and compressed siblings) under dist/."""
+        path = self.out_dir / url
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if compress:
+            self.sizes[url] = build_artifacts.emit(path, data)
+        else:
+            write_if_changed(path, data)
+            self.sizes[url] = {"raw": len(data), "gzip": len(data)}
+        self.files[url] = data
+
+    def prune(self):
+        """Delete files left over from earlier builds."""
+        keep = set()
+        for url in self.files:
+            keep.update({url, f"{url}.gz", f"{url}.br"})
+        keep.update({"precache-manifest.js", "precache-manifest.js.gz", "precache-manifest.js.br",
+                     "build-report.json"})
+        for path in sorted(self.out_dir.rglob("*"), reverse=True):
+            relative = path.relative_to(self.out_dir).as_posix()
+            if path.is_file() and relative not in keep:
+                path.unlink()
+            elif path.is_dir() and not any(path.iterdir()):
+                path.rmdir()
+
+
+def page_sources(page: Dict) -> Dict:
+    """A page's HTML, style sheet rules and external scripts."""
+    path = REPO_ROOT / page["path"]
+    html = path.read_text(encoding="utf-8")
+    css = "".join(re.findall(r"<style[^>]*>(.*?)</style>", html, flags=re.S))
+    scripts = [(path.parent / src).resolve().relative_to(REPO_ROOT).as_posix()
+               for src in re.findall(r'<script\s+src="([^"]+)"\s*>\s*</script>', html)]
+    return {**page, "html": html, "rules": parse_rules(css), "scripts": scripts}
+
+
+def common_declarations(pages: List[Dict]) -> Dict[str, List[Dict]]:
+    """Each page's rules, with rules that several pages style differently split in two.
+
+    For a selector (and media) found once in each of two or more pages, the
+    declarations all of them have become one rule, identical across the
+    pages and so shareable; the page-specific rest follows as a second rule.
+    A common declaration stays with the rest when it comes after an
+    overlapping page-specific one, which it would otherwise precede.
+    """
+    found: Dict[Tuple, List[Tuple[str, Dict]]] = {}
+    for page in pages:
+        for rule in page["rules"]:
+            found.setdefault(rule_key(rule)[:1] + (rule["selector"],), []).append((page["name"], rule))
+
+    splits: Dict[Tuple[str, Tuple], List[str]] = {}
+    for (media, selector), rules in found.items():
+        names = [name for name, _ in rules]
+        if selector.startswith("@") or len(rules) < 2 or len(set(names)) < len(names):
+            continue
+        bodies = [declarations(rule["body"]) for _, rule in rules]
+        if all(body == bodies[0] for body in bodies):
+            continue
+        common = set(bodies[0]).intersection(*bodies[1:])
+        changed = True
+        while changed:
+            changed = False
+            for body in bodies:
+                rest: Set[str] = set()
+                for declaration in body:
+                    if declaration in common and overlaps({property_name(declaration)}, rest):
+                        common.discard(declaration)
+                        changed = True
+                    if declaration not in common:
+                        rest.add(property_name(declaration))
+        ordered = [[declaration for declaration in body if declaration in common] for body in bodies]
+        if not common or any(order != ordered[0] for order in ordered):
+            continue
+        for name in names:
+            splits[(name, (media, selector))] = ordered[0]
+
+    result = {}
+    for page in pages:
+        rules = []
+        for rule in page["rules"]:
+            common = splits.get((page["name"], (rule["media"], rule["selector"])))
+            if common is None:
+                rules.append(rule)
+                continue
+            rules.append(make_rule(rule["media"], rule["selector"], common))
+            rest = [declaration for declaration in declarations(rule["body"]) if declaration not in common]
+            if rest:
+                rules.append(make_rule(rule["media"], rule["selector"], rest))
+        result[page["name"]] = rules
+    return result
+
+
+def css_groups(rules_by_page: Dict[str, List[Dict]]) -> List[Dict]:
+    """Rules found in two or more pages, grouped by the set of pages having them."""
+    users: Dict[Tuple, List[str]] = {}
+    for name, rules in rules_by_page.items():
+        for rule in rules:
+            names = users.setdefault(rule_key(rule), [])
+            if name not in names:
+                names.append(name)
+    groups: Dict[Tuple[str, ...], List[Dict]] = {}
+    added = set()
+    for rules in rules_by_page.values():
+        for rule in rules:
+            key = rule_key(rule)
+            if len(users[key]) > 1 and key not in added:
+                added.add(key)
+                groups.setdefault(tuple(users[key]), []).append(rule)
+    return [{"pages": names, "rules": rules} for names, rules in groups.items()]
+
+
+def page_rules(rules: List[Dict], critical: List[bool], positions: Dict[Tuple, Tuple[int, int]],
+               classes: Optional[Dict[str, Set[str]]] = None) -> Tuple[List[Dict], List[Dict]]:
+    """The page's rules for the <style>s before and after the shared sheets it loads.
+
+    positions maps the shared rules the page loads to their load order;
+    classes is the page's element_classes(), for conflicts(). The page's
+    other rules go before the shared sheets. Where two conflicting rules
+    would then load in the wrong order, the earlier one moves before them if
+    it is the page's alone, else the later one moves after them (for good).
+    Critical shared rules left in their sheet are also copied before it, so
+    the first render has them.
+    """
+    after_tier = len(set(position[0] for position in positions.values())) + 1
+    placement = [positions.get(rule_key(rule), (0, index)) for index, rule in enumerate(rules)]
+    moved_after = set()
+    pairs = [(a, b) for b in range(len(rules)) for a in range(b) if conflicts(rules[a], rules[b], classes)]
+    changed = True
+    while changed:
+        changed = False
+        for a, b in pairs:
+            if placement[a] <= placement[b]:
+                continue
+            if rule_key(rules[a]) not in positions and a not in moved_after:
+                placement[a] = (0, a)
+            else:
+                placement[b] = (after_tier, b)
+                moved_after.add(b)
+            changed = True
+    before = [rule for rule, inline, (tier, _) in zip(rules, critical, placement)
+              if tier == 0 or tier == after_tier or inline and tier < after_tier]
+    after = []
+    return before, after
+
+
+def css_plan(pages: List[Dict], split: Set[str]) -> Tuple[List[Dict], Dict[str, Dict]]:
+    """Shared sheets for the pages named in split, and each page's <style>s and sheets.
+
+    A plan has "inline" (the <style> before the sheets), "sheets" ((url,
+    css) pairs) and "after" (the <style> after them).
+    """
+    rules_by_page = common_declarations([page for page in pages if page["name"] in split])
+    groups = css_groups(rules_by_page)
+    for group in groups:
+        group["css"] = serialize_rules(group["rules"]).encode("utf-8")
+        group["url"] = f"{ASSET_DIR}/{hashed_name('shared', '.css', group['css'])}"
+
+    plans = {}
+    for page in pages:
+        if page["name"] not in split:
+            plans[page["name"]] = {"inline": serialize_rules(page["rules"]), "sheets": [], "after": ""}
+            continue
+        rules = rules_by_page[page["name"]]
+        markup = visible_markup(page["html"])
+        critical = [is_critical(rule, markup) for rule in rules]
+        loaded = [group for group in groups if page["name"] in group["pages"]]
+        # Shared sheets load after the first <style>, at position 0
+        positions = {rule_key(rule): (number, index) for number, group in enumerate(loaded, 1)
+                     for index, rule in enumerate(group["rules"])}
+        classes = element_classes([page["html"]] + [(REPO_ROOT / script).read_text(encoding="utf-8")
+                                                     for script in page["scripts"]])
+        before, after = page_rules(rules, critical, positions, classes)
+        plans[page["name"]] = {
+            "inline": serialize_rules(before),
+            "sheets": [(group["url"], group["css"]) for group in loaded],
+            "after": serialize_rules(after),
+        }
+    return groups, plans
+
+
+def asset_url(page: Dict, url: str) -> str:
+    """url relative to the page's directory."""
+    depth = page["path"].count("/")
+    return "../" * depth + url
+
+
+def stylesheet_links(page: Dict, urls: List[str]) -> str:
+    """Non-blocking <link>s for style sheets, with a <noscript> fallback."""
+    links = "".join(f'<link rel="stylesheet" href="{asset_url(page, url)}" media="print" '
+                    f"onload=\"this.media='all'\">" for url in urls)
+    fallback = "".join(f'<link rel="stylesheet" href="{asset_url(page, url)}">' for url in urls)
+    return f"{links}<noscript>{fallback}</noscript>"
+
+
+def build_page(page: Dict, inline_css: str, css_urls: List[str], script_urls: Dict[str, str],
+               after_css: str = "") -> bytes:
+    """The page with inline_css, its style sheets, after_css and hashed scripts."""
+    html = page["html"]
+    head = f"<style>{inline_css}</style>" + (stylesheet_links(page, css_urls) if css_urls else "")
+    if after_css:
+        head += f"<style>{after_css}</style>"
+    html = re.sub(r"<style[^>]*>.*?</style>", "\0", html, count=1, flags=re.S)
+    html = re.sub(r"<style[^>]*>.*?</style>", "", html, flags=re.S).replace("\0", head)
+
+    emitted = set()
+
+    def replace_script(match):
+        src = (REPO_ROOT / page["path"]).parent.joinpath(match.group(1)).resolve()
+        url = script_urls[src.relative_to(REPO_ROOT).as_posix()]
+        if url in emitted:
+            return ""
+        emitted.add(url)
+        return f'<script src="{asset_url(page, url)}"></script>'
+
+    html = re.sub(r'<script\s+src="([^"]+)"\s*>\s*</script>', replace_script, html)
+    return minify_html(html).encode("utf-8")
+
+
+def gzip_size(data: bytes) -> int:
+    """Compressed size of data as a static host would serve it."""
+    return len(gzip.compress(data, compresslevel=9, mtime=0))
+
+
+def unbuilt_size(page: Dict) -> int:
+    """Bytes the original page and its scripts transfer (gzip)."""
+    return gzip_size(page["html"].encode("utf-8")) + sum(
+        gzip_size((REPO_ROOT / script).read_bytes()) for script in page["scripts"])
+
+
+def css_costs(page: Dict, plan: Dict, script_urls: Dict[str, str]) -> Tuple[int, int]:
+    """(first visit, visit after another game) bytes of the page and its style sheets."""
+    html = gzip_size(build_page(page, plan["inline"], [url for url, _ in plan["sheets"]], script_urls,
+                                plan["after"]))
+    return html + sum(gzip_size(css) for _, css in plan["sheets"]), html
+
+
+def split_pays_off(page: Dict, plan: Dict, script_bytes: int, script_urls: Dict[str, str]) -> bool:
+    """Whether loading shared sheets beats inlining all CSS for page.
+
+    The visit after another game (shared sheets cached) must get lighter,
+    and the first visit, with script_bytes of bundles, must not get heavier
+    than the unbuilt page.
+    """
+    first, cached = css_costs(page, plan, script_urls)
+    _, inline = css_costs(page, {"inline": serialize_rules(page["rules"]), "sheets": [], "after": ""}, script_urls)
+    return cached < inline and first + script_bytes <= unbuilt_size(page)
+
+
+def report(builder: SiteBuilder, pages: List[Dict], shared_urls: Set[str]) -> List[Dict]:
+    """Per-page transfer sizes (gzip), cold and with shared assets cached."""
+    rows = []
+    for page in pages:
+        assets = page["assets"]
+        html = builder.sizes[page["path"]]["gzip"]
+        first = html + sum(builder.sizes[url]["gzip"] for url in assets)
+        cached = html + sum(builder.sizes[url]["gzip"] for url in assets if url not in shared_urls)
+        before = unbuilt_size(page)
+        rows.append({
+            "page": page["path"],
+            "before": before,
+            "html": html,
+            "inlineCss": page["inline_bytes"],
+            "assets": {url: builder.sizes[url]["gzip"] for url in assets},
+            "firstVisit": first,
+            "sharedCached": cached,
+            "cacheHit": round(1 - cached / first, 3) if first else 0,
+        })
+    return rows
+
+
+def print_site_report(rows: List[Dict], shared_urls: Set[str]):
+    """Print the per-page size and cache table."""
+    print(f"\n{'page':<28} {'before':>9} {'html':>8} {'inline css':>10} {'first':>9} {'cached':>9}  hit")
+    for row in rows:
+        print(f"{row['page']:<28} {row['before']:>9,} {row['html']:>8,} {row['inlineCss']:>10,} "
+              f"{row['firstVisit']:>9,} {row['sharedCached']:>9,}  {row['cacheHit']:.0%}")
+    print("\n(gzip bytes; 'cached' is a visit after another game, with the shared assets "
+          f"{', '.join(sorted(shared_urls))} cached)")
+
+
+def script_groups(pages: List[Dict]) -> List[Dict]:
+    """js/ files grouped by the set of pages using them, in load order."""
+    groups: Dict[Tuple[str, ...], List[str]] = {}
+    order = list(dict.fromkeys(script for page in pages for script in page["scripts"]))
+    for script in order:
+        users = tuple(page["name"] for page in pages if script in page["scripts"])
+        groups.setdefault(users, []).append(script)
+    return [{"pages": users, "scripts": scripts} for users, scripts in groups.items()]
+
+
+def build_site(out_dir: Path = DIST_DIR) -> List[Dict]:
+    """Build dist/. Returns the report rows."""
+    builder = SiteBuilder(out_dir)
+    pages = [page_sources(page) for page in PAGES]
+    shared_urls = set()
+
+    # JS: one bundle per set of pages, so no page loads code it does not run
+    script_urls: Dict[str, str] = {}
+    groups = script_groups(pages)
+    for group in groups:
+        bundle = "\n".join((REPO_ROOT / script).read_text(encoding="utf-8")
+                           for script in group["scripts"]).encode("utf-8")
+        stem = "shared" if len(group["pages"]) > 1 else group["pages"][0]
+        url = f"{ASSET_DIR}/{hashed_name(stem, '.js', bundle)}"
+        builder.emit(url, bundle)
+        script_urls.update({script: url for script in group["scripts"]})
+        if len(group["pages"]) > 1:
+            shared_urls.add(url)
+
+    # CSS: shared sheets for the pages where that pays off (see
+    # split_pays_off); the rest keep all CSS inline. Dropping a page changes
+    # what the others share, so this repeats until every split page gains.
+    split = {page["name"] for page in pages}
+    while True:
+        shared_sheets, plans = css_plan(pages, split)
+        losing = {
+            page["name"] for page in pages if page["name"] in split and not split_pays_off(
+                page, plans[page["name"]],
+                sum(builder.sizes[url]["gzip"] for url in set(script_urls[script] for script in page["scripts"])),
+                script_urls)
+        }
+        if not losing:
+            break
+        split -= losing
+    for group in shared_sheets:
+        builder.emit(group["url"], group["css"])
+        shared_urls.add(group["url"])
+    shared_rule_count = sum(len(group["rules"]) for group in shared_sheets)
+
+    for page in pages:
+        plan = plans[page["name"]]
+        css_urls = [url for url, _ in plan["sheets"]]
+        builder.emit(page["path"], build_page(page, plan["inline"], css_urls, script_urls, plan["after"]))
+        page["inline_bytes"] = len((plan["inline"] + plan["after"]).encode("utf-8"))
+        page["assets"] = css_urls + list(dict.fromkeys(script_urls[script] for script in page["scripts"]))
+
+    for path in build_artifacts.precache_paths(STATIC_GLOBS):
+        builder.emit(path.relative_to(REPO_ROOT).as_posix(), path.read_bytes())
+    for pattern in BINARY_GLOBS:
+        for path in sorted(REPO_ROOT.glob(pattern)):
+            if path.is_file():
+                builder.emit(path.relative_to(REPO_ROOT).as_posix(), path.read_bytes(), compress=False)
+
+    precached = [(url, data) for url, data in sorted(builder.files.items())
+                 if not url.startswith("assets/artwork/") and url != "sw.js"]
+    manifest = build_artifacts.precache_manifest(precached, build_artifacts.PRECACHE_INDEX_URLS)
+    build_artifacts.emit(out_dir / "precache-manifest.js", build_artifacts.precache_script(manifest, "build_site.py"))
+
+    rows = report(builder, pages, shared_urls)
+    write_if_changed(out_dir / "build-report.json", json.dumps({
+        "sharedAssets": sorted(shared_urls),
+        "sharedCssRules": shared_rule_count,
+        "pages": rows,
+    }, indent=2).encode("utf-8") + b"\n")
+    builder.prune()
+    print(f"✓ {len(builder.files)} files in {os.path.relpath(out_dir)} ({shared_rule_count} shared CSS rules, "
+          f"{len(groups)} script bundles), precache version {manifest['version']}")
+    print_site_report(rows, shared_urls)
+    return rows
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Build the static site into dist/")
+    parser.add_argument("--out", type=Path, default=DIST_DIR)
+    args = parser.parse_args()
+    build_site(args.out.resolve())
+
+
+if __name__ == "__main__":
+    main()
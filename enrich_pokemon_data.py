@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+"""
+Pokémon Data Enrichment
+Fills the PokéAPI-derived fields of data/pokemon.json (types, size, habitat,
+color, shape, genus, flavor text, ...) for every record, which
+build_pokemon_data.py only creates with names, region and artwork URL.
+
+Each species needs two requests (/pokemon/<id> and /pokemon-species/<id>).
+They run on a bounded asyncio worker pool behind a token bucket (--rate
+requests per second, bursts of --burst), and failed requests are retried
+with exponential backoff (honouring Retry-After on 429). Responses are
+requested conditionally with the ETag of the previous run and hashed; a
+species whose two sources are unchanged (304, or the same bytes) is skipped.
+
+Progress is checkpointed to .cache/pokemon-enrich.json every few species
+and when the run stops. Running again after an interruption resumes the
+same run and skips the species it already finished; --restart starts over.
+
+categoryTag is curated: existing values are kept and only new records get
+one, derived from their genus and types.
+
+The API can be replaced by a local stand-in: --write-fixtures DIR writes
+PokéAPI-shaped responses for the current dataset, to be served with
+fixture_server.py and used via --mirror (see benchmarks/bench_enrich.py).
+
+Usage:
+    python enrich_pokemon_data.py [--concurrency 8] [--rate 20] [--restart]
+    python enrich_pokemon_data.py --write-fixtures /tmp/pokeapi
+    python enrich_pokemon_data.py --mirror http://127.0.0.1:8765
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from build_pokemon_data import DATA_PATH, serialize
+from build_utils import REPO_ROOT, sha256_hex, write_if_changed
+
+API_BASE = "https://pokeapi.co/api/v2"
+CHECKPOINT_PATH = REPO_ROOT / ".cache" / "pokemon-enrich.json"
+# Species finished between two checkpoint writes
+CHECKPOINT_EVERY = 25
+USER_AGENT = "small-apps-enrichment/1.0 (+https://github.com/LFDave/small-apps)"
+
+GENERATION_REGIONS = {
+    "generation-i": "Kanto", "generation-ii": "Johto", "generation-iii": "Hoenn",
+    "generation-iv": "Sinnoh", "generation-v": "Unova", "generation-vi": "Kalos",
+    "generation-vii": "Alola", "generation-viii": "Galar", "generation-ix": "Paldea",
+}
+
+# categoryTag for new records: the first genus keyword found, else by type
+CATEGORY_KEYWORDS = [
+    ("plant", ["seed", "flower", "weed", "cottonweed"]),
+    ("lizard", ["lizard", "flame"]),
+    ("turtle", ["turtle"]),
+    ("fish", ["fish"]),
+    ("bug", ["bug", "worm", "cocoon"]),
+    ("bird", ["bird"]),
+    ("mouse", ["mouse"]),
+    ("dragon", ["dragon"]),
+]
+CATEGORY_TYPES = [("water", "Water"), ("flying", "Flying")]
+
+
+# ---------------------------------------------------------------------------
+# Field mapping
+# ---------------------------------------------------------------------------
+def clean_text(text: str) -> str:
+    """Flavor text with the game's line and page breaks turned into spaces."""
+    return re.sub(r"\s+", " ", text.replace("\f", " ")).strip()
+
+
+def english(entries: List[Dict], key: str) -> Optional[str]:
+    """First English entry of a PokéAPI localized list."""
+    for entry in entries:
+        if entry["language"]["name"] == "en":
+            return entry[key]
+    return None
+
+
+def pokemon_fields(pokemon: Dict) -> Dict:
+    """Fields taken from /pokemon/<id>."""
+    types = [entry["type"]["name"].capitalize()
+             for entry in sorted(pokemon["types"], key=lambda entry: entry["slot"])]
+    return {"type": types, "types2": list(types), "heightDm": pokemon["height"], "weightHg": pokemon["weight"]}
+
+
+def species_fields(species: Dict) -> Dict:
+    """Fields taken from /pokemon-species/<id>."""
+    generation = species["generation"]["name"]
+    flavor = english(species["flavor_text_entries"], "flavor_text")
+    return {
+        "generation": generation,
+        "mainRegion": GENERATION_REGIONS.get(generation),
+        "habitat": (species.get("habitat") or {}).get("name"),
+        "color": species["color"]["name"],
+        "shape": (species.get("shape") or {}).get("name"),
+        "genusEn": english(species["genera"], "genus"),
+        "flavorTextEn": clean_text(flavor) if flavor else None,
+    }
+
+
+def category_tag(record: Dict) -> Optional[str]:
+    """Category for a record without a curated one (see CATEGORY_KEYWORDS)."""
+    genus = (record.get("genusEn") or "").lower()
+    for tag, keywords in CATEGORY_KEYWORDS:
+        if any(keyword in genus for keyword in keywords):
+            return tag
+    for tag, type_name in CATEGORY_TYPES:
+        if type_name in record.get("type", []):
+            return tag
+    return None
+
+
+SOURCES = {
+    "pokemon": ("pokemon/{id}", pokemon_fields),
+    "species": ("pokemon-species/{id}", species_fields),
+}
+
+
+def api_fixture(record: Dict) -> Dict[str, Dict]:
+    """PokéAPI-shaped responses that map back onto record (for a stand-in API)."""
+    en = {"name": "en"}
+    generation = record.get("generation", "generation-i")
+    return {
+        "pokemon": {
+            "id": record["id"],
+            "name": record["name"].lower(),
+            "height": record.get("heightDm", 0),
+            "weight": record.get("weightHg", 0),
+            "types": [{"slot": slot, "type": {"name": name.lower()}}
+                      for slot, name in enumerate(record.get("type", []), 1)],
+        },
+        "species": {
+            "id": record["id"],
+            "generation": {"name": generation},
+            "habitat": {"name": record["habitat"]} if record.get("habitat") else None,
+            "color": {"name": record.get("color", "unknown")},
+            "shape": {"name": record["shape"]} if record.get("shape") else None,
+            "genera": [{"genus": record.get("genusEn", ""), "language": en}],
+            "flavor_text_entries": [{"flavor_text": record.get("flavorTextEn", ""), "language": en}],
+        },
+    }
+
+
+def write_fixtures(records: Iterable[Dict], directory: Path) -> int:
+    """Write api_fixture() responses as <dir>/pokeapi.co/api/v2/... Returns the count."""
+    root = Path(directory) / API_BASE.split("://", 1)[1]
+    count = 0
+    for record in records:
+        for source, payload in api_fixture(record).items():
+            path = root / SOURCES[source][0].format(id=record["id"])
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            count += 1
+    return count
+
+
+# ---------------------------------------------------------------------------
+# Checkpoint
+# ---------------------------------------------------------------------------
+def load_checkpoint(path: Path) -> Dict:
+    """Checkpoint of the last run, or an empty one."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"run": None, "species": {}}
+
+
+def save_checkpoint(path: Path, checkpoint: Dict):
+    """Write the checkpoint atomically, so an interruption never leaves half a file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, ensure_ascii=False, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+# ---------------------------------------------------------------------------
+# Fetching
+# ---------------------------------------------------------------------------
+class TokenBucket:
+    """Allows `rate` acquisitions per second on average, `burst` at once."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class RetryableError(Exception):
+    """A failed request worth retrying, optionally after a server-given delay."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def http_get(url: str, etag: Optional[str], timeout: float) -> Tuple[int, bytes, Optional[str]]:
+    """Blocking conditional GET. Returns (status, body, etag); body is empty on 304."""
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT, "Accept": "application/json"})
+    if etag:
+        request.add_header("If-None-Match", etag)
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.status, response.read(), response.headers.get("ETag")
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return 304, b"", e.headers.get("ETag") or etag
+        if e.code == 429 or e.code >= 500:
+            retry_after = e.headers.get("Retry-After")
+            raise RetryableError(f"HTTP {e.code}",
+                                 float(retry_after) if retry_after and retry_after.isdigit() else None)
+        raise
+    except (urllib.error.URLError, TimeoutError, OSError) as e:
+        raise RetryableError(str(e))
+
+
+class Enricher:
+    """Fetches and maps species concurrently; see the module docstring."""
+
+    def __init__(self, checkpoint: Dict, concurrency: int = 8, rate: float = 20, burst: int = 10,
+                 retries: int = 3, backoff: float = 0.5, timeout: float = 30,
+                 mirror: Optional[str] = None, checkpoint_path: Optional[Path] = None,
+                 verbose: bool = True):
+        self.checkpoint = checkpoint
+        self.concurrency = concurrency
+        self.bucket_args = (rate, burst)
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.mirror = mirror.rstrip("/") if mirror else None
+        self.checkpoint_path = checkpoint_path
+        self.verbose = verbose
+        self.stats = {"changed": 0, "unchanged": 0, "resumed": 0, "failed": 0, "requests": 0, "retries": 0}
+
+    def url(self, source: str, species_id: int) -> str:
+        """API URL of one source, mapped onto the mirror as MIRROR/<host>/<path>."""
+        url = f"{API_BASE}/{SOURCES[source][0].format(id=species_id)}"
+        return f"{self.mirror}/{url.split('://', 1)[1]}" if self.mirror else url
+
+    async def get(self, url: str, etag: Optional[str]) -> Tuple[int, bytes, Optional[str]]:
+        """Rate-limited GET with retries and exponential backoff plus jitter."""
+        loop = asyncio.get_running_loop()
+        for attempt in range(self.retries + 1):
+            await self.bucket.acquire()
+            self.stats["requests"] += 1
+            try:
+                return await loop.run_in_executor(self.executor, http_get, url, etag, self.timeout)
+            except RetryableError as e:
+                if attempt == self.retries:
+                    raise
+                self.stats["retries"] += 1
+                delay = e.retry_after or self.backoff * 2 ** attempt * (1 + random.random())
+                await asyncio.sleep(delay)
+
+    async def enrich(self, species_id: int, run: float) -> str:
+        """Refresh one species' checkpoint entry. Returns "changed" or "unchanged"."""
+        entry = self.checkpoint["species"].setdefault(str(species_id), {"sources": {}, "fields": {}})
+        responses = await asyncio.gather(*(
+            self.get(self.url(source, species_id), entry["sources"].get(source, {}).get("etag"))
+            for source in SOURCES
+        ))
+        changed = False
+        for (source, (_, mapper)), (status, body, etag) in zip(SOURCES.items(), responses):
+            previous = entry["sources"].get(source, {})
+            digest = previous.get("sha256") if status == 304 else sha256_hex(body)
+            if status != 304 and digest != previous.get("sha256"):
+                entry["fields"].update(mapper(json.loads(body)))
+                changed = True
+            entry["sources"][source] = {"etag": etag, "sha256": digest}
+        entry["checked"] = run
+        return "changed" if changed else "unchanged"
+
+    async def worker(self, queue: asyncio.Queue, run: float, total: int):
+        """Take species ids off the queue until it is empty."""
+        while True:
+            try:
+                species_id = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                result = await self.enrich(species_id, run)
+            except (RetryableError, urllib.error.HTTPError, ValueError, KeyError) as e:
+                print(f"✗ #{species_id}: {e}")
+                result = "failed"
+            self.stats[result] += 1
+            self.finished += 1
+            if self.finished % CHECKPOINT_EVERY == 0:
+                self.save()
+                if self.verbose:
+                    rate = self.finished / (time.monotonic() - self.started)
+                    print(f"  {self.finished}/{total} species ({rate:.1f}/s)")
+
+    def save(self):
+        if self.checkpoint_path:
+            save_checkpoint(self.checkpoint_path, self.checkpoint)
+
+    async def run(self, species_ids: List[int], restart: bool = False) -> Dict:
+        """Enrich the given species, resuming an interrupted run unless restart."""
+        run = self.checkpoint.get("run")
+        if restart or not run or run.get("complete"):
+            run = self.checkpoint["run"] = {"started": time.time(), "complete": False}
+        pending = []
+        for species_id in species_ids:
+            entry = self.checkpoint["species"].get(str(species_id))
+            if entry and entry.get("checked", 0) >= run["started"]:
+                self.stats["resumed"] += 1
+            else:
+                pending.append(species_id)
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for species_id in pending:
+            queue.put_nowait(species_id)
+        self.bucket = TokenBucket(*self.bucket_args)
+        self.executor = ThreadPoolExecutor(max_workers=self.concurrency * len(SOURCES))
+        self.started = time.monotonic()
+        self.finished = 0
+        try:
+            await asyncio.gather(*(self.worker(queue, run["started"], len(pending))
+                                   for _ in range(min(self.concurrency, len(pending)) or 1)))
+            run["complete"] = self.stats["failed"] == 0
+        finally:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.save()
+        return self.stats
+
+
+def apply_fields(records: List[Dict], checkpoint: Dict) -> int:
+    """Merge checkpointed fields into the records. Returns how many gained fields."""
+    filled = 0
+    for record in records:
+        entry = checkpoint["species"].get(str(record["id"]))
+        if not entry or not entry["fields"]:
+            continue
+        record.update(entry["fields"])
+        if "categoryTag" not in record:
+            record["categoryTag"] = category_tag(record)
+        filled += 1
+    return filled
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Fill the PokéAPI fields of data/pokemon.json")
+    parser.add_argument("--concurrency", type=int, default=8, help="species fetched at once")
+    parser.add_argument("--rate", type=float, default=20, help="requests per second")
+    parser.add_argument("--burst", type=int, default=10, help="requests allowed at once after a pause")
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--restart", action="store_true", help="ignore an interrupted run and start over")
+    parser.add_argument("--mirror", default=None,
+                        help="fetch from MIRROR/<host>/<path> instead (e.g. fixture_server.py)")
+    parser.add_argument("--checkpoint", type=Path, default=CHECKPOINT_PATH)
+    parser.add_argument("--write-fixtures", type=Path, metavar="DIR",
+                        help="write stand-in API responses for the current dataset and exit")
+    args = parser.parse_args()
+
+    with open(DATA_PATH, "r", encoding="utf-8") as f:
+        records = json.load(f)
+
+    if args.write_fixtures:
+        count = write_fixtures(records, args.write_fixtures)
+        print(f"✓ Wrote {count} responses under {args.write_fixtures}")
+        return
+
+    checkpoint = load_checkpoint(args.checkpoint)
+    enricher = Enricher(checkpoint, concurrency=args.concurrency, rate=args.rate, burst=args.burst,
+                        retries=args.retries, mirror=args.mirror, checkpoint_path=args.checkpoint)
+    start = time.perf_counter()
+    try:
+        stats = asyncio.run(enricher.run([record["id"] for record in records], restart=args.restart))
+    except KeyboardInterrupt:
+        print(f"✗ Interrupted; progress saved to {args.checkpoint}, run again to resume")
+        raise SystemExit(130)
+    elapsed = time.perf_counter() - start
+    print(f"✓ {len(records)} species in {elapsed:.1f}s: {stats['changed']} changed, "
+          f"{stats['unchanged']} unchanged, {stats['resumed']} resumed, {stats['failed']} failed "
+          f"({stats['requests']} requests, {stats['retries']} retries)")
+
+    apply_fields(records, checkpoint)
+    if write_if_changed(DATA_PATH, serialize(records)):
+        print(f"✓ Updated {DATA_PATH.relative_to(REPO_ROOT)}")
+    else:
+        print(f"✓ {DATA_PATH.relative_to(REPO_ROOT)} unchanged")
+    if stats["failed"]:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Local fixture server for exercising the data generators without the internet.
+
+Serves a directory over HTTP with ETag / Last-Modified validators (so the
+HTTP cache can be checked end to end), an optional injected latency and an
+optional share of requests failing with 503, to exercise retries.
+
+Usage:
+    python fixture_server.py DIRECTORY [--port 8765] [--latency 0.5] [--failure-rate 0.1]
+"""
+
+import argparse
+import hashlib
+import http.server
+import random
+import threading
+import time
+from functools import partial
+from pathlib import Path
+
+
+class FixtureRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Static file handler that adds strong ETags, artificial latency and failures."""
+
+    latency = 0.0
+    failure_rate = 0.0
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_head(self):
+        if self.latency:
+            time.sleep(self.latency)
+        if self.failure_rate and random.random() < self.failure_rate:
+            self.send_error(503, "Injected failure")
+            return None
+
+        path = Path(self.translate_path(self.path))
+        if path.is_file():
+            etag = '"%s"' % hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return None
+            self._etag = etag
+        return super().send_head()
+
+    def end_headers(self):
+        etag = getattr(self, "_etag", None)
+        if etag:
+            self.send_header("ETag", etag)
+            self._etag = None
+        super().end_headers()
+
+
+class FixtureServer:
+    """Threaded fixture server usable as a context manager."""
+
+    def __init__(self, directory, port: int = 0, latency: float = 0.0, failure_rate: float = 0.0):
+        handler = type("Handler", (FixtureRequestHandler,),
+                       {"latency": latency, "failure_rate": failure_rate})
+        self.httpd = http.server.ThreadingHTTPServer(
+            ("127.0.0.1", port), partial(handler, directory=str(directory))
+        )
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("directory", type=Path)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="seconds to sleep before answering each request")
+    parser.add_argument("--failure-rate", type=float, default=0.0,
+                        help="share of requests answered with 503 Service Unavailable")
+    args = parser.parse_args()
+
+    with FixtureServer(args.directory, args.port, args.latency, args.failure_rate) as server:
+        print(f"Serving {args.directory} at {server.url} (Ctrl+C to stop)")
+        try:
+            server.thread.join()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -2,27 +2,68 @@
 """
 GeoTriad Data Generator
 Generates /data/geo.json according to the Data PRD specification.
+
+Country data is assembled from source plugins (geo_sources.py) joined by
+alpha-2 code in a single pass. Two profiles are built in:
+
+    remote    countries.json + German names fetched from GitHub (default)
+    embedded  countries.json + the German table in translations/de.json
+
+Both use the local continents.json. Every other language with a table in
+translations/ (translations/fr.json, ...) is added as optional
+country_<lang>/capital_<lang>/continent_<lang> columns; build_artifacts.py
+turns those into one string file per locale. Continent distribution, tags
+and exclusions are counted during the same pass.
+
+Usage:
+    python data/generate_geo_data.py [--profile embedded] [--workers N] [--offline]
 """
 
+import argparse
 import json
-import urllib.request
-import urllib.error
-from typing import Dict, List, Optional
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Shared build helpers live at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from build_utils import write_if_changed  # noqa: E402
+from http_cache import HttpCache, add_cache_arguments, cache_from_args  # noqa: E402
+from geo_sources import (  # noqa: E402
+    DATA_DIR, ContinentSource, GeoSource, RemoteListSource, TagSource, TranslationTableSource,
+    table_languages,
+)
 
 # Data source URLs
 COUNTRIES_JSON_URL = "https://raw.githubusercontent.com/Khodour/countries.json/master/countries.json"
 GERMAN_COUNTRIES_URL = "https://raw.githubusercontent.com/stefangabos/world_countries/master/data/countries/de/countries.json"
 CONTINENT_MAPPING_URL = "https://gist.githubusercontent.com/tiagodealmeida/0b97ccf117252d742dddf098bc6cc58a/raw/3d3a409b2c844e30ac35a0ad734ad7f5fc0ca5f0/country-to-continent.json"
 
-# Continent enum (strict) - Antarctica is excluded
-CONTINENT_MAP_EN_TO_DE = {
-    "Africa": "Afrika",
-    "Europe": "Europa",
-    "Asia": "Asien",
-    "North America": "Nordamerika",
-    "South America": "Südamerika",
-    "Oceania": "Ozeanien"
+CONTINENTS_PATH = DATA_DIR / "continents.json"
+OUTPUT_PATH = DATA_DIR / "geo.json"
+
+# Per-source request timeouts in seconds (each attempt; retries back off)
+SOURCE_TIMEOUTS = {
+    COUNTRIES_JSON_URL: 30,
+    GERMAN_COUNTRIES_URL: 30,
+    CONTINENT_MAPPING_URL: 15,
 }
+FETCH_RETRIES = 2
+
+# Languages the game offers; a country missing either is excluded
+REQUIRED_LANGUAGES = ("en", "de")
+# Any further languages come from translations/<lang>.json and are optional
+EXTRA_LANGUAGES = tuple(lang for lang in table_languages() if lang not in REQUIRED_LANGUAGES)
+LANGUAGES = REQUIRED_LANGUAGES + EXTRA_LANGUAGES
+
+# Output fields in file order; region_de is optional and left empty
+OUTPUT_FIELDS = ["id", "country_en", "country_de", "continent_en", "continent_de",
+                 "region_en", "region_de", "capital_en", "capital_de", "flag", "tags"] + [
+    f"{field}_{lang}" for lang in EXTRA_LANGUAGES for field in ("country", "capital", "continent")
+]
+REQUIRED_FIELDS = [f"{field}_{lang}" for field in ("country", "capital", "continent")
+                   for lang in REQUIRED_LANGUAGES]
 
 # Extraordinary name tags (mandatory according to PRD)
 EXTRAORDINARY_TAGS = {
@@ -34,202 +75,162 @@ EXTRAORDINARY_TAGS = {
     "MN": ["extraordinary_name"],  # Mongolia - Ulaanbaatar
     "CI": ["extraordinary_name"],  # Côte d'Ivoire - Yamoussoukro
     "BW": ["extraordinary_name"],  # Botswana - Gaborone
+    # Capital only, country tagged too
+    "HT": ["extraordinary_name"],  # Haiti - Port-au-Prince
+    "BI": ["extraordinary_name"],  # Burundi - Bujumbura
+    "MW": ["extraordinary_name"],  # Malawi - Lilongwe
+    "SB": ["extraordinary_name"],  # Solomon Islands - Honiara
 }
 
 
-def fetch_json(url: str) -> Optional[Dict]:
-    """Fetch JSON data from URL."""
-    try:
-        print(f"Fetching data from {url}")
-        with urllib.request.urlopen(url, timeout=30) as response:
-            data = json.loads(response.read().decode('utf-8'))
-            print(f"✓ Successfully fetched data")
-            return data
-    except urllib.error.URLError as e:
-        print(f"✗ Error fetching {url}: {e}")
-        return None
-    except json.JSONDecodeError as e:
-        print(f"✗ Error parsing JSON from {url}: {e}")
-        return None
-
-
-def load_base_countries() -> Dict[str, Dict]:
-    """Load base country data from Khodour/countries.json."""
-    data = fetch_json(COUNTRIES_JSON_URL)
-    if not data:
-        return {}
-    
-    countries = {}
-    for country in data:
-        alpha2 = country.get("alpha2")
-        if alpha2:
-            countries[alpha2] = {
-                "id": alpha2,
-                "country_en": country.get("name", ""),
-                "capital_en": country.get("capital", ""),
-                "region_en": country.get("region", ""),
-                "flag": country.get("flag", ""),
-            }
-    
-    print(f"Loaded {len(countries)} base countries")
-    return countries
-
-
-def load_german_translations() -> Dict[str, Dict]:
-    """Load German translations from stefangabos/world_countries."""
-    data = fetch_json(GERMAN_COUNTRIES_URL)
-    if not data or not isinstance(data, list):
-        return {}
-    
-    translations = {}
-    for country in data:
-        alpha2 = country.get("alpha2")
-        if alpha2:
-            translations[alpha2] = {
-                "country_de": country.get("name", ""),
-                "capital_de": country.get("capital", ""),
-            }
-    
-    print(f"Loaded {len(translations)} German translations")
-    return translations
-
-
-def load_continent_mapping() -> Dict[str, str]:
-    """Load continent mapping from local file or fallback to URL."""
-    # Try local file first
-    try:
-        with open("data/continents.json", "r", encoding="utf-8") as f:
-            data = json.load(f)
-            print(f"Loaded continent mapping from local file")
-    except FileNotFoundError:
-        # Fallback to URL
-        data = fetch_json(CONTINENT_MAPPING_URL)
-        if not data:
-            return {}
-    
-    mapping = {}
-    for alpha2, continent in data.items():
-        # Only include valid continents (exclude Antarctica)
-        if continent in CONTINENT_MAP_EN_TO_DE:
-            mapping[alpha2] = continent
-    
-    print(f"Loaded {len(mapping)} continent mappings")
-    return mapping
-
-
-def generate_geo_json() -> List[Dict]:
-    """Generate the complete geo.json dataset."""
-    print("\n" + "="*60)
-    print("GeoTriad Data Generator")
-    print("="*60 + "\n")
-    
-    # Load all data sources
-    base_countries = load_base_countries()
-    german_translations = load_german_translations()
-    continent_mapping = load_continent_mapping()
-    
-    if not base_countries or not continent_mapping:
-        print("\n✗ Failed to load required data sources")
-        return []
-    
-    # Merge data
+def base_countries_source() -> GeoSource:
+    """English names, capitals, regions and flags (defines which countries exist)."""
+    return RemoteListSource(
+        "countries.json", COUNTRIES_JSON_URL,
+        {"country_en": "name", "capital_en": "capital", "region_en": "region",
+         "flag": ("emoji", "flag")},
+        timeout=SOURCE_TIMEOUTS[COUNTRIES_JSON_URL], retries=FETCH_RETRIES,
+    )
+
+
+def profile_sources(profile: str) -> List[GeoSource]:
+    """Sources for a profile, in precedence order. The first defines the countries."""
+    if profile == "remote":
+        german = RemoteListSource(
+            "world_countries/de", GERMAN_COUNTRIES_URL,
+            {"country_de": "name", "capital_de": "capital"},
+            timeout=SOURCE_TIMEOUTS[GERMAN_COUNTRIES_URL], retries=FETCH_RETRIES,
+        )
+    elif profile == "embedded":
+        german = TranslationTableSource("de")
+    else:
+        raise ValueError(f"Unknown profile {profile!r}")
+    continents = ContinentSource(CONTINENTS_PATH, CONTINENT_MAPPING_URL,
+                                 languages=LANGUAGES[1:],
+                                 timeout=SOURCE_TIMEOUTS[CONTINENT_MAPPING_URL])
+    extra = [TranslationTableSource(lang) for lang in EXTRA_LANGUAGES]
+    return [base_countries_source(), german, *extra, continents, TagSource(EXTRAORDINARY_TAGS)]
+
+
+# Shared HTTP cache, configured from the command line in main()
+http_cache: Optional[HttpCache] = None
+
+
+def load_all_sources(sources: List[GeoSource], workers: int = 3) -> List[Dict[str, Dict]]:
+    """Load all sources concurrently (workers=1 loads them one after another)."""
+    global http_cache
+    if http_cache is None:
+        http_cache = HttpCache()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda source: source.load(http_cache), sources))
+
+
+def merge_sources(sources: List[GeoSource], indexes: List[Dict[str, Dict]]) -> Tuple[List[Dict], Dict]:
+    """Join source indexes by alpha-2 code. Returns (entries, stats)."""
+    stats = {
+        "continents": {},
+        "tagged": 0,
+        "excluded": {},
+        "matched": {source.name: 0 for source in sources},
+    }
     result = []
-    excluded_count = 0
-    
-    for alpha2, base_data in base_countries.items():
-        # Get continent
-        continent_en = continent_mapping.get(alpha2)
-        if not continent_en:
-            excluded_count += 1
-            continue
-        
-        continent_de = CONTINENT_MAP_EN_TO_DE.get(continent_en)
-        if not continent_de:
-            excluded_count += 1
-            continue
-        
-        # Get German translations
-        german_data = german_translations.get(alpha2, {})
-        country_de = german_data.get("country_de", "")
-        capital_de = german_data.get("capital_de", "")
-        
-        # Check required fields
-        if not all([
-            base_data.get("country_en"),
-            country_de,
-            base_data.get("capital_en"),
-            capital_de,
-            continent_en,
-            continent_de
-        ]):
-            excluded_count += 1
+
+    for alpha2 in indexes[0]:
+        entry = {"id": alpha2}
+        for source, index in zip(sources, indexes):
+            row = index.get(alpha2)
+            if row is None:
+                continue
+            stats["matched"][source.name] += 1
+            for field, value in row.items():
+                if value and not entry.get(field):
+                    entry[field] = value
+
+        missing = next((field for field in REQUIRED_FIELDS if not entry.get(field)), None)
+        if missing:
+            stats["excluded"][missing] = stats["excluded"].get(missing, 0) + 1
             continue
-        
-        # Get tags (preserve any existing tags, add extraordinary tags)
-        tags = EXTRAORDINARY_TAGS.get(alpha2, [])
-        
-        # Build entry
-        entry = {
-            "id": alpha2,
-            "country_en": base_data["country_en"],
-            "country_de": country_de,
-            "continent_en": continent_en,
-            "continent_de": continent_de,
-            "region_en": base_data.get("region_en", ""),
-            "region_de": german_data.get("region_de", ""),
-            "capital_en": base_data["capital_en"],
-            "capital_de": capital_de,
-            "flag": base_data.get("flag", ""),
-            "tags": tags
-        }
-        
+
+        entry = {field: entry.get(field, [] if field == "tags" else "") for field in OUTPUT_FIELDS}
+        stats["continents"][entry["continent_en"]] = stats["continents"].get(entry["continent_en"], 0) + 1
+        if "extraordinary_name" in entry["tags"]:
+            stats["tagged"] += 1
         result.append(entry)
-    
+
     # Sort by country_en
     result.sort(key=lambda x: x["country_en"])
-    
+    return result, stats
+
+
+def print_stats(geo_data: List[Dict], stats: Dict):
+    """Print the summary collected by merge_sources()."""
+    excluded = sum(stats["excluded"].values())
     print(f"\n" + "="*60)
-    print(f"✓ Generated {len(result)} countries")
-    print(f"✗ Excluded {excluded_count} countries (missing required fields)")
+    print(f"✓ Generated {len(geo_data)} countries")
+    if excluded:
+        reasons = ", ".join(f"{count} no {field}" for field, count in sorted(stats["excluded"].items()))
+        print(f"✗ Excluded {excluded} countries ({reasons})")
     print("="*60 + "\n")
-    
-    return result
 
+    print("Source coverage:")
+    for name, count in stats["matched"].items():
+        print(f"  {name}: {count}")
 
-def main():
-    """Main entry point."""
-    geo_data = generate_geo_json()
-    
-    if not geo_data:
-        print("Failed to generate geo data")
-        return
-    
-    # Write to file
-    output_path = "data/geo.json"
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(geo_data, f, indent=2, ensure_ascii=False)
-    
-    print(f"✓ Successfully written to {output_path}")
-    
-    # Print some statistics
-    continents = {}
-    extraordinary_count = 0
-    for entry in geo_data:
-        continent = entry["continent_en"]
-        continents[continent] = continents.get(continent, 0) + 1
-        if entry.get("tags") and "extraordinary_name" in entry["tags"]:
-            extraordinary_count += 1
-    
     print("\nContinent distribution:")
-    for continent, count in sorted(continents.items()):
+    for continent, count in sorted(stats["continents"].items()):
         print(f"  {continent}: {count}")
-    
-    print(f"\nExtraordinary names tagged: {extraordinary_count}")
-    
+
+    print(f"\nExtraordinary names tagged: {stats['tagged']}")
+
     # Show a few examples
     print("\nExample entries:")
     for entry in geo_data[:3]:
-        print(f"  {entry['country_en']} ({entry['id']}) - {entry['capital_en']} - {entry['continent_en']}")
+        print(f"  {entry['flag']} {entry['country_en']} ({entry['id']}) - {entry['capital_en']} - {entry['continent_en']}")
+
+
+def generate_geo_json(workers: int = 3, profile: str = "remote", verbose: bool = True) -> List[Dict]:
+    """Generate the complete geo.json dataset."""
+    print("\n" + "="*60)
+    print(f"GeoTriad Data Generator ({profile})")
+    print("="*60 + "\n")
+
+    sources = profile_sources(profile)
+    # Wall time is roughly the slowest single source
+    indexes = load_all_sources(sources, workers)
+
+    if not indexes[0]:
+        print("\n✗ Failed to load required data sources")
+        return []
+
+    geo_data, stats = merge_sources(sources, indexes)
+    if verbose:
+        print_stats(geo_data, stats)
+    return geo_data
+
+
+def main():
+    """Main entry point."""
+    global http_cache
+    parser = argparse.ArgumentParser(description="Generate data/geo.json")
+    parser.add_argument("--profile", choices=["remote", "embedded"], default="remote",
+                        help="where German names come from (default: remote)")
+    add_cache_arguments(parser)
+    parser.add_argument("--workers", type=int, default=3,
+                        help="number of sources fetched in parallel (1 = sequential)")
+    args = parser.parse_args()
+    http_cache = cache_from_args(args)
+
+    geo_data = generate_geo_json(args.workers, args.profile)
+
+    if not geo_data:
+        print("Failed to generate geo data")
+        return
+
+    data = json.dumps(geo_data, indent=2, ensure_ascii=False).encode("utf-8")
+    if write_if_changed(OUTPUT_PATH, data):
+        print(f"\n✓ Successfully written to {OUTPUT_PATH.relative_to(DATA_DIR.parent)}")
+    else:
+        print(f"\n✓ {OUTPUT_PATH.relative_to(DATA_DIR.parent)} unchanged")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,167 @@
+"""
+GeoTriad Data Sources
+Source plugins for generate_geo_data.py.
+
+Every source has a name and a load(http_cache) method that returns its rows
+indexed by ISO 3166-1 alpha-2 code, already renamed to geo.json fields:
+
+    {"DE": {"country_de": "Deutschland", "capital_de": "Berlin"}, ...}
+
+The generator joins the indexes by code in a single pass; for each field
+the first source (in profile order) with a non-empty value wins.
+"""
+
+import json
+import urllib.error
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from http_cache import HttpCache
+
+DATA_DIR = Path(__file__).resolve().parent
+TRANSLATIONS_DIR = DATA_DIR / "translations"
+
+# Continent enum (strict) - Antarctica is excluded
+CONTINENTS = ("Africa", "Europe", "Asia", "North America", "South America", "Oceania")
+
+
+def fetch_json(url: str, http_cache: HttpCache, timeout: float = 30, retries: int = 2):
+    """Fetch JSON data from URL (through the local HTTP cache)."""
+    try:
+        print(f"Fetching data from {url}")
+        body = http_cache.get(url, timeout=timeout, retries=retries)
+        if body is None:
+            return None
+        data = json.loads(body.decode('utf-8'))
+        print(f"✓ Successfully fetched data")
+        return data
+    except (urllib.error.URLError, OSError) as e:
+        print(f"✗ Error fetching {url}: {e}")
+        return None
+    except json.JSONDecodeError as e:
+        print(f"✗ Error parsing JSON from {url}: {e}")
+        return None
+
+
+def table_languages() -> List[str]:
+    """Languages with an embedded table in translations/, e.g. ["de"]."""
+    return sorted(path.stem for path in TRANSLATIONS_DIR.glob("*.json"))
+
+
+def load_translation_table(lang: str) -> Dict:
+    """Embedded table translations/<lang>.json: {"continents": {...}, "countries": {...}}."""
+    with open(TRANSLATIONS_DIR / f"{lang}.json", "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class GeoSource:
+    """Base class: a named source of per-country fields."""
+
+    name = "source"
+
+    def load(self, http_cache: HttpCache) -> Dict[str, Dict]:
+        """Rows indexed by alpha-2 code."""
+        raise NotImplementedError
+
+
+class RemoteListSource(GeoSource):
+    """A remote JSON list of country objects with an "alpha2" key.
+
+    fields maps geo.json fields to source keys; a tuple of keys means
+    "first non-empty one", e.g. {"flag": ("emoji", "flag")}.
+    """
+
+    def __init__(self, name: str, url: str, fields: Dict[str, object],
+                 timeout: float = 30, retries: int = 2):
+        self.name = name
+        self.url = url
+        self.fields = fields
+        self.timeout = timeout
+        self.retries = retries
+
+    def load(self, http_cache: HttpCache) -> Dict[str, Dict]:
+        data = fetch_json(self.url, http_cache, self.timeout, self.retries)
+        if not isinstance(data, list):
+            return {}
+        rows = {}
+        for item in data:
+            alpha2 = item.get("alpha2")
+            if not alpha2:
+                continue
+            row = {}
+            for field, keys in self.fields.items():
+                for key in (keys if isinstance(keys, tuple) else (keys,)):
+                    if item.get(key):
+                        row[field] = item[key]
+                        break
+            rows[alpha2.upper()] = row
+        print(f"Loaded {len(rows)} rows from {self.name}")
+        return rows
+
+
+class ContinentSource(GeoSource):
+    """Continent per country from continents.json, or a remote copy of it.
+
+    Also fills continent_<lang> from each language's translation table.
+    """
+
+    name = "continents"
+
+    def __init__(self, path: Path, fallback_url: Optional[str] = None,
+                 languages: Tuple[str, ...] = ("de",), timeout: float = 15):
+        self.path = path
+        self.fallback_url = fallback_url
+        self.languages = languages
+        self.timeout = timeout
+
+    def load(self, http_cache: HttpCache) -> Dict[str, Dict]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            print(f"Loaded continent mapping from local file")
+        except FileNotFoundError:
+            data = fetch_json(self.fallback_url, http_cache, self.timeout) if self.fallback_url else None
+            if not data:
+                return {}
+
+        names = {lang: load_translation_table(lang).get("continents", {}) for lang in self.languages}
+        rows = {}
+        for alpha2, continent in data.items():
+            if continent not in CONTINENTS:
+                continue
+            row = {"continent_en": continent}
+            for lang, table in names.items():
+                row[f"continent_{lang}"] = table.get(continent, "")
+            rows[alpha2] = row
+        print(f"Loaded {len(rows)} continent mappings")
+        return rows
+
+
+class TranslationTableSource(GeoSource):
+    """Country and capital names from the embedded translations/<lang>.json."""
+
+    def __init__(self, lang: str):
+        self.lang = lang
+        self.name = f"translations/{lang}.json"
+
+    def load(self, http_cache: HttpCache) -> Dict[str, Dict]:
+        countries = load_translation_table(self.lang).get("countries", {})
+        rows = {
+            alpha2: {f"country_{self.lang}": names.get("country", ""),
+                     f"capital_{self.lang}": names.get("capital", "")}
+            for alpha2, names in countries.items()
+        }
+        print(f"Loaded {len(rows)} rows from {self.name}")
+        return rows
+
+
+class TagSource(GeoSource):
+    """Fixed tags per country, e.g. {"CH": ["extraordinary_name"]}."""
+
+    name = "tags"
+
+    def __init__(self, tags: Dict[str, list]):
+        self.tags = tags
+
+    def load(self, http_cache: HttpCache) -> Dict[str, Dict]:
+        return {alpha2: {"tags": list(tags)} for alpha2, tags in self.tags.items()}
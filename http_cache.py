@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Offline HTTP cache for the data generators.
+
+Responses are stored content-addressed (by SHA-256 of the body) under a cache
+directory, with a small JSON index mapping each URL to its object, validators
+(ETag / Last-Modified) and timestamps. Entries younger than the TTL are served
+without touching the network; older entries are revalidated with a
+conditional request. In offline mode only the cache is consulted.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Dict, Optional
+
+DEFAULT_CACHE_DIR = Path(
+    os.environ.get("SMALL_APPS_CACHE_DIR", Path(__file__).resolve().parent / ".cache" / "http")
+)
+DEFAULT_TTL = 24 * 60 * 60          # one day
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64 MiB
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF = 0.5               # seconds, doubled per retry
+
+
+class HttpCache:
+    """Size-bounded, content-addressed cache for HTTP GET responses."""
+
+    def __init__(self, cache_dir: Optional[Path] = None, ttl: float = DEFAULT_TTL,
+                 max_bytes: int = DEFAULT_MAX_BYTES, offline: bool = False,
+                 refresh: bool = False, mirror: Optional[str] = None,
+                 verbose: bool = True):
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+        self.objects_dir = self.cache_dir / "objects"
+        self.index_path = self.cache_dir / "index.json"
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.refresh = refresh
+        self.mirror = mirror.rstrip("/") if mirror else None
+        self.verbose = verbose
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.index = self._load_index()
+        # Cache hits only bump last_used; that is written on the next index
+        # change or at exit instead of rewriting the index for every hit
+        self.dirty = False
+        # Guards the index when sources are fetched from several threads
+        self.lock = threading.RLock()
+        atexit.register(self.flush)
+
+    # -------------------------------------------------------------------
+    # Index persistence
+    # -------------------------------------------------------------------
+    def _load_index(self) -> Dict[str, Dict]:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_index(self):
+        tmp_path = self.index_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+        self.dirty = False
+
+    def flush(self):
+        """Persist last_used updates from cache hits, if any."""
+        with self.lock:
+            if self.dirty:
+                self._save_index()
+
+    # -------------------------------------------------------------------
+    # Object store
+    # -------------------------------------------------------------------
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest
+
+    def _read_object(self, entry: Dict) -> Optional[bytes]:
+        try:
+            return self._object_path(entry["sha256"]).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _write_object(self, body: bytes) -> str:
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._object_path(digest)
+        if not path.exists():
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(body)
+            os.replace(tmp_path, path)
+        return digest
+
+    def _evict(self):
+        """Drop least recently used entries until the store fits max_bytes."""
+        sizes = {entry["sha256"]: entry["size"] for entry in self.index.values()}
+        total = sum(sizes.values())
+        for url, entry in sorted(self.index.items(), key=lambda item: item[1]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            del self.index[url]
+            if all(e["sha256"] != entry["sha256"] for e in self.index.values()):
+                total -= entry["size"]
+                self._object_path(entry["sha256"]).unlink(missing_ok=True)
+
+        # Remove objects no longer referenced by any URL. *.tmp files are
+        # skipped: they may be another process's write in flight.
+        referenced = {entry["sha256"] for entry in self.index.values()}
+        for path in self.objects_dir.iterdir():
+            if path.name not in referenced and path.suffix != ".tmp":
+                path.unlink(missing_ok=True)
+
+    # -------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------
+    def resolve(self, url: str) -> str:
+        """Map url onto the mirror (scheme dropped, host kept as first segment)."""
+        if not self.mirror:
+            return url
+        return f"{self.mirror}/{url.split('://', 1)[-1]}"
+
+    def get(self, url: str, timeout: float = 30, retries: int = DEFAULT_RETRIES,
+            backoff: float = DEFAULT_BACKOFF) -> Optional[bytes]:
+        """Return the body for url, from cache when fresh or unavailable online."""
+        now = time.time()
+        with self.lock:
+            entry = self.index.get(url)
+            cached = self._read_object(entry) if entry else None
+            if entry and cached is None:
+                del self.index[url]
+                self.dirty = True
+                entry = None
+
+            if entry and (self.offline or (not self.refresh and now - entry["fetched_at"] < self.ttl)):
+                entry["last_used"] = now
+                self.dirty = True
+                if self.verbose:
+                    print(f"✓ Cache hit for {url}")
+                return cached
+
+        if self.offline:
+            print(f"✗ Offline and no cached copy of {url}")
+            return None
+
+        request = urllib.request.Request(self.resolve(url))
+        if entry:
+            if entry.get("etag"):
+                request.add_header("If-None-Match", entry["etag"])
+            if entry.get("last_modified"):
+                request.add_header("If-Modified-Since", entry["last_modified"])
+
+        try:
+            body, headers = self._fetch(request, timeout, retries, backoff)
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and entry:
+                with self.lock:
+                    entry["fetched_at"] = entry["last_used"] = time.time()
+                    self._save_index()
+                if self.verbose:
+                    print(f"✓ Revalidated cached copy of {url}")
+                return cached
+            if entry:
+                print(f"✗ HTTP {e.code} for {url}, serving stale cached copy")
+                return cached
+            raise
+        except (urllib.error.URLError, TimeoutError, OSError):
+            if entry:
+                print(f"✗ Network error for {url}, serving stale cached copy")
+                return cached
+            raise
+
+        with self.lock:
+            now = time.time()
+            self.index[url] = {
+                "sha256": self._write_object(body),
+                "size": len(body),
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified"),
+                "fetched_at": now,
+                "last_used": now,
+            }
+            self._evict()
+            self._save_index()
+        return body
+
+    @staticmethod
+    def _fetch(request, timeout: float, retries: int, backoff: float):
+        """GET request, retrying network errors and 5xx with exponential backoff."""
+        for attempt in range(retries + 1):
+            try:
+                with urllib.request.urlopen(request, timeout=timeout) as response:
+                    return response.read(), response.headers
+            except urllib.error.HTTPError as e:
+                if e.code < 500 or attempt == retries:
+                    raise
+            except (urllib.error.URLError, TimeoutError, OSError):
+                if attempt == retries:
+                    raise
+            delay = backoff * 2 ** attempt
+            print(f"  retrying {request.full_url} in {delay:.1f}s")
+            time.sleep(delay)
+
+
+def add_cache_arguments(parser):
+    """Register the shared cache command line flags on an argparse parser."""
+    parser.add_argument("--offline", action="store_true",
+                        help="serve source data purely from the local HTTP cache")
+    parser.add_argument("--refresh", action="store_true",
+                        help="revalidate cached responses even if they are still fresh")
+    parser.add_argument("--cache-dir", type=Path, default=None,
+                        help=f"cache location (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--cache-ttl", type=float, default=DEFAULT_TTL,
+                        help="seconds before a cached response is revalidated")
+    parser.add_argument("--mirror", default=None,
+                        help="fetch sources from MIRROR/<host>/<path> instead (e.g. fixture_server.py)")
+
+
+def cache_from_args(args) -> HttpCache:
+    """Build an HttpCache from flags registered by add_cache_arguments()."""
+    return HttpCache(cache_dir=args.cache_dir, ttl=args.cache_ttl,
+                     offline=args.offline, refresh=args.refresh, mirror=args.mirror)
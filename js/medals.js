@@ -0,0 +1,78 @@
+// Event-driven medal evaluation shared by the games.
+//
+// The medal table is generated by build_artifacts.py from medals.py
+// (data/pokemon/medals.*.json, geotriad-game/data/geo.medals.json). Every
+// medal declares what it depends on: a counter reaching a threshold, or an
+// event such as identifying one Pokémon or answering a country with a tag.
+// The table's index lists, per counter, the medals sorted by threshold and,
+// per "<event>:<key>", the medals that event unlocks.
+//
+// counter(name, value) only looks past the last threshold reached for that
+// counter, and event(kind, key) only at the medals listed for it, so an
+// answer costs the same however many medals exist. Counters that drop (a
+// broken streak) simply do not move their position back: every medal below
+// it is already unlocked.
+
+function createMedalEngine(table, { unlocked = [], onUnlock = () => {} } = {}) {
+    const medals = table.medals;
+    const unlockedIds = new Set();
+    // Position in table.counters[name] of the lowest threshold not yet reached
+    const next = {};
+
+    function unlock(position, replay) {
+        const medal = medals[position];
+        if (unlockedIds.has(medal.id)) return;
+        unlockedIds.add(medal.id);
+        onUnlock(medal, replay);
+    }
+
+    function counter(name, value, replay = false) {
+        const positions = table.counters[name];
+        if (!positions) return;
+        let at = next[name];
+        while (at < positions.length && medals[positions[at]].atLeast <= value) {
+            unlock(positions[at], replay);
+            at++;
+        }
+        next[name] = at;
+    }
+
+    function event(kind, key) {
+        (table.events[`${kind}:${key}`] || []).forEach(position => unlock(position, false));
+    }
+
+    // Start over from a list of unlocked ids (after loading or resetting progress)
+    function reset(ids) {
+        unlockedIds.clear();
+        ids.forEach(id => unlockedIds.add(id));
+        Object.keys(table.counters).forEach(name => { next[name] = 0; });
+    }
+
+    // Unlock what the saved state already earns, e.g. medals added since the
+    // last visit; hasEvent(kind, key) answers for event medals. onUnlock()
+    // gets replay = true so the game can skip the announcement.
+    function sync(state, hasEvent = () => false) {
+        Object.keys(table.counters).forEach(name => counter(name, state[name] || 0, true));
+        Object.entries(table.events).forEach(([eventKey, positions]) => {
+            const split = eventKey.indexOf(':');
+            const kind = eventKey.slice(0, split);
+            const key = eventKey.slice(split + 1);
+            if (hasEvent(kind, key)) positions.forEach(position => unlock(position, true));
+        });
+    }
+
+    reset(unlocked);
+
+    return {
+        counter,
+        event,
+        reset,
+        sync,
+        medals,
+        isUnlocked: id => unlockedIds.has(id)
+    };
+}
+
+if (typeof module !== 'undefined') {
+    module.exports = { createMedalEngine };
+}
@@ -0,0 +1,156 @@
+// Typed-answer matching over a prebuilt bilingual name index (written by
+// build_artifacts.py from name_index.py: data/pokemon/names.*.json,
+// geotriad-game/data/geo.names.json).
+//
+// Per answer field the index holds the original names, their folded keys
+// (lowercase, no accents or umlauts, "ß" as "ss", letters and digits only),
+// the target each name belongs to (a Pokémon id or a country row) and a
+// trigram -> entries table over "$key$". suggest() counts shared trigrams
+// through that table instead of comparing against every name, so a
+// keystroke costs a few small posting lists even for thousands of names.
+// fold() must stay in step with name_index.fold().
+
+const FOLD_LETTERS = { 'ß': 'ss', 'æ': 'ae', 'œ': 'oe', 'ø': 'o', 'đ': 'd', 'ł': 'l', 'ı': 'i', 'þ': 'th', 'ð': 'd' };
+const MIN_SUGGEST_LENGTH = 2;
+const MATCH_CANDIDATES = 8;
+
+function foldName(text) {
+    return text.toLowerCase()
+        .normalize('NFD')
+        .replace(/\p{M}/gu, '')
+        .replace(/[ßæœøđłıþð]/g, char => FOLD_LETTERS[char])
+        .replace(/[^a-z0-9]+/g, '')
+        .replace(/([aou])e/g, '$1');
+}
+
+// Distinct trigrams of "$key$", or of "$key" for a prefix still being typed
+function nameTrigrams(key, complete = true) {
+    const padded = complete ? `$${key}$` : `$${key}`;
+    const grams = new Set();
+    for (let i = 0; i + 3 <= padded.length; i++) {
+        grams.add(padded.slice(i, i + 3));
+    }
+    return [...grams];
+}
+
+// Edits allowed when matching a finished answer of this length
+function typoTolerance(key) {
+    if (key.length <= 3) return 0;
+    if (key.length <= 6) return 1;
+    if (key.length <= 10) return 2;
+    return 3;
+}
+
+// Optimal string alignment distance (adjacent swaps count once), capped at limit + 1
+function editDistance(a, b, limit) {
+    if (Math.abs(a.length - b.length) > limit) return limit + 1;
+    let before = null;
+    let previous = Array.from({ length: b.length + 1 }, (_, j) => j);
+    for (let i = 1; i <= a.length; i++) {
+        const current = [i];
+        let rowMin = i;
+        for (let j = 1; j <= b.length; j++) {
+            let value = Math.min(previous[j] + 1, current[j - 1] + 1,
+                previous[j - 1] + (a[i - 1] === b[j - 1] ? 0 : 1));
+            if (before && i > 1 && j > 1 && a[i - 1] === b[j - 2] && a[i - 2] === b[j - 1]) {
+                value = Math.min(value, before[j - 2] + 1);
+            }
+            current.push(value);
+            rowMin = Math.min(rowMin, value);
+        }
+        if (rowMin > limit) return limit + 1;
+        before = previous;
+        previous = current;
+    }
+    return previous[b.length];
+}
+
+function createNameIndex(index) {
+    // Folded key -> entries with that key, per field
+    const exact = {};
+    Object.entries(index).forEach(([field, data]) => {
+        const byKey = new Map();
+        data.keys.forEach((key, entry) => {
+            if (!byKey.has(key)) byKey.set(key, []);
+            byKey.get(key).push(entry);
+        });
+        exact[field] = byKey;
+    });
+
+    function shared(field, grams) {
+        const postings = index[field].grams;
+        const counts = new Map();
+        grams.forEach(gram => {
+            (postings[gram] || []).forEach(entry => counts.set(entry, (counts.get(entry) || 0) + 1));
+        });
+        return counts;
+    }
+
+    // Ranked completions [{ target, name, key }]: exact key, then keys
+    // starting with the input, then the most trigrams in common
+    function suggest(field, text, limit = 5) {
+        const key = foldName(text);
+        if (key.length < MIN_SUGGEST_LENGTH) return [];
+        const data = index[field];
+        const grams = nameTrigrams(key, false);
+        const counts = shared(field, grams);
+        const ranked = [...counts.keys()].map(entry => {
+            const candidate = data.keys[entry];
+            return {
+                entry,
+                exact: candidate === key ? 0 : 1,
+                prefix: candidate.startsWith(key) ? 0 : 1,
+                similarity: 2 * counts.get(entry) / (grams.length + candidate.length),
+                length: candidate.length
+            };
+        }).sort((a, b) => a.exact - b.exact || a.prefix - b.prefix ||
+            b.similarity - a.similarity || a.length - b.length || a.entry - b.entry);
+
+        const suggestions = [];
+        const seen = new Set();
+        for (const { entry } of ranked) {
+            const target = data.targets[entry];
+            const candidate = data.keys[entry];
+            if (seen.has(target) || seen.has(candidate)) continue;
+            seen.add(target);
+            seen.add(candidate);
+            suggestions.push({ target, name: data.names[entry], key: candidate });
+            if (suggestions.length === limit) break;
+        }
+        return suggestions;
+    }
+
+    // Targets a finished answer may mean (closest keys only; several when
+    // names collide, e.g. the two countries called "Congo"), or []
+    function match(field, text) {
+        const key = foldName(text);
+        if (!key) return [];
+        const data = index[field];
+        let entries = exact[field].get(key);
+        if (!entries) {
+            entries = [];
+            let best = typoTolerance(key);
+            if (best === 0) return [];
+            const counts = shared(field, nameTrigrams(key));
+            // Only entries with the most trigrams in common are worth an edit distance
+            const candidates = [...counts.keys()]
+                .sort((a, b) => counts.get(b) - counts.get(a) || a - b)
+                .slice(0, MATCH_CANDIDATES);
+            candidates.forEach(entry => {
+                const distance = editDistance(key, data.keys[entry], best);
+                if (distance < best) {
+                    best = distance;
+                    entries = [];
+                }
+                if (distance === best) entries.push(entry);
+            });
+        }
+        return [...new Set(entries.map(entry => data.targets[entry]))];
+    }
+
+    return { suggest, match, fields: Object.keys(index) };
+}
+
+if (typeof module !== 'undefined') {
+    module.exports = { createNameIndex, foldName, editDistance };
+}
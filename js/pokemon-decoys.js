@@ -0,0 +1,43 @@
+// Hard-mode decoys from the prebuilt neighbor table (data/pokemon/decoys.*.json,
+// written by build_artifacts.py from pokemon_decoys.py).
+//
+// For every Pokémon the table lists its k most confusable others (shared
+// types, color, shape, similar English or German names), most confusable
+// first. draw() picks distinct decoys from a band of those ranks, e.g. the
+// top 4 for the hardest questions, by rejection over a handful of random
+// positions: O(count), however large the dataset is.
+
+function createDecoyTable(table) {
+    const k = table.k;
+    const neighbors = Uint32Array.from(table.neighbors);
+    const rows = new Map();
+    table.ids.forEach((id, row) => rows.set(id, row));
+
+    // Neighbor ids of a Pokémon, most confusable first (empty if unknown)
+    function neighborsOf(id) {
+        const row = rows.get(id);
+        if (row === undefined) return neighbors.subarray(0, 0);
+        return neighbors.subarray(row * k, (row + 1) * k);
+    }
+
+    // Up to `count` distinct neighbor ids ranked in [from, to), skipping ids
+    // isAvailable() rejects (e.g. Pokémon whose shard has not arrived yet)
+    function draw(id, count, [from, to] = [0, k], isAvailable = () => true) {
+        const band = neighborsOf(id).subarray(from, to);
+        const chosen = [];
+        const tried = new Set();
+        while (chosen.length < count && tried.size < band.length) {
+            const candidate = band[Math.floor(Math.random() * band.length)];
+            if (tried.has(candidate)) continue;
+            tried.add(candidate);
+            if (isAvailable(candidate)) chosen.push(candidate);
+        }
+        return chosen;
+    }
+
+    return { k, neighborsOf, draw };
+}
+
+if (typeof module !== 'undefined') {
+    module.exports = { createDecoyTable };
+}
@@ -0,0 +1,98 @@
+// Attribute queries over the prebuilt Pokémon index (data/pokemon/index.*.json,
+// written by build_artifacts.py from pokemon_index.py).
+//
+// The index holds every id in dataset order; per attribute (type, habitat,
+// color, shape, generation, region) the ids of every Pokémon with each value;
+// and for heightDm and weightHg all ids sorted by value. where() walks only the shortest matching
+// id list and checks the others through Sets built on first use, so
+// "only Water types from Johto" costs O(result) rather than a full scan.
+// between() is a binary search over the sorted arrays and heaviest() a
+// lookup per candidate.
+
+function createPokemonIndex(index) {
+    const sets = new Map();
+    const valueById = {};
+
+    function ids(field, value) {
+        const postings = index.fields[field] || {};
+        if (Array.isArray(value)) {
+            const merged = new Set();
+            value.forEach(item => (postings[item] || []).forEach(id => merged.add(id)));
+            return [...merged];
+        }
+        return postings[value] || [];
+    }
+
+    function idSet(field, value) {
+        const key = field + '\u0000' + (Array.isArray(value) ? [...value].sort().join('\u0000') : value);
+        let set = sets.get(key);
+        if (!set) {
+            set = new Set(ids(field, value));
+            sets.set(key, set);
+        }
+        return set;
+    }
+
+    // filters: { type: 'Water', region: 'Johto' }; an array value means "any of"
+    function where(filters) {
+        const entries = Object.entries(filters);
+        // No filters match everything, like pokemon_index.py
+        if (entries.length === 0) return index.ids.slice();
+        const lists = entries
+            .map(([field, value]) => ({ field, value, ids: ids(field, value) }))
+            .sort((a, b) => a.ids.length - b.ids.length);
+        const others = lists.slice(1).map(entry => idSet(entry.field, entry.value));
+        return lists[0].ids.filter(id => others.every(set => set.has(id)));
+    }
+
+    function lowerBound(values, target) {
+        let low = 0;
+        let high = values.length;
+        while (low < high) {
+            const middle = (low + high) >> 1;
+            if (values[middle] < target) low = middle + 1;
+            else high = middle;
+        }
+        return low;
+    }
+
+    // Ids with min <= field <= max (either bound may be null), ascending by value
+    function between(field, min, max) {
+        const { ids: sortedIds, values } = index.sorted[field];
+        const start = min == null ? 0 : lowerBound(values, min);
+        const end = max == null ? values.length : lowerBound(values, max + 1);
+        return sortedIds.slice(start, end);
+    }
+
+    function value(field, id) {
+        if (!valueById[field]) {
+            const map = new Map();
+            const { ids: sortedIds, values } = index.sorted[field];
+            sortedIds.forEach((sortedId, i) => map.set(sortedId, values[i]));
+            valueById[field] = map;
+        }
+        return valueById[field].get(id);
+    }
+
+    // Id with the largest value among candidates, e.g. "heaviest of three"
+    function heaviest(candidates, field = 'weightHg') {
+        let best = null;
+        candidates.forEach(id => {
+            if (best === null || value(field, id) > value(field, best)) best = id;
+        });
+        return best;
+    }
+
+    return {
+        ids,
+        where,
+        between,
+        value,
+        heaviest,
+        values: field => Object.keys(index.fields[field] || {})
+    };
+}
+
+if (typeof module !== 'undefined') {
+    module.exports = { createPokemonIndex };
+}
@@ -0,0 +1,201 @@
+// Batched game-progress persistence shared by the games.
+//
+// createBatchedWriter() turns "something changed" into one write a little
+// later: the first request waits `delay` ms so answers in quick succession
+// share a write, then runs in an idle callback (where supported) so the
+// write never lands in the middle of an animation. Every pending write is
+// flushed at once when the page is hidden or unloaded, which on mobile may
+// be the last chance to run.
+//
+// createProgressStore() saves a game's state object with it. Instead of the
+// whole object it writes a delta: the top-level fields that changed since
+// the last write, merged into `<key>.delta` next to the full snapshot in
+// `<key>`. The snapshot is rewritten only once the delta has grown to half
+// its size or a field was removed. Older keys are migrated on load.
+//
+// Both keep write statistics (count, bytes, duration) in `stats`, and a
+// write over WRITE_BUDGET_MS is logged.
+
+const WRITE_BUDGET_MS = 8;
+const pendingWriters = new Set();
+
+function flushPendingWrites() {
+    [...pendingWriters].forEach(writer => writer.flush());
+}
+
+if (typeof document !== 'undefined') {
+    document.addEventListener('visibilitychange', () => {
+        if (document.visibilityState === 'hidden') flushPendingWrites();
+    });
+}
+if (typeof window !== 'undefined') {
+    window.addEventListener('pagehide', flushPendingWrites);
+}
+
+function createBatchedWriter(write, { delay = 1000, name = 'write', onWrite = null } = {}) {
+    const stats = { writes: 0, totalMs: 0, maxMs: 0, lastMs: 0 };
+    let timer = null;
+    let idle = null;
+
+    function cancel() {
+        clearTimeout(timer);
+        timer = null;
+        if (idle !== null && typeof cancelIdleCallback === 'function') cancelIdleCallback(idle);
+        idle = null;
+        pendingWriters.delete(writer);
+    }
+
+    function flush() {
+        if (!pendingWriters.has(writer)) return;
+        cancel();
+        const start = performance.now();
+        try {
+            write();
+        } catch (error) {
+            console.error(`Error in ${name}:`, error);
+        }
+        const elapsed = performance.now() - start;
+        stats.writes++;
+        stats.totalMs += elapsed;
+        stats.lastMs = elapsed;
+        stats.maxMs = Math.max(stats.maxMs, elapsed);
+        if (onWrite) onWrite(elapsed);
+        if (elapsed > WRITE_BUDGET_MS) {
+            console.warn(`${name} took ${elapsed.toFixed(1)} ms`);
+        }
+    }
+
+    function request() {
+        if (pendingWriters.has(writer)) return;
+        pendingWriters.add(writer);
+        timer = setTimeout(() => {
+            timer = null;
+            if (typeof requestIdleCallback === 'function') {
+                idle = requestIdleCallback(flush, { timeout: delay });
+            } else {
+                flush();
+            }
+        }, delay);
+    }
+
+    const writer = {
+        request,
+        flush,
+        cancel,
+        stats,
+        get pending() { return pendingWriters.has(writer); }
+    };
+    return writer;
+}
+
+// legacyKeys: [{ key, upgrade(state) }], newest first; the first one found is
+// upgraded (upgrade is optional), saved under `key` and removed. onWrite(ms)
+// is called after every write (see js/timings.js).
+function createProgressStore(key, { legacyKeys = [], delay = 1000, onWrite = null } = {}) {
+    const deltaKey = `${key}.delta`;
+    // Serialized value of every field as last written
+    let written = new Map();
+    let snapshotBytes = 0;
+    let delta = {};
+    let deltaBytes = 0;
+    let current = null;
+    const writer = createBatchedWriter(write, { delay, name: `Saving ${key}`, onWrite });
+    writer.stats.bytes = 0;
+
+    function setItem(itemKey, value) {
+        localStorage.setItem(itemKey, value);
+        writer.stats.bytes += value.length;
+    }
+
+    function remember(state) {
+        written = new Map(Object.entries(state).map(([field, value]) => [field, JSON.stringify(value)]));
+    }
+
+    function writeSnapshot(state) {
+        const json = JSON.stringify(state);
+        setItem(key, json);
+        localStorage.removeItem(deltaKey);
+        snapshotBytes = json.length;
+        delta = {};
+        deltaBytes = 0;
+        remember(state);
+    }
+
+    function write() {
+        const state = current;
+        const changed = new Map();
+        Object.entries(state).forEach(([field, value]) => {
+            const json = JSON.stringify(value);
+            if (written.get(field) !== json) changed.set(field, json);
+        });
+        const removed = [...written.keys()].some(field => !(field in state));
+        if (removed) {
+            writeSnapshot(state);
+            return;
+        }
+        if (changed.size === 0) return;
+        const nextDelta = { ...delta };
+        changed.forEach((_, field) => { nextDelta[field] = state[field]; });
+        const json = JSON.stringify(nextDelta);
+        if (json.length * 2 > snapshotBytes) {
+            writeSnapshot(state);
+            return;
+        }
+        setItem(deltaKey, json);
+        delta = nextDelta;
+        deltaBytes = json.length;
+        changed.forEach((fieldJson, field) => written.set(field, fieldJson));
+    }
+
+    function readJSON(itemKey) {
+        const saved = localStorage.getItem(itemKey);
+        return saved === null ? null : JSON.parse(saved);
+    }
+
+    // Saved state (snapshot plus delta), or null when nothing was saved
+    function load() {
+        try {
+            const snapshot = readJSON(key);
+            if (snapshot !== null) {
+                snapshotBytes = localStorage.getItem(key).length;
+                delta = readJSON(deltaKey) || {};
+                deltaBytes = JSON.stringify(delta).length;
+                const state = { ...snapshot, ...delta };
+                remember(state);
+                return state;
+            }
+            for (const legacy of legacyKeys) {
+                const old = readJSON(legacy.key);
+                if (old === null) continue;
+                const state = legacy.upgrade ? legacy.upgrade(old) : old;
+                writeSnapshot(state);
+                legacyKeys.forEach(({ key: oldKey }) => localStorage.removeItem(oldKey));
+                return state;
+            }
+        } catch (error) {
+            console.error('Error loading progress:', error);
+        }
+        return null;
+    }
+
+    return {
+        load,
+        // Remember the latest state and write its changes soon
+        save(state) {
+            current = state;
+            writer.request();
+        },
+        // Write now, e.g. after a reset
+        flush() {
+            writer.flush();
+        },
+        stats: writer.stats,
+        get sizes() {
+            return { snapshot: snapshotBytes, delta: deltaBytes };
+        }
+    };
+}
+
+if (typeof module !== 'undefined') {
+    module.exports = { createBatchedWriter, createProgressStore, flushPendingWrites };
+}
@@ -0,0 +1,145 @@
+// Recency-aware random sampler shared by the games.
+//
+// draw() returns a uniformly random item that was not among the last
+// `recentLimit` draws, in O(1): the items array is kept partitioned into an
+// eligible prefix [0, available) and a recent suffix [available, length).
+// Drawing swaps the chosen item to the front of the suffix; when the recent
+// ring buffer overflows, its oldest item is swapped back into the prefix.
+// sample() picks distinct items by rejection, which is O(count) as long as
+// count is small compared to the pool (e.g. two decoys out of hundreds).
+//
+// sampleDistinct() and shuffle() are the same ideas for plain arrays.
+
+function createSampler(items, { recentLimit = 10, keyOf = item => item } = {}) {
+    const pool = [];
+    const positions = new Map();
+    let available = 0;
+
+    // Recent keys in draw order, as a ring buffer (one spare slot for overflow)
+    const ring = new Array(recentLimit + 1);
+    let ringStart = 0;
+    let ringSize = 0;
+
+    function swap(i, j) {
+        if (i === j) return;
+        const a = pool[i];
+        const b = pool[j];
+        pool[i] = b;
+        pool[j] = a;
+        positions.set(keyOf(b), i);
+        positions.set(keyOf(a), j);
+    }
+
+    // Never hold back the whole pool, or there would be nothing to draw
+    function effectiveLimit() {
+        return Math.min(recentLimit, pool.length - 1);
+    }
+
+    function releaseOldest() {
+        const key = ring[ringStart];
+        ring[ringStart] = undefined;
+        ringStart = (ringStart + 1) % ring.length;
+        ringSize--;
+        const index = positions.get(key);
+        if (index !== undefined && index >= available) {
+            swap(index, available);
+            available++;
+        }
+    }
+
+    function markRecent(key) {
+        const index = positions.get(key);
+        if (index === undefined || index >= available) return;
+        swap(index, available - 1);
+        available--;
+        ring[(ringStart + ringSize) % ring.length] = key;
+        ringSize++;
+        while (ringSize > effectiveLimit()) {
+            releaseOldest();
+        }
+    }
+
+    function add(newItems) {
+        for (const item of newItems) {
+            const key = keyOf(item);
+            if (positions.has(key)) continue;
+            pool.push(item);
+            positions.set(key, pool.length - 1);
+            // New items are eligible: move them in front of the recent suffix
+            swap(pool.length - 1, available);
+            available++;
+        }
+    }
+
+    function draw() {
+        if (pool.length === 0) return undefined;
+        const item = pool[Math.floor(Math.random() * available)];
+        markRecent(keyOf(item));
+        return item;
+    }
+
+    function sample(count, excludeKeys = []) {
+        const chosen = [];
+        // A plain array beats a Set for the handful of keys involved here
+        const seen = excludeKeys.filter(key => positions.has(key));
+        const limit = Math.min(count, pool.length - seen.length);
+        while (chosen.length < limit) {
+            const item = pool[Math.floor(Math.random() * pool.length)];
+            const key = keyOf(item);
+            if (seen.includes(key)) continue;
+            seen.push(key);
+            chosen.push(item);
+        }
+        return chosen;
+    }
+
+    function recent() {
+        const keys = [];
+        for (let i = 0; i < ringSize; i++) {
+            keys.push(ring[(ringStart + i) % ring.length]);
+        }
+        return keys;
+    }
+
+    add(items);
+
+    return {
+        add,
+        draw,
+        sample,
+        markRecent,
+        recent,
+        get size() { return pool.length; }
+    };
+}
+
+// Pick up to `count` distinct random items, skipping those isExcluded() rejects.
+// Expected O(count) when few items are excluded; never copies the array.
+function sampleDistinct(items, count, isExcluded = () => false) {
+    const chosen = [];
+    const tried = new Set();
+    while (chosen.length < count && tried.size < items.length) {
+        const index = Math.floor(Math.random() * items.length);
+        if (tried.has(index)) continue;
+        tried.add(index);
+        if (!isExcluded(items[index])) {
+            chosen.push(items[index]);
+        }
+    }
+    return chosen;
+}
+
+// Unbiased in-place Fisher-Yates shuffle (unlike sort(() => Math.random() - 0.5))
+function shuffle(items) {
+    for (let i = items.length - 1; i > 0; i--) {
+        const j = Math.floor(Math.random() * (i + 1));
+        const tmp = items[i];
+        items[i] = items[j];
+        items[j] = tmp;
+    }
+    return items;
+}
+
+if (typeof module !== 'undefined') {
+    module.exports = { createSampler, sampleDistinct, shuffle };
+}
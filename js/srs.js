@@ -0,0 +1,302 @@
+// Leitner-style spaced repetition for the games' questions.
+//
+// Every item (a Pokémon id, a country, ...) that has been asked gets a slot
+// in a set of parallel typed arrays: its box, when it is next due, how often
+// it was asked and answered correctly, and flags. A correct answer moves the
+// item up one box, a wrong one back to box 1; each box has a fixed interval
+// (BOX_INTERVALS), from a minute up to three weeks. Items the player gets
+// right the first time start in KNOWN_BOX.
+//
+// Because every item in a box waits the same interval, items enter a box in
+// due order. Each box is therefore a FIFO queue that is already sorted, and
+// the earliest due item overall is the earliest of the box heads: a bucket
+// priority queue where nextDue() and answer() are O(1) (amortized) however
+// many items there are. An item that moves leaves a stale entry behind in
+// its old queue, recognized by its sequence number and dropped when it
+// reaches the head.
+//
+// Changed slots are remembered as dirty; takeDirty() hands them to the store
+// (see openScheduleStore) so persistence writes only what changed.
+
+const MINUTE = 60 * 1000;
+const DAY = 24 * 60 * MINUTE;
+// Waiting time per box; box 0 means "never asked"
+const BOX_INTERVALS = [0, MINUTE, 10 * MINUTE, 60 * MINUTE, DAY, 3 * DAY, 7 * DAY, 21 * DAY];
+const TOP_BOX = BOX_INTERVALS.length - 1;
+// A new item answered correctly right away is likely known: start it in the hour box
+const KNOWN_BOX = 3;
+
+// Live entries nextDue() looks at per box when earlier ones are excluded;
+// covers the games' ten recently shown items
+const EXCLUDED_LOOKAHEAD = 16;
+
+const FLAG_IDENTIFIED = 1;
+const FLAG_DIRTY = 2;
+
+// Growable FIFO of (slot, sequence) pairs backed by an Int32Array
+function createSlotQueue() {
+    let buffer = new Int32Array(32);
+    let head = 0;
+    let tail = 0;
+
+    function push(slot, sequence) {
+        if (tail + 2 > buffer.length) {
+            const live = tail - head;
+            // Compact in place when at least half the buffer is consumed, else grow
+            const next = live * 2 <= buffer.length ? buffer : new Int32Array(buffer.length * 2);
+            next.set(buffer.subarray(head, tail));
+            buffer = next;
+            head = 0;
+            tail = live;
+        }
+        buffer[tail++] = slot;
+        buffer[tail++] = sequence;
+    }
+
+    return {
+        push,
+        get empty() { return head === tail; },
+        get length() { return (tail - head) / 2; },
+        get slot() { return buffer[head]; },
+        get sequence() { return buffer[head + 1]; },
+        slotAt(index) { return buffer[head + index * 2]; },
+        sequenceAt(index) { return buffer[head + index * 2 + 1]; },
+        shift() { head += 2; },
+        clear() { head = tail = 0; }
+    };
+}
+
+function createScheduler(capacity = 256) {
+    const slots = new Map();
+    let size = 0;
+    let ids, box, due, asked, correct, flags, sequence;
+    const queues = BOX_INTERVALS.map(() => createSlotQueue());
+    const dirty = [];
+
+    function allocate(count) {
+        const grow = (Type, old) => {
+            const next = new Type(count);
+            if (old) next.set(old.subarray(0, size));
+            return next;
+        };
+        ids = grow(Int32Array, ids);
+        box = grow(Uint8Array, box);
+        due = grow(Float64Array, due);
+        asked = grow(Uint16Array, asked);
+        correct = grow(Uint16Array, correct);
+        flags = grow(Uint8Array, flags);
+        sequence = grow(Uint32Array, sequence);
+    }
+    allocate(capacity);
+
+    function slotOf(id) {
+        let slot = slots.get(id);
+        if (slot === undefined) {
+            if (size === ids.length) allocate(ids.length * 2);
+            slot = size++;
+            slots.set(id, slot);
+            ids[slot] = id;
+        }
+        return slot;
+    }
+
+    function markDirty(slot) {
+        if (!(flags[slot] & FLAG_DIRTY)) {
+            flags[slot] |= FLAG_DIRTY;
+            dirty.push(slot);
+        }
+    }
+
+    function enqueue(slot) {
+        sequence[slot]++;
+        if (box[slot] > 0) queues[box[slot]].push(slot, sequence[slot]);
+    }
+
+    // Head of a box queue, dropping entries left behind by moved items
+    function head(queue) {
+        while (!queue.empty && sequence[queue.slot] !== queue.sequence) {
+            queue.shift();
+        }
+        return queue.empty ? -1 : queue.slot;
+    }
+
+    // Record an answer; O(1)
+    function answer(id, isCorrect, now = Date.now()) {
+        const slot = slotOf(id);
+        if (!isCorrect) {
+            box[slot] = 1;
+        } else {
+            box[slot] = box[slot] === 0 ? KNOWN_BOX : Math.min(box[slot] + 1, TOP_BOX);
+        }
+        due[slot] = now + BOX_INTERVALS[box[slot]];
+        asked[slot] = Math.min(asked[slot] + 1, 0xffff);
+        if (isCorrect) {
+            correct[slot] = Math.min(correct[slot] + 1, 0xffff);
+            flags[slot] |= FLAG_IDENTIFIED;
+        }
+        enqueue(slot);
+        markDirty(slot);
+    }
+
+    // Earliest live slot of a box due by `now` and not excluded, or -1.
+    // Entries are in due order, so the walk stops at the first one not due,
+    // and after EXCLUDED_LOOKAHEAD excluded ones.
+    function firstDue(queue, now, isExcluded) {
+        if (head(queue) === -1) return -1;
+        let excluded = 0;
+        for (let index = 0; index < queue.length; index++) {
+            const slot = queue.slotAt(index);
+            if (sequence[slot] !== queue.sequenceAt(index)) continue;
+            if (due[slot] > now) return -1;
+            if (!isExcluded(ids[slot])) return slot;
+            if (++excluded === EXCLUDED_LOOKAHEAD) return -1;
+        }
+        return -1;
+    }
+
+    // Id of the earliest item due by `now`, or null. Looks at the front of
+    // each box (O(number of boxes)); items rejected by isExcluded(id), e.g.
+    // because they were just asked, are passed over for the ones behind them.
+    function nextDue(now = Date.now(), isExcluded = () => false) {
+        let best = -1;
+        for (let b = 1; b <= TOP_BOX; b++) {
+            const slot = firstDue(queues[b], now, isExcluded);
+            if (slot !== -1 && (best === -1 || due[slot] < due[best])) best = slot;
+        }
+        return best === -1 ? null : ids[best];
+    }
+
+    function state(id) {
+        const slot = slots.get(id);
+        if (slot === undefined) return null;
+        return {
+            id,
+            box: box[slot],
+            due: due[slot],
+            asked: asked[slot],
+            correct: correct[slot],
+            identified: (flags[slot] & FLAG_IDENTIFIED) !== 0
+        };
+    }
+
+    // Restore saved records (state() objects), e.g. from openScheduleStore().load().
+    // Records are queued in due order so every box queue stays sorted.
+    function load(records) {
+        [...records].sort((a, b) => a.due - b.due).forEach(record => {
+            const slot = slotOf(record.id);
+            box[slot] = Math.min(record.box || 0, TOP_BOX);
+            due[slot] = record.due || 0;
+            asked[slot] = record.asked || 0;
+            correct[slot] = record.correct || 0;
+            flags[slot] = (flags[slot] & FLAG_DIRTY) | (record.identified ? FLAG_IDENTIFIED : 0);
+            enqueue(slot);
+        });
+    }
+
+    // Mark ids as identified without scheduling them (used for migrations)
+    function markIdentified(id) {
+        const slot = slotOf(id);
+        if (!(flags[slot] & FLAG_IDENTIFIED)) {
+            flags[slot] |= FLAG_IDENTIFIED;
+            markDirty(slot);
+        }
+    }
+
+    // Records changed since the last call, for an incremental write
+    function takeDirty() {
+        const records = dirty.map(slot => {
+            flags[slot] &= ~FLAG_DIRTY;
+            return state(ids[slot]);
+        });
+        dirty.length = 0;
+        return records;
+    }
+
+    function clear() {
+        slots.clear();
+        size = 0;
+        dirty.length = 0;
+        queues.forEach(queue => queue.clear());
+        allocate(capacity);
+    }
+
+    return {
+        answer,
+        nextDue,
+        state,
+        load,
+        markIdentified,
+        takeDirty,
+        clear,
+        isIdentified: id => {
+            const slot = slots.get(id);
+            return slot !== undefined && (flags[slot] & FLAG_IDENTIFIED) !== 0;
+        },
+        has: id => slots.has(id),
+        get size() { return size; },
+        get pendingWrites() { return dirty.length; }
+    };
+}
+
+// Per-game IndexedDB store of scheduler records, keyed by item id. save()
+// writes one batch in a single transaction. Without IndexedDB (old browsers,
+// some private modes) records are kept in localStorage under `<name>.srs.v1`.
+function openScheduleStore(name) {
+    const STORE = 'items';
+    const fallbackKey = `${name}.srs.v1`;
+    const database = typeof indexedDB === 'undefined' ? Promise.resolve(null) : new Promise(resolve => {
+        const request = indexedDB.open(`${name}.srs`, 1);
+        request.onupgradeneeded = () => request.result.createObjectStore(STORE, { keyPath: 'id' });
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => resolve(null);
+    });
+
+    function transaction(db, mode, work) {
+        return new Promise((resolve, reject) => {
+            const tx = db.transaction(STORE, mode);
+            const result = work(tx.objectStore(STORE));
+            tx.oncomplete = () => resolve(result && result.result);
+            tx.onerror = () => reject(tx.error);
+            tx.onabort = () => reject(tx.error);
+        });
+    }
+
+    function readFallback() {
+        try {
+            return JSON.parse(localStorage.getItem(fallbackKey)) || {};
+        } catch (error) {
+            return {};
+        }
+    }
+
+    return {
+        async load() {
+            const db = await database;
+            if (!db) return Object.values(readFallback());
+            return transaction(db, 'readonly', store => store.getAll());
+        },
+        async save(records) {
+            if (records.length === 0) return;
+            const db = await database;
+            if (!db) {
+                const saved = readFallback();
+                records.forEach(record => { saved[record.id] = record; });
+                localStorage.setItem(fallbackKey, JSON.stringify(saved));
+                return;
+            }
+            await transaction(db, 'readwrite', store => records.forEach(record => store.put(record)));
+        },
+        async clear() {
+            const db = await database;
+            if (!db) {
+                localStorage.removeItem(fallbackKey);
+                return;
+            }
+            await transaction(db, 'readwrite', store => store.clear());
+        }
+    };
+}
+
+if (typeof module !== 'undefined') {
+    module.exports = { createScheduler, openScheduleStore, BOX_INTERVALS };
+}
@@ -0,0 +1,199 @@
+// Opt-in performance instrumentation shared by the games.
+//
+// createTimings(game) records how long each stage of a round takes (data
+// loading, option generation, rendering, answering, saving, ...) with the
+// User Timing API, so the stages show up as `<game>:<stage>` in the browser's
+// performance panel, and keeps the durations for a small debug overlay with
+// rolling p50/p95 per stage and an NDJSON export of every sample.
+//
+// It is off unless the page is opened with `?perf` (remembered in
+// localStorage; `?perf=0` turns it off again). Disabled, wrap() returns the
+// function it was given and record()/mark() return at once, so the games
+// pay nothing for it. Enabled, the overlay toggles with the ` key, and
+// `timings.exportNdjson()` in the console returns the samples.
+
+const TIMINGS_ENABLED_KEY = 'perf.enabled';
+const TIMINGS_WINDOW = 100;
+const TIMINGS_LOG_LIMIT = 5000;
+
+function timingsEnabled() {
+    try {
+        const params = new URLSearchParams(typeof location === 'undefined' ? '' : location.search);
+        if (params.has('perf')) {
+            const on = params.get('perf') !== '0';
+            if (on) localStorage.setItem(TIMINGS_ENABLED_KEY, '1'); else localStorage.removeItem(TIMINGS_ENABLED_KEY);
+            return on;
+        }
+        return localStorage.getItem(TIMINGS_ENABLED_KEY) === '1';
+    } catch (error) {
+        return false;
+    }
+}
+
+function createTimings(game, { enabled = timingsEnabled() } = {}) {
+    // Rolling window of the last TIMINGS_WINDOW durations per stage
+    const stages = new Map();
+    // Every sample, oldest first once it wraps: { stage, start, ms }
+    const log = [];
+    let logged = 0;
+    let overlay = null;
+    let renderTimer = null;
+
+    function stageFor(stage) {
+        let entry = stages.get(stage);
+        if (!entry) {
+            entry = { samples: new Float64Array(TIMINGS_WINDOW), count: 0, last: 0 };
+            stages.set(stage, entry);
+        }
+        return entry;
+    }
+
+    function record(stage, ms, start) {
+        if (!enabled) return;
+        if (start === undefined) start = performance.now() - ms;
+        const label = `${game}:${stage}`;
+        try {
+            performance.measure(label, { start, duration: ms });
+            performance.clearMeasures(label);
+        } catch (error) {
+            // User Timing Level 3 (measure options) is missing in old browsers
+        }
+        const entry = stageFor(stage);
+        entry.samples[entry.count % TIMINGS_WINDOW] = ms;
+        entry.count++;
+        entry.last = ms;
+        log[logged % TIMINGS_LOG_LIMIT] = { stage, start, ms };
+        logged++;
+        scheduleRender();
+    }
+
+    // A milestone (e.g. data ready), recorded as the time since navigation
+    function mark(stage) {
+        if (!enabled) return;
+        performance.mark(`${game}:${stage}`);
+        record(stage, performance.now(), 0);
+    }
+
+    // fn timed as `stage`; async functions are timed until they settle
+    function wrap(stage, fn) {
+        if (!enabled) return fn;
+        return function (...args) {
+            const start = performance.now();
+            const result = fn.apply(this, args);
+            if (result && typeof result.then === 'function') {
+                const done = () => record(stage, performance.now() - start, start);
+                result.then(done, done);
+            } else {
+                record(stage, performance.now() - start, start);
+            }
+            return result;
+        };
+    }
+
+    function percentile(sorted, q) {
+        return sorted.length ? sorted[Math.min(sorted.length - 1, Math.floor(q * sorted.length))] : 0;
+    }
+
+    // { stage: { count, last, p50, p95 } } over the rolling window
+    function summary() {
+        const result = {};
+        stages.forEach((entry, stage) => {
+            const sorted = entry.samples.slice(0, Math.min(entry.count, TIMINGS_WINDOW)).sort();
+            result[stage] = {
+                count: entry.count,
+                last: entry.last,
+                p50: percentile(sorted, 0.5),
+                p95: percentile(sorted, 0.95)
+            };
+        });
+        return result;
+    }
+
+    // One JSON object per line: game, stage, start and duration in ms
+    function exportNdjson() {
+        const first = logged > TIMINGS_LOG_LIMIT ? logged % TIMINGS_LOG_LIMIT : 0;
+        const ordered = log.slice(first).concat(log.slice(0, first));
+        return ordered.map(({ stage, start, ms }) => JSON.stringify({
+            game,
+            stage,
+            start: Number(start.toFixed(3)),
+            ms: Number(ms.toFixed(3))
+        })).join('\n') + (ordered.length ? '\n' : '');
+    }
+
+    function download() {
+        const blob = new Blob([exportNdjson()], { type: 'application/x-ndjson' });
+        const link = document.createElement('a');
+        link.href = URL.createObjectURL(blob);
+        link.download = `${game}-timings.ndjson`;
+        link.click();
+        setTimeout(() => URL.revokeObjectURL(link.href), 0);
+    }
+
+    // ===========================================
+    // DEBUG OVERLAY
+    // ===========================================
+
+    function createOverlay() {
+        const panel = document.createElement('div');
+        panel.setAttribute('aria-hidden', 'true');
+        panel.style.cssText = 'position:fixed;right:8px;bottom:8px;z-index:10000;'
+            + 'background:rgba(0,0,0,0.85);color:#fff;font:12px/1.4 monospace;padding:8px;'
+            + 'border-radius:6px;max-width:calc(100vw - 16px);';
+        panel.style.display = 'none';
+        const table = document.createElement('pre');
+        table.style.margin = '0 0 6px';
+        const exportButton = document.createElement('button');
+        exportButton.textContent = 'Export NDJSON';
+        exportButton.style.cssText = 'font:inherit;padding:2px 6px;min-height:0;';
+        exportButton.addEventListener('click', download);
+        panel.append(table, exportButton);
+        document.body.appendChild(panel);
+        return { panel, table };
+    }
+
+    function render() {
+        renderTimer = null;
+        if (!overlay || overlay.panel.style.display === 'none') return;
+        const format = ms => ms.toFixed(2).padStart(8);
+        const lines = [`${'stage'.padEnd(14)}${'n'.padStart(6)}${'last'.padStart(8)}${'p50'.padStart(8)}${'p95'.padStart(8)}`];
+        Object.entries(summary()).forEach(([stage, { count, last, p50, p95 }]) => {
+            lines.push(`${stage.padEnd(14)}${String(count).padStart(6)}${format(last)}${format(p50)}${format(p95)}`);
+        });
+        overlay.table.textContent = lines.join('\n');
+    }
+
+    function scheduleRender() {
+        if (overlay && renderTimer === null) renderTimer = setTimeout(render, 500);
+    }
+
+    function toggleOverlay() {
+        if (!overlay) overlay = createOverlay();
+        const hidden = overlay.panel.style.display === 'none';
+        overlay.panel.style.display = hidden ? 'block' : 'none';
+        render();
+    }
+
+    if (enabled && typeof document !== 'undefined') {
+        document.addEventListener('keydown', event => {
+            const target = event.target;
+            if (event.key !== '`' || (target && /^(INPUT|TEXTAREA)$/.test(target.tagName))) return;
+            toggleOverlay();
+        });
+    }
+
+    return {
+        enabled,
+        record,
+        mark,
+        wrap,
+        summary,
+        exportNdjson,
+        download,
+        toggleOverlay
+    };
+}
+
+if (typeof module !== 'undefined') {
+    module.exports = { createTimings };
+}
@@ -0,0 +1,86 @@
+// Typed-answer input with live suggestions, shared by the games.
+//
+// renderTypedAnswer() replaces a container's content with a text field, a
+// suggestion list and a submit button (class option-btn, so the games'
+// selectAnswer() marks it correct/incorrect like a choice button).
+// suggest(text) returns the names to offer for the current input, e.g.
+// from js/name-index.js; picking one submits it. onSubmit(text, button)
+// receives the answer once; the field is disabled afterwards. showHint(text)
+// puts a hint in a line under the field, visible while the player types.
+
+function renderTypedAnswer(container, { suggest, onSubmit, placeholder = '', submitLabel = 'OK' }) {
+    container.innerHTML = '';
+
+    const form = document.createElement('form');
+    form.className = 'typed-answer';
+
+    const input = document.createElement('input');
+    input.type = 'text';
+    input.id = 'answerInput';
+    input.className = 'answer-input';
+    input.autocomplete = 'off';
+    input.spellcheck = false;
+    input.setAttribute('autocapitalize', 'off');
+    input.setAttribute('aria-label', placeholder);
+    input.placeholder = placeholder;
+
+    const hint = document.createElement('p');
+    hint.className = 'typed-hint';
+    hint.setAttribute('aria-live', 'polite');
+    hint.hidden = true;
+
+    const list = document.createElement('div');
+    list.className = 'suggestions';
+
+    const submit = document.createElement('button');
+    submit.type = 'submit';
+    submit.className = 'option-btn';
+    submit.textContent = submitLabel;
+
+    let answered = false;
+    function submitAnswer(text) {
+        if (answered || !text.trim()) return;
+        answered = true;
+        input.disabled = true;
+        list.innerHTML = '';
+        onSubmit(text, submit);
+    }
+
+    input.addEventListener('input', () => {
+        list.innerHTML = '';
+        suggest(input.value).forEach(name => {
+            const button = document.createElement('button');
+            button.type = 'button';
+            button.className = 'suggestion-btn';
+            button.textContent = name;
+            button.onclick = () => {
+                input.value = name;
+                submitAnswer(name);
+            };
+            list.appendChild(button);
+        });
+    });
+    form.addEventListener('submit', event => {
+        event.preventDefault();
+        submitAnswer(input.value);
+    });
+
+    form.append(input, hint, list, submit);
+    container.appendChild(form);
+    input.focus();
+
+    return {
+        input,
+        hint,
+        // e.g. the first letters, or the whole answer; also the empty field's placeholder
+        showHint(text) {
+            hint.textContent = text;
+            hint.hidden = false;
+            input.placeholder = text;
+        }
+    };
+}
+
+if (typeof module !== 'undefined') {
+    module.exports = { renderTypedAnswer };
+}
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Medal Definitions
+The medals of both games as data, compiled by build_artifacts.py into a
+table the pages evaluate event by event (js/medals.js) instead of calling
+every medal's check after every answer.
+
+Each medal declares what it depends on:
+
+    {"counter": "coins", "atLeast": 5}             a progress counter reaching
+                                                   a threshold (coins, streaks,
+                                                   answers, ...)
+    {"event": "identified", "key": 25}             a correct answer about one
+                                                   item (a Pokémon id)
+    {"event": "tag", "key": "extraordinary_name"}  a correct answer about an
+                                                   item carrying a tag
+
+The compiled table keeps the medals in definition order (the order of the
+medals screen) plus the dependency index: per counter the medals sorted by
+threshold, per "<event>:<key>" the medals it unlocks. A counter update then
+only looks at the next locked threshold of that counter, and an event at
+its own list, however many medals there are.
+
+Pokémon medals carry their English name and description; GeoTriad medals
+are translated in the page (translations[lang].medals).
+
+Usage:
+    python medals.py pokemon
+    python medals.py geo
+"""
+
+import argparse
+import json
+from typing import Dict, List
+
+from build_utils import REPO_ROOT
+
+# Counters each game reports, named like its gameState fields
+COUNTERS = {
+    "pokemon": ["coins", "currentStreak", "totalAnswered", "totalCorrect"],
+    "geo": ["coins", "streak", "totalGuesses", "totalCorrect"],
+}
+EVENTS = {
+    "pokemon": ["identified"],
+    "geo": ["tag"],
+}
+
+POKEMON_MEDALS = [
+    {"id": "coins_5", "name": "5 Coins!", "icon": "🪙", "description": "Earn 5 coins",
+     "counter": "coins", "atLeast": 5},
+    {"id": "coins_10", "name": "10 Coins!", "icon": "💰", "description": "Earn 10 coins",
+     "counter": "coins", "atLeast": 10},
+    {"id": "coins_20", "name": "20 Coins!", "icon": "🏆", "description": "Earn 20 coins",
+     "counter": "coins", "atLeast": 20},
+    {"id": "streak_3", "name": "On a Roll", "icon": "🔥", "description": "Get 3 correct in a row",
+     "counter": "currentStreak", "atLeast": 3},
+    {"id": "answered_10", "name": "Explorer", "icon": "🗺️", "description": "Answer 10 questions",
+     "counter": "totalAnswered", "atLeast": 10},
+    {"id": "pikachu", "name": "Pikachu Spotted!", "icon": "⚡", "description": "Correctly identify Pikachu",
+     "event": "identified", "key": 25},
+]
+
+GEO_MEDALS = [
+    {"id": "first_correct", "icon": "🎉", "counter": "totalCorrect", "atLeast": 1},
+    {"id": "three_correct", "icon": "🔥", "counter": "totalCorrect", "atLeast": 3},
+    {"id": "five_correct", "icon": "🌟", "counter": "totalCorrect", "atLeast": 5},
+    {"id": "eight_correct", "icon": "🗺️", "counter": "totalCorrect", "atLeast": 8},
+    {"id": "thirteen_correct", "icon": "✈️", "counter": "totalCorrect", "atLeast": 13},
+    {"id": "twentyone_correct", "icon": "🎓", "counter": "totalCorrect", "atLeast": 21},
+    {"id": "thirtyfour_correct", "icon": "📚", "counter": "totalCorrect", "atLeast": 34},
+    {"id": "fiftyfive_correct", "icon": "🗾", "counter": "totalCorrect", "atLeast": 55},
+    {"id": "eightynine_correct", "icon": "👑", "counter": "totalCorrect", "atLeast": 89},
+    {"id": "thirty_guesses", "icon": "🚀", "counter": "totalGuesses", "atLeast": 30},
+    {"id": "fifty_guesses", "icon": "📖", "counter": "totalGuesses", "atLeast": 50},
+    {"id": "hundred_guesses", "icon": "🌏", "counter": "totalGuesses", "atLeast": 100},
+    {"id": "extraordinary_name", "icon": "✨", "event": "tag", "key": "extraordinary_name"},
+]
+
+MEDALS = {"pokemon": POKEMON_MEDALS, "geo": GEO_MEDALS}
+DATA_PATHS = {
+    "pokemon": REPO_ROOT / "data" / "pokemon.json",
+    "geo": REPO_ROOT / "geotriad-game" / "data" / "geo.json",
+}
+
+
+def event_keys(game: str, records: List[Dict]) -> Dict[str, set]:
+    """Keys each event kind can take for these records (ids, tags)."""
+    if game == "pokemon":
+        return {"identified": {record["id"] for record in records}}
+    return {"tag": {tag for record in records for tag in record.get("tags", [])}}
+
+
+def compile_medals(game: str, records: List[Dict]) -> Dict:
+    """Medal table with its dependency index. Raises ValueError on a bad definition."""
+    definitions = MEDALS[game]
+    keys = event_keys(game, records)
+    counters: Dict[str, List[int]] = {}
+    events: Dict[str, List[int]] = {}
+    seen = set()
+    for position, medal in enumerate(definitions):
+        if medal["id"] in seen:
+            raise ValueError(f"duplicate medal id {medal['id']!r}")
+        seen.add(medal["id"])
+        if "counter" in medal:
+            if medal["counter"] not in COUNTERS[game]:
+                raise ValueError(f"medal {medal['id']!r}: unknown counter {medal['counter']!r}")
+            counters.setdefault(medal["counter"], []).append(position)
+        elif medal.get("event") in EVENTS[game]:
+            if medal["key"] not in keys[medal["event"]]:
+                raise ValueError(f"medal {medal['id']!r}: no {medal['event']} {medal['key']!r} in the data")
+            events.setdefault(f"{medal['event']}:{medal['key']}", []).append(position)
+        else:
+            raise ValueError(f"medal {medal['id']!r} depends on nothing this game reports")
+    for positions in counters.values():
+        positions.sort(key=lambda position: definitions[position]["atLeast"])
+    return {"medals": definitions, "counters": counters, "events": events}
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Show a game's compiled medal table")
+    parser.add_argument("game", choices=sorted(MEDALS))
+    args = parser.parse_args()
+
+    with open(DATA_PATHS[args.game], "r", encoding="utf-8") as f:
+        records = json.load(f)
+    table = compile_medals(args.game, records)
+    for counter, positions in sorted(table["counters"].items()):
+        print(f"{counter}: " + ", ".join(
+            f"{table['medals'][p]['id']} (>= {table['medals'][p]['atLeast']})" for p in positions))
+    for event, positions in sorted(table["events"].items()):
+        print(f"{event}: " + ", ".join(table["medals"][p]["id"] for p in positions))
+    print(f"✓ {len(table['medals'])} medals")
+
+
+if __name__ == "__main__":
+    main()
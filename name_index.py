@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Bilingual Name Index
+Trigram index over folded names for the games' typed-answer mode, so a
+typed answer matches close spellings in English or German and every
+keystroke can be autocompleted without scanning all names.
+
+Names are folded to keys before indexing and matching: lowercase, accents
+and umlauts removed (also when spelled "ae"/"oe"/"ue"), ß as "ss", and
+everything but letters and digits dropped, so "Côte d'Ivoire" and
+"cote divoire" share the key "cotedivoire". Each key is padded as
+"$key$" and split into trigrams; the index maps every trigram to the
+entries containing it.
+
+    suggest(field, text)  ranked completions for a partial answer: exact
+                          key, then keys starting with it, then the most
+                          trigrams in common
+    match(field, text)    the targets a finished answer may mean, allowing
+                          a few typos depending on its length (several
+                          when names collide, e.g. two countries "Congo")
+
+build_artifacts.py writes one index per game (data/pokemon/names.*.json,
+geotriad-game/data/geo.names.json); js/name-index.js implements the same
+folding and matching in the browser.
+
+Usage:
+    python name_index.py pokemon "pikatchu"
+    python name_index.py geo "elfenbeinkuste" --field country
+"""
+
+import argparse
+import heapq
+import json
+import re
+import time
+import unicodedata
+from typing import Dict, Iterable, List, Tuple
+
+from build_utils import REPO_ROOT
+
+# Letters NFD does not decompose
+FOLD_LETTERS = str.maketrans({"ß": "ss", "æ": "ae", "œ": "oe", "ø": "o", "đ": "d",
+                              "ł": "l", "ı": "i", "þ": "th", "ð": "d"})
+UMLAUT_SPELLINGS = re.compile(r"([aou])e")
+NOT_ALPHANUMERIC = re.compile(r"[^a-z0-9]+")
+
+# Answers need at least this many characters before suggestions start
+MIN_SUGGEST_LENGTH = 2
+# Candidates checked with an edit distance per match()
+MATCH_CANDIDATES = 8
+
+
+def fold(text: str) -> str:
+    """Matching key for a name or a typed answer (see module docstring)."""
+    decomposed = unicodedata.normalize("NFD", text.lower())
+    stripped = "".join(char for char in decomposed if not unicodedata.category(char).startswith("M"))
+    key = NOT_ALPHANUMERIC.sub("", stripped.translate(FOLD_LETTERS))
+    return UMLAUT_SPELLINGS.sub(r"\1", key)
+
+
+def trigrams(key: str, complete: bool = True) -> List[str]:
+    """Distinct trigrams of "$key$" (or "$key" for a prefix still being typed)."""
+    padded = f"${key}$" if complete else f"${key}"
+    return list(dict.fromkeys(padded[i:i + 3] for i in range(len(padded) - 2)))
+
+
+def typo_tolerance(key: str) -> int:
+    """Edits allowed when matching a finished answer of this length."""
+    if len(key) <= 3:
+        return 0
+    if len(key) <= 6:
+        return 1
+    if len(key) <= 10:
+        return 2
+    return 3
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance (adjacent swaps count once), capped at limit + 1."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    before = None
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        for j, char_b in enumerate(b, 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b))
+            if before and i > 1 and j > 1 and char_a == b[j - 2] and a[i - 2] == char_b:
+                current[j] = min(current[j], before[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        before, previous = previous, current
+    return previous[-1]
+
+
+def build_field(entries: Iterable[Tuple[int, str]]) -> Dict:
+    """Index one answer field from (target, name) pairs.
+
+    Names folding to the same key for the same target (e.g. "Pikachu" in
+    both languages) are stored once.
+    """
+    names, keys, targets = [], [], []
+    seen = set()
+    for target, name in entries:
+        key = fold(name or "")
+        if not key or (target, key) in seen:
+            continue
+        seen.add((target, key))
+        names.append(name)
+        keys.append(key)
+        targets.append(target)
+
+    grams: Dict[str, List[int]] = {}
+    for entry, key in enumerate(keys):
+        for gram in trigrams(key):
+            grams.setdefault(gram, []).append(entry)
+    return {"names": names, "keys": keys, "targets": targets, "grams": dict(sorted(grams.items()))}
+
+
+def build_name_index(fields: Dict[str, Iterable[Tuple[int, str]]]) -> Dict:
+    """{field: index} for every answer field, e.g. {"country": ..., "capital": ...}."""
+    return {field: build_field(entries) for field, entries in fields.items()}
+
+
+class NameIndex:
+    """Queries over an index written by build_name_index()."""
+
+    def __init__(self, index: Dict):
+        self.index = index
+        self._exact: Dict[str, Dict[str, List[int]]] = {}
+        for field, data in index.items():
+            exact = self._exact[field] = {}
+            for entry, key in enumerate(data["keys"]):
+                exact.setdefault(key, []).append(entry)
+
+    def _shared(self, field: str, grams: List[str]) -> Dict[int, int]:
+        """Trigrams each entry shares with the query."""
+        postings = self.index[field]["grams"]
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for entry in postings.get(gram, ()):
+                shared[entry] = shared.get(entry, 0) + 1
+        return shared
+
+    def suggest(self, field: str, text: str, limit: int = 5) -> List[Dict]:
+        """Ranked completions: [{"target", "name", "key"}], one per target and key."""
+        key = fold(text)
+        if len(key) < MIN_SUGGEST_LENGTH:
+            return []
+        data = self.index[field]
+        grams = trigrams(key, complete=False)
+        shared = self._shared(field, grams)
+
+        def rank(entry: int):
+            candidate = data["keys"][entry]
+            # Dice coefficient over trigram sets ("$key$" has len(key) trigrams)
+            similarity = 2 * shared[entry] / (len(grams) + len(candidate))
+            return (candidate != key, not candidate.startswith(key), -similarity, len(candidate), entry)
+
+        suggestions = []
+        seen = set()
+        for entry in sorted(shared, key=rank):
+            target = data["targets"][entry]
+            if target in seen or data["keys"][entry] in seen:
+                continue
+            seen.update((target, data["keys"][entry]))
+            suggestions.append({"target": target, "name": data["names"][entry], "key": data["keys"][entry]})
+            if len(suggestions) == limit:
+                break
+        return suggestions
+
+    def match(self, field: str, text: str) -> List[int]:
+        """Targets a finished answer may mean (closest keys only), or [] if none is close enough."""
+        key = fold(text)
+        if not key:
+            return []
+        data = self.index[field]
+        entries = self._exact[field].get(key)
+        if not entries:
+            limit = typo_tolerance(key)
+            if limit == 0:
+                return []
+            shared = self._shared(field, trigrams(key))
+            best, entries = limit, []
+            # Only entries with the most trigrams in common are worth an edit distance
+            for entry in heapq.nsmallest(MATCH_CANDIDATES, shared, key=lambda e: (-shared[e], e)):
+                distance = edit_distance(key, data["keys"][entry], limit)
+                if distance < best:
+                    best, entries = distance, []
+                if distance == best:
+                    entries.append(entry)
+        return list(dict.fromkeys(data["targets"][entry] for entry in entries))
+
+
+def load_game_index(game: str) -> Dict:
+    """The built index of a game ("pokemon" or "geo")."""
+    if game == "pokemon":
+        with open(REPO_ROOT / "data" / "pokemon" / "manifest.json", "r", encoding="utf-8") as f:
+            path = REPO_ROOT / "data" / "pokemon" / json.load(f)["names"]["file"]
+    else:
+        path = REPO_ROOT / "geotriad-game" / "data" / "geo.names.json"
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Try typed answers against a game's name index")
+    parser.add_argument("game", choices=["pokemon", "geo"])
+    parser.add_argument("answers", nargs="+")
+    parser.add_argument("--field", help="answer field (default: the game's first)")
+    args = parser.parse_args()
+
+    index = NameIndex(load_game_index(args.game))
+    field = args.field or next(iter(index.index))
+    if field not in index.index:
+        parser.error(f"unknown field {field!r} (choose from {', '.join(index.index)})")
+    data = index.index[field]
+
+    for answer in args.answers:
+        started = time.perf_counter()
+        targets = index.match(field, answer)
+        suggestions = index.suggest(field, answer)
+        elapsed = (time.perf_counter() - started) * 1000
+        if not targets:
+            print(f"✗ {answer!r}: no match ({elapsed:.2f} ms)")
+        else:
+            names = " or ".join(data["names"][data["targets"].index(target)] for target in targets)
+            print(f"✓ {answer!r}: {names} ({elapsed:.2f} ms)")
+        print(f"  suggestions: {', '.join(s['name'] for s in suggestions) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
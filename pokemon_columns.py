@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Pokémon Columnar Export
+Writes data/pokemon.json as a columnar binary file (data/pokemon.cols) and
+reads it back through mmap without parsing.
+
+Layout (little-endian, every section 4-byte aligned):
+
+    header     "PKCOLS1\\0", row count, column count, string count
+    columns    per column: name, kind, byte offset and size of its data
+    strings    sorted, interned UTF-8 strings with a uint32 offset table
+    data       int32 values (id, heightDm, ...) or uint32 string ids per
+               row; list columns (type, ...) add a uint32 offset per row
+
+Missing values are stored as NULL_INT / NULL_STRING and read back as None.
+Integer columns are exposed as memoryviews over the mapped file, so scans
+and aggregates never build per-record dicts.
+
+Usage:
+    python pokemon_columns.py [--output data/pokemon.cols]
+
+    from pokemon_columns import PokemonColumns
+    with PokemonColumns() as pokemon:
+        heaviest = max(range(len(pokemon)), key=pokemon.column("weightHg").__getitem__)
+        print(pokemon.value("name", heaviest))
+"""
+
+import argparse
+import bisect
+import json
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from build_utils import REPO_ROOT, write_if_changed
+
+DATA_PATH = REPO_ROOT / "data" / "pokemon.json"
+COLUMNS_PATH = REPO_ROOT / "data" / "pokemon.cols"
+
+MAGIC = b"PKCOLS1\0"
+HEADER = struct.Struct("<8sIII")
+NAME_BYTES = 24
+COLUMN_ENTRY = struct.Struct(f"<{NAME_BYTES}sB3xII")
+
+KIND_INT = 1
+KIND_STRING = 2
+KIND_STRING_LIST = 3
+
+NULL_INT = -2 ** 31
+NULL_STRING = 2 ** 32 - 1
+
+
+def column_kind(name: str, values: List) -> int:
+    """Storage kind for a column, from the JSON types of its values."""
+    kinds = set()
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            raise ValueError(f"Column {name!r}: booleans are not supported")
+        if isinstance(value, int):
+            kinds.add(KIND_INT)
+        elif isinstance(value, str):
+            kinds.add(KIND_STRING)
+        elif isinstance(value, list) and all(isinstance(item, str) for item in value):
+            kinds.add(KIND_STRING_LIST)
+        else:
+            raise ValueError(f"Column {name!r}: unsupported value {value!r}")
+    if len(kinds) > 1:
+        raise ValueError(f"Column {name!r} mixes value types")
+    return kinds.pop() if kinds else KIND_STRING
+
+
+def little_endian(values: array) -> bytes:
+    """Array bytes in file byte order."""
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def pad4(data: bytes) -> bytes:
+    """Pad to a multiple of 4 bytes so the next section stays aligned."""
+    return data + b"\0" * (-len(data) % 4)
+
+
+def encode_columns(records: List[Dict]) -> bytes:
+    """Serialize records into the columnar format."""
+    names = []
+    for record in records:
+        for name in record:
+            if name not in names:
+                names.append(name)
+    for name in names:
+        if len(name.encode("utf-8")) > NAME_BYTES:
+            raise ValueError(f"Column name too long: {name!r}")
+
+    columns = {name: [record.get(name) for record in records] for name in names}
+    kinds = {name: column_kind(name, values) for name, values in columns.items()}
+
+    # Interned strings are sorted, so lookups by value are a binary search
+    strings = set()
+    for name, values in columns.items():
+        if kinds[name] == KIND_STRING:
+            strings.update(value for value in values if value is not None)
+        elif kinds[name] == KIND_STRING_LIST:
+            strings.update(item for value in values if value for item in value)
+    strings = sorted(strings)
+    string_ids = {value: index for index, value in enumerate(strings)}
+
+    blob = bytearray()
+    string_offsets = array("I", [0])
+    for value in strings:
+        blob += value.encode("utf-8")
+        string_offsets.append(len(blob))
+    string_section = pad4(little_endian(string_offsets) + bytes(blob))
+
+    data_sections = []
+    for name in names:
+        values = columns[name]
+        if kinds[name] == KIND_INT:
+            data = little_endian(array("i", [NULL_INT if v is None else v for v in values]))
+        elif kinds[name] == KIND_STRING:
+            data = little_endian(array("I", [NULL_STRING if v is None else string_ids[v] for v in values]))
+        else:
+            offsets = array("I", [0])
+            items = array("I")
+            for value in values:
+                items.extend(string_ids[item] for item in value or [])
+                offsets.append(len(items))
+            data = little_endian(offsets) + little_endian(items)
+        data_sections.append(pad4(data))
+
+    directory_size = COLUMN_ENTRY.size * len(names)
+    offset = HEADER.size + directory_size + len(string_section)
+    directory = bytearray()
+    for name, data in zip(names, data_sections):
+        directory += COLUMN_ENTRY.pack(name.encode("utf-8"), kinds[name], offset, len(data))
+        offset += len(data)
+
+    header = HEADER.pack(MAGIC, len(records), len(names), len(strings))
+    return header + bytes(directory) + string_section + b"".join(data_sections)
+
+
+class PokemonColumns:
+    """Read-only, memory-mapped view of a columnar export."""
+
+    def __init__(self, path: Path = COLUMNS_PATH):
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        self.kinds: Dict[str, int] = {}
+        self._columns: Dict[str, memoryview] = {}
+        self._list_offsets: Dict[str, memoryview] = {}
+        self._string_offsets = None
+
+        magic, self.rows, column_count, string_count = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a Pokémon column file")
+
+        position = HEADER.size
+        for _ in range(column_count):
+            raw_name, kind, offset, size = COLUMN_ENTRY.unpack_from(self._mmap, position)
+            position += COLUMN_ENTRY.size
+            name = raw_name.rstrip(b"\0").decode("utf-8")
+            self.kinds[name] = kind
+            if kind == KIND_STRING_LIST:
+                end = offset + 4 * (self.rows + 1)
+                offsets = self._ints(offset, end, "I")
+                self._list_offsets[name] = offsets
+                self._columns[name] = self._ints(end, end + 4 * offsets[self.rows], "I")
+            else:
+                self._columns[name] = self._ints(offset, offset + 4 * self.rows,
+                                                 "i" if kind == KIND_INT else "I")
+
+        self._string_offsets = self._ints(position, position + 4 * (string_count + 1), "I")
+        self._strings_start = position + 4 * (string_count + 1)
+        self._string_cache: Dict[int, str] = {}
+
+    def _ints(self, start: int, end: int, typecode: str):
+        """Zero-copy integer view of a file section (a copy on big-endian hosts)."""
+        view = self._view[start:end]
+        if sys.byteorder == "little":
+            return view.cast(typecode)
+        values = array(typecode, view.tobytes())
+        values.byteswap()
+        return values
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Release the mapping and the file."""
+        # Views into the mapping must be released before it can be closed
+        views = [*self._columns.values(), *self._list_offsets.values(), self._string_offsets]
+        for view in views:
+            if isinstance(view, memoryview):
+                view.release()
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
+
+    @property
+    def string_count(self) -> int:
+        return len(self._string_offsets) - 1
+
+    def string(self, string_id: int) -> Optional[str]:
+        """Decode one interned string (cached)."""
+        if string_id == NULL_STRING:
+            return None
+        value = self._string_cache.get(string_id)
+        if value is None:
+            start = self._strings_start + self._string_offsets[string_id]
+            end = self._strings_start + self._string_offsets[string_id + 1]
+            value = self._string_cache[string_id] = str(self._view[start:end], "utf-8")
+        return value
+
+    def string_id(self, value: str) -> Optional[int]:
+        """Id of an interned string, or None (binary search, no full decode)."""
+        low, high = 0, self.string_count
+        while low < high:
+            middle = (low + high) // 2
+            if self.string(middle) < value:
+                low = middle + 1
+            else:
+                high = middle
+        return low if low < self.string_count and self.string(low) == value else None
+
+    def column(self, name: str):
+        """Raw column: int32 values or uint32 string ids, one per row.
+
+        For list columns this is the flat item ids; see list_bounds().
+        """
+        return self._columns[name]
+
+    def list_bounds(self, name: str, row: int):
+        """(start, end) of a row's items in a list column."""
+        offsets = self._list_offsets[name]
+        return offsets[row], offsets[row + 1]
+
+    def value(self, name: str, row: int):
+        """Decoded value of one cell."""
+        kind = self.kinds[name]
+        if kind == KIND_INT:
+            value = self._columns[name][row]
+            return None if value == NULL_INT else value
+        if kind == KIND_STRING:
+            return self.string(self._columns[name][row])
+        start, end = self.list_bounds(name, row)
+        items = self._columns[name]
+        return [self.string(items[index]) for index in range(start, end)]
+
+    def record(self, row: int) -> Dict:
+        """One row as a dict, like an entry of pokemon.json (missing ints as None)."""
+        return {name: self.value(name, row) for name in self.kinds}
+
+    def rows_where(self, name: str, value: str) -> List[int]:
+        """Rows whose string (or list) column contains value."""
+        string_id = self.string_id(value)
+        if string_id is None:
+            return []
+        column = self._columns[name]
+        if self.kinds[name] == KIND_STRING:
+            return [row for row, item in enumerate(column) if item == string_id]
+        offsets = self._list_offsets[name]
+        matches = []
+        for index, item in enumerate(column):
+            if item == string_id:
+                row = bisect.bisect_right(offsets, index) - 1
+                if not matches or matches[-1] != row:
+                    matches.append(row)
+        return matches
+
+
+def export_columns(source: Path = DATA_PATH, output: Path = COLUMNS_PATH) -> bool:
+    """Write the columnar export. Returns True if the file changed."""
+    with open(source, "r", encoding="utf-8") as f:
+        records = json.load(f)
+    return write_if_changed(output, encode_columns(records))
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Export data/pokemon.json as columns")
+    parser.add_argument("--source", type=Path, default=DATA_PATH)
+    parser.add_argument("--output", type=Path, default=COLUMNS_PATH)
+    args = parser.parse_args()
+
+    changed = export_columns(args.source, args.output)
+    with PokemonColumns(args.output) as pokemon:
+        size = args.output.stat().st_size
+        label = args.output.resolve()
+        if label.is_relative_to(REPO_ROOT):
+            label = label.relative_to(REPO_ROOT)
+        print(f"{'✓ Wrote' if changed else '✓ Unchanged'} {label} "
+              f"({len(pokemon)} rows, {len(pokemon.kinds)} columns, "
+              f"{pokemon.string_count} strings, {size:,} bytes; "
+              f"source {args.source.stat().st_size:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
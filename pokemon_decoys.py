@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Pokémon Decoy Neighbors
+Precomputes, for every Pokémon, a ranked list of the most confusable other
+Pokémon, so the game's hard mode can draw convincing decoys in O(1).
+
+Confusability is a weighted sum over every pair of records:
+
+    type        share of types in common (Water/Ice vs. Water)
+    color       same color
+    shape       same body shape
+    habitat     same habitat
+    generation  same generation
+    name        similarity of the English or German names (whichever is
+                closer), from the edit distance of a rough phonetic key
+
+All pairs are scored with NumPy, a block of rows at a time, so the build
+stays fast and memory bounded even for many times the real dataset. The
+table written by build_artifacts.py is
+
+    {"k": 12, "ids": [1, 2, ...], "neighbors": [ids of row 0's k neighbors, ...]}
+
+with neighbors flattened, most confusable first (see js/pokemon-decoys.js).
+
+NumPy is optional for the rest of the build; without it build_artifacts.py
+keeps the last table it wrote.
+
+Usage:
+    python pokemon_decoys.py Pikachu [Glumanda ...]
+"""
+
+import argparse
+import json
+import time
+import unicodedata
+from typing import Dict, List, Optional
+
+from build_utils import REPO_ROOT
+
+try:
+    import numpy as np
+except ImportError:  # optional: only needed to rebuild the decoy table
+    np = None
+
+DATA_PATH = REPO_ROOT / "data" / "pokemon.json"
+
+# Neighbors kept per Pokémon
+NEIGHBORS = 12
+# Rows scored per block; the pair matrices are BLOCK_ROWS x len(records)
+BLOCK_ROWS = 256
+
+WEIGHTS = {
+    "type": 3.0,
+    "color": 1.5,
+    "shape": 1.5,
+    "habitat": 0.5,
+    "generation": 0.5,
+    "name": 3.0,
+}
+CATEGORY_FIELDS = ["color", "shape", "habitat", "generation"]
+NAME_FIELDS = ["name", "germanName"]
+
+# Spellings that sound alike in English or German, folded before comparing
+PHONETIC_DIGRAPHS = [("sch", "s"), ("ph", "f"), ("ck", "k"), ("qu", "kw"), ("ch", "k"), ("th", "t")]
+PHONETIC_LETTERS = str.maketrans({"c": "k", "q": "k", "z": "s", "v": "f", "w": "v", "y": "i", "j": "i"})
+
+
+def phonetic_key(name: str) -> str:
+    """Rough sound-alike key, e.g. "Schiggy" -> "sigi", "Quapsel" -> "kvapsel"."""
+    folded = unicodedata.normalize("NFKD", name.lower())
+    key = "".join(char for char in folded if char.isalpha())
+    for digraph, replacement in PHONETIC_DIGRAPHS:
+        key = key.replace(digraph, replacement)
+    key = key.translate(PHONETIC_LETTERS)
+    # Doubled letters are not heard ("Abra" vs. "Abbra")
+    return "".join(char for i, char in enumerate(key) if i == 0 or char != key[i - 1])
+
+
+def encode_names(keys: List[str]):
+    """Pad keys into a code point matrix. Returns (codes, lengths)."""
+    width = max((len(key) for key in keys), default=0)
+    codes = np.zeros((len(keys), max(width, 1)), dtype=np.int32)
+    for row, key in enumerate(keys):
+        codes[row, :len(key)] = [ord(char) for char in key]
+    return codes, np.array([len(key) for key in keys], dtype=np.int32)
+
+
+def name_similarity(block, names) -> "np.ndarray":
+    """1 - normalized Levenshtein distance for every (block row, name) pair.
+
+    block and names are encode_names() results. The dynamic program runs
+    once per (i, j) character position, vectorized over all pairs.
+    """
+    a_codes, a_lengths = block
+    b_codes, b_lengths = names
+    rows, columns = len(a_lengths), len(b_lengths)
+    b_width = b_codes.shape[1]
+    pair_columns = np.arange(columns)
+
+    # previous[j, r, c]: distance between a[:i] and b[:j] (j first keeps each step contiguous)
+    previous = np.broadcast_to(np.arange(b_width + 1, dtype=np.int16)[:, None, None],
+                               (b_width + 1, rows, columns)).copy()
+    distance = np.broadcast_to(b_lengths, (rows, columns)).astype(np.int32)
+    current = np.empty_like(previous)
+    for i in range(a_codes.shape[1]):
+        current[0] = i + 1
+        for j in range(b_width):
+            cost = a_codes[:, i, None] != b_codes[None, :, j]
+            np.minimum(previous[j + 1], current[j], out=current[j + 1])
+            current[j + 1] += 1
+            np.minimum(current[j + 1], previous[j] + cost, out=current[j + 1])
+        done = np.nonzero(a_lengths == i + 1)[0]
+        distance[done] = current[b_lengths[None, :], done[:, None], pair_columns[None, :]]
+        previous, current = current, previous
+
+    longest = np.maximum(a_lengths[:, None], b_lengths[None, :])
+    return 1.0 - distance / np.maximum(longest, 1)
+
+
+def category_codes(records: List[Dict], field: str) -> "np.ndarray":
+    """Integer code per record (-1 where the field is missing)."""
+    values = {}
+    return np.array([
+        values.setdefault(record[field], len(values)) if record.get(field) else -1
+        for record in records
+    ], dtype=np.int32)
+
+
+def neighbor_table(records: List[Dict], k: int = NEIGHBORS) -> Optional[Dict]:
+    """Ranked decoy neighbors for every record, or None without NumPy."""
+    if np is None:
+        return None
+    count = len(records)
+    k = min(k, count - 1)
+
+    types = sorted({item for record in records for item in record.get("type", [])})
+    type_column = {name: column for column, name in enumerate(types)}
+    type_matrix = np.zeros((count, len(types)), dtype=np.float32)
+    for row, record in enumerate(records):
+        for item in record.get("type", []):
+            type_matrix[row, type_column[item]] = 1.0
+    type_counts = np.maximum(type_matrix.sum(axis=1), 1.0)
+
+    categories = {field: category_codes(records, field) for field in CATEGORY_FIELDS}
+    names = [encode_names([phonetic_key(record.get(field) or "") for record in records])
+             for field in NAME_FIELDS]
+
+    neighbors = np.empty((count, k), dtype=np.int64)
+    for start in range(0, count, BLOCK_ROWS):
+        end = min(start + BLOCK_ROWS, count)
+        block = slice(start, end)
+
+        shared = type_matrix[block] @ type_matrix.T
+        score = WEIGHTS["type"] * shared / np.maximum(type_counts[block, None], type_counts[None, :])
+        for field, codes in categories.items():
+            same = (codes[block, None] == codes[None, :]) & (codes[block, None] >= 0)
+            score += WEIGHTS[field] * same
+        name_score = np.zeros_like(score)
+        for codes, lengths in names:
+            name_score = np.maximum(name_score, name_similarity((codes[block], lengths[block]), (codes, lengths)))
+        score += WEIGHTS["name"] * name_score
+
+        # Rounding makes ties (and so the ranking) independent of float noise
+        score = np.round(score, 6)
+        score[np.arange(end - start), np.arange(start, end)] = -np.inf
+        neighbors[block] = np.argsort(-score, axis=1, kind="stable")[:, :k]
+
+    ids = [record["id"] for record in records]
+    id_array = np.array(ids)
+    return {"k": k, "ids": ids, "neighbors": id_array[neighbors].ravel().tolist()}
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Show the precomputed decoys for some Pokémon")
+    parser.add_argument("names", nargs="+", help="English or German names")
+    parser.add_argument("--k", type=int, default=NEIGHBORS)
+    args = parser.parse_args()
+
+    if np is None:
+        parser.error("NumPy is not installed")
+    with open(DATA_PATH, "r", encoding="utf-8") as f:
+        records = json.load(f)
+
+    started = time.perf_counter()
+    table = neighbor_table(records, args.k)
+    elapsed = time.perf_counter() - started
+    print(f"✓ Scored {len(records) ** 2:,} pairs in {elapsed * 1000:.0f} ms")
+
+    by_id = {record["id"]: record for record in records}
+    rows = {name.lower(): row for row, record in enumerate(records)
+            for name in (record["name"], record.get("germanName") or "")}
+    k = table["k"]
+    for name in args.names:
+        row = rows.get(name.lower())
+        if row is None:
+            print(f"✗ Unknown Pokémon {name!r}")
+            continue
+        decoys = [by_id[decoy_id] for decoy_id in table["neighbors"][row * k:(row + 1) * k]]
+        print(f"\n{records[row]['name']} / {records[row]['germanName']}:")
+        for rank, decoy in enumerate(decoys, 1):
+            print(f"  {rank:>2}. {decoy['name']} / {decoy['germanName']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Pokémon Query Index
+Inverted indexes and sorted numeric arrays over data/pokemon.json, so
+filtered game modes ("only Water types from Johto", "heaviest of three")
+cost O(result) instead of a scan of every record.
+
+    index = PokemonIndex.from_file()
+    index.where(type="Water", region="Johto")     # rows, any order of filters
+    index.where(type=["Fire", "Dragon"])          # a list means "any of"
+    index.between("weightHg", 1000, None)         # rows weighing >= 100 kg
+    index.heaviest(rows)                          # row with the max weightHg
+
+browser_index() produces the same indexes keyed by Pokémon id for the
+game; build_artifacts.py writes it next to the shards (see
+js/pokemon-index.js).
+
+Usage:
+    python pokemon_index.py type=Water region=Johto [--min-weight HG]
+"""
+
+import argparse
+import bisect
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from build_utils import REPO_ROOT
+
+DATA_PATH = REPO_ROOT / "data" / "pokemon.json"
+
+# Attributes with an inverted index (list fields index every item)
+INDEXED_FIELDS = ["type", "habitat", "color", "shape", "generation", "region"]
+# Attributes with a sorted array for range and extreme queries
+NUMERIC_FIELDS = ["heightDm", "weightHg"]
+
+
+class PokemonIndex:
+    """Read-only query index over a list of Pokémon records."""
+
+    def __init__(self, records: List[Dict]):
+        self.records = records
+        self.postings: Dict[str, Dict[str, List[int]]] = {field: {} for field in INDEXED_FIELDS}
+        for row, record in enumerate(records):
+            for field in INDEXED_FIELDS:
+                value = record.get(field)
+                for item in (value if isinstance(value, list) else [value]):
+                    if item is not None:
+                        postings = self.postings[field].setdefault(item, [])
+                        # List fields may repeat an item; rows are appended in order
+                        if not postings or postings[-1] != row:
+                            postings.append(row)
+        self._sets: Dict[tuple, frozenset] = {}
+
+        self.sorted_rows: Dict[str, List[int]] = {}
+        self.sorted_values: Dict[str, List[int]] = {}
+        for field in NUMERIC_FIELDS:
+            rows = sorted((row for row, record in enumerate(records) if record.get(field) is not None),
+                          key=lambda row: records[row][field])
+            self.sorted_rows[field] = rows
+            self.sorted_values[field] = [records[row][field] for row in rows]
+
+    @classmethod
+    def from_file(cls, path: Path = DATA_PATH) -> "PokemonIndex":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def values(self, field: str) -> List[str]:
+        """Distinct indexed values of a field, e.g. every type."""
+        return sorted(self.postings[field])
+
+    def rows(self, field: str, value) -> List[int]:
+        """Rows matching one value, or any of a list of values (ascending)."""
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return sorted({row for item in value for row in self.postings[field].get(item, [])})
+        return self.postings[field].get(value, [])
+
+    def _row_set(self, field: str, value) -> frozenset:
+        key = (field, tuple(sorted(value)) if isinstance(value, (list, tuple, set, frozenset)) else value)
+        rows = self._sets.get(key)
+        if rows is None:
+            rows = self._sets[key] = frozenset(self.rows(field, value))
+        return rows
+
+    def where(self, **filters) -> List[int]:
+        """Rows matching every filter (ascending).
+
+        Set intersection costs O(size of the smaller set), so starting from
+        the smallest posting set keeps the work proportional to the result.
+        """
+        if not filters:
+            return list(range(len(self.records)))
+        sets = sorted((self._row_set(field, value) for field, value in filters.items()), key=len)
+        result = sets[0]
+        for rows in sets[1:]:
+            result = result & rows
+        return sorted(result)
+
+    def between(self, field: str, low: Optional[int] = None, high: Optional[int] = None) -> List[int]:
+        """Rows with low <= field <= high (either bound optional), ascending by value."""
+        values = self.sorted_values[field]
+        start = 0 if low is None else bisect.bisect_left(values, low)
+        end = len(values) if high is None else bisect.bisect_right(values, high)
+        return self.sorted_rows[field][start:end]
+
+    def heaviest(self, rows: Iterable[int], field: str = "weightHg") -> Optional[int]:
+        """Row with the largest value of field among rows (None if empty)."""
+        return max(rows, key=lambda row: self.records[row].get(field) or 0, default=None)
+
+    def lightest(self, rows: Iterable[int], field: str = "weightHg") -> Optional[int]:
+        """Row with the smallest value of field among rows (None if empty)."""
+        return min(rows, key=lambda row: self.records[row].get(field) or 0, default=None)
+
+    def browser_index(self) -> Dict:
+        """The indexes keyed by Pokémon id, as loaded by js/pokemon-index.js."""
+        ids = [record["id"] for record in self.records]
+        return {
+            "ids": ids,
+            "fields": {
+                field: {value: [ids[row] for row in rows] for value, rows in sorted(postings.items())}
+                for field, postings in self.postings.items()
+            },
+            "sorted": {
+                field: {"ids": [ids[row] for row in self.sorted_rows[field]],
+                        "values": self.sorted_values[field]}
+                for field in NUMERIC_FIELDS
+            },
+        }
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Query data/pokemon.json through the index")
+    parser.add_argument("filters", nargs="*", metavar="FIELD=VALUE[,VALUE]",
+                        help=f"filters on {', '.join(INDEXED_FIELDS)}")
+    parser.add_argument("--min-weight", type=int, help="minimum weight in hectograms")
+    parser.add_argument("--max-weight", type=int, help="maximum weight in hectograms")
+    args = parser.parse_args()
+
+    index = PokemonIndex.from_file()
+    filters = {}
+    for item in args.filters:
+        field, _, value = item.partition("=")
+        if field not in INDEXED_FIELDS:
+            parser.error(f"unknown field {field!r}")
+        filters[field] = value.split(",") if "," in value else value
+
+    rows = index.where(**filters)
+    if args.min_weight is not None or args.max_weight is not None:
+        in_range = set(index.between("weightHg", args.min_weight, args.max_weight))
+        rows = [row for row in rows if row in in_range]
+
+    for row in rows:
+        record = index.records[row]
+        print(f"  #{record['id']:<4} {record['name']:<12} {'/'.join(record.get('type', []))}"
+              f"  {record.get('weightHg', 0) / 10:g} kg")
+    print(f"✓ {len(rows)} Pokémon")
+
+
+if __name__ == "__main__":
+    main()
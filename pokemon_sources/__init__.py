@@ -0,0 +1,26 @@
+"""
+Declarative per-generation Pokémon sources for build_pokemon_data.py.
+
+Each module ``genN.py`` defines:
+    GENERATION     - PokéAPI generation slug, e.g. "generation-ii"
+    REGION         - region shown in the game, e.g. "Johto"
+    POKEMON        - list of {"id", "name", "germanName"} dicts
+    IMAGE_SLUGS    - optional {id: slug} overrides for the artwork URL
+
+Adding a generation means adding a module; the build picks it up by name.
+"""
+
+import importlib
+import pkgutil
+from pathlib import Path
+from typing import List
+
+
+def discover_sources() -> List:
+    """Import every genN module in generation order."""
+    names = [
+        info.name for info in pkgutil.iter_modules([str(Path(__file__).parent)])
+        if info.name.startswith("gen") and info.name[3:].isdigit()
+    ]
+    names.sort(key=lambda name: int(name[3:]))
+    return [importlib.import_module(f"{__name__}.{name}") for name in names]
@@ -0,0 +1,158 @@
+"""Generation 1 Pokémon (Kanto region, #1-151)."""
+
+GENERATION = "generation-i"
+REGION = "Kanto"
+
+POKEMON = [
+    {"id": 1, "name": "Bulbasaur", "germanName": "Bisasam"},
+    {"id": 2, "name": "Ivysaur", "germanName": "Bisaknosp"},
+    {"id": 3, "name": "Venusaur", "germanName": "Bisaflor"},
+    {"id": 4, "name": "Charmander", "germanName": "Glumanda"},
+    {"id": 5, "name": "Charmeleon", "germanName": "Glutexo"},
+    {"id": 6, "name": "Charizard", "germanName": "Glurak"},
+    {"id": 7, "name": "Squirtle", "germanName": "Schiggy"},
+    {"id": 8, "name": "Wartortle", "germanName": "Schillok"},
+    {"id": 9, "name": "Blastoise", "germanName": "Turtok"},
+    {"id": 10, "name": "Caterpie", "germanName": "Raupy"},
+    {"id": 11, "name": "Metapod", "germanName": "Safcon"},
+    {"id": 12, "name": "Butterfree", "germanName": "Smettbo"},
+    {"id": 13, "name": "Weedle", "germanName": "Hornliu"},
+    {"id": 14, "name": "Kakuna", "germanName": "Kokuna"},
+    {"id": 15, "name": "Beedrill", "germanName": "Bibor"},
+    {"id": 16, "name": "Pidgey", "germanName": "Taubsi"},
+    {"id": 17, "name": "Pidgeotto", "germanName": "Tauboga"},
+    {"id": 18, "name": "Pidgeot", "germanName": "Tauboss"},
+    {"id": 19, "name": "Rattata", "germanName": "Rattfratz"},
+    {"id": 20, "name": "Raticate", "germanName": "Rattikarl"},
+    {"id": 21, "name": "Spearow", "germanName": "Habitak"},
+    {"id": 22, "name": "Fearow", "germanName": "Ibitak"},
+    {"id": 23, "name": "Ekans", "germanName": "Rettan"},
+    {"id": 24, "name": "Arbok", "germanName": "Arbok"},
+    {"id": 25, "name": "Pikachu", "germanName": "Pikachu"},
+    {"id": 26, "name": "Raichu", "germanName": "Raichu"},
+    {"id": 27, "name": "Sandshrew", "germanName": "Sandan"},
+    {"id": 28, "name": "Sandslash", "germanName": "Sandamer"},
+    {"id": 29, "name": "Nidoran-f", "germanName": "Nidoran♀"},
+    {"id": 30, "name": "Nidorina", "germanName": "Nidorina"},
+    {"id": 31, "name": "Nidoqueen", "germanName": "Nidoqueen"},
+    {"id": 32, "name": "Nidoran-m", "germanName": "Nidoran♂"},
+    {"id": 33, "name": "Nidorino", "germanName": "Nidorino"},
+    {"id": 34, "name": "Nidoking", "germanName": "Nidoking"},
+    {"id": 35, "name": "Clefairy", "germanName": "Piepi"},
+    {"id": 36, "name": "Clefable", "germanName": "Pixi"},
+    {"id": 37, "name": "Vulpix", "germanName": "Vulpix"},
+    {"id": 38, "name": "Ninetales", "germanName": "Vulnona"},
+    {"id": 39, "name": "Jigglypuff", "germanName": "Pummeluff"},
+    {"id": 40, "name": "Wigglytuff", "germanName": "Knuddeluff"},
+    {"id": 41, "name": "Zubat", "germanName": "Zubat"},
+    {"id": 42, "name": "Golbat", "germanName": "Golbat"},
+    {"id": 43, "name": "Oddish", "germanName": "Myrapla"},
+    {"id": 44, "name": "Gloom", "germanName": "Duflor"},
+    {"id": 45, "name": "Vileplume", "germanName": "Giflor"},
+    {"id": 46, "name": "Paras", "germanName": "Paras"},
+    {"id": 47, "name": "Parasect", "germanName": "Parasek"},
+    {"id": 48, "name": "Venonat", "germanName": "Bluzuk"},
+    {"id": 49, "name": "Venomoth", "germanName": "Omot"},
+    {"id": 50, "name": "Diglett", "germanName": "Digda"},
+    {"id": 51, "name": "Dugtrio", "germanName": "Digdri"},
+    {"id": 52, "name": "Meowth", "germanName": "Mauzi"},
+    {"id": 53, "name": "Persian", "germanName": "Snobilikat"},
+    {"id": 54, "name": "Psyduck", "germanName": "Enton"},
+    {"id": 55, "name": "Golduck", "germanName": "Entoron"},
+    {"id": 56, "name": "Mankey", "germanName": "Menki"},
+    {"id": 57, "name": "Primeape", "germanName": "Rasaff"},
+    {"id": 58, "name": "Growlithe", "germanName": "Fukano"},
+    {"id": 59, "name": "Arcanine", "germanName": "Arkani"},
+    {"id": 60, "name": "Poliwag", "germanName": "Quapsel"},
+    {"id": 61, "name": "Poliwhirl", "germanName": "Quaputzi"},
+    {"id": 62, "name": "Poliwrath", "germanName": "Quappo"},
+    {"id": 63, "name": "Abra", "germanName": "Abra"},
+    {"id": 64, "name": "Kadabra", "germanName": "Kadabra"},
+    {"id": 65, "name": "Alakazam", "germanName": "Simsala"},
+    {"id": 66, "name": "Machop", "germanName": "Machollo"},
+    {"id": 67, "name": "Machoke", "germanName": "Maschock"},
+    {"id": 68, "name": "Machamp", "germanName": "Machomei"},
+    {"id": 69, "name": "Bellsprout", "germanName": "Knofensa"},
+    {"id": 70, "name": "Weepinbell", "germanName": "Ultrigaria"},
+    {"id": 71, "name": "Victreebel", "germanName": "Sarzenia"},
+    {"id": 72, "name": "Tentacool", "germanName": "Tentacha"},
+    {"id": 73, "name": "Tentacruel", "germanName": "Tentoxa"},
+    {"id": 74, "name": "Geodude", "germanName": "Kleinstein"},
+    {"id": 75, "name": "Graveler", "germanName": "Georok"},
+    {"id": 76, "name": "Golem", "germanName": "Geowaz"},
+    {"id": 77, "name": "Ponyta", "germanName": "Ponita"},
+    {"id": 78, "name": "Rapidash", "germanName": "Gallopa"},
+    {"id": 79, "name": "Slowpoke", "germanName": "Flegmon"},
+    {"id": 80, "name": "Slowbro", "germanName": "Lahmus"},
+    {"id": 81, "name": "Magnemite", "germanName": "Magnetilo"},
+    {"id": 82, "name": "Magneton", "germanName": "Magneton"},
+    {"id": 83, "name": "Farfetchd", "germanName": "Porenta"},
+    {"id": 84, "name": "Doduo", "germanName": "Dodu"},
+    {"id": 85, "name": "Dodrio", "germanName": "Dodri"},
+    {"id": 86, "name": "Seel", "germanName": "Jurob"},
+    {"id": 87, "name": "Dewgong", "germanName": "Jugong"},
+    {"id": 88, "name": "Grimer", "germanName": "Sleima"},
+    {"id": 89, "name": "Muk", "germanName": "Sleimok"},
+    {"id": 90, "name": "Shellder", "germanName": "Muschas"},
+    {"id": 91, "name": "Cloyster", "germanName": "Austos"},
+    {"id": 92, "name": "Gastly", "germanName": "Nebulak"},
+    {"id": 93, "name": "Haunter", "germanName": "Alpollo"},
+    {"id": 94, "name": "Gengar", "germanName": "Gengar"},
+    {"id": 95, "name": "Onix", "germanName": "Onix"},
+    {"id": 96, "name": "Drowzee", "germanName": "Traumato"},
+    {"id": 97, "name": "Hypno", "germanName": "Hypno"},
+    {"id": 98, "name": "Krabby", "germanName": "Krabby"},
+    {"id": 99, "name": "Kingler", "germanName": "Kingler"},
+    {"id": 100, "name": "Voltorb", "germanName": "Voltobal"},
+    {"id": 101, "name": "Electrode", "germanName": "Lektrobal"},
+    {"id": 102, "name": "Exeggcute", "germanName": "Owei"},
+    {"id": 103, "name": "Exeggutor", "germanName": "Kokowei"},
+    {"id": 104, "name": "Cubone", "germanName": "Tragosso"},
+    {"id": 105, "name": "Marowak", "germanName": "Knogga"},
+    {"id": 106, "name": "Hitmonlee", "germanName": "Kicklee"},
+    {"id": 107, "name": "Hitmonchan", "germanName": "Nockchan"},
+    {"id": 108, "name": "Lickitung", "germanName": "Schlurp"},
+    {"id": 109, "name": "Koffing", "germanName": "Smogon"},
+    {"id": 110, "name": "Weezing", "germanName": "Smogmog"},
+    {"id": 111, "name": "Rhyhorn", "germanName": "Rihorn"},
+    {"id": 112, "name": "Rhydon", "germanName": "Rizeros"},
+    {"id": 113, "name": "Chansey", "germanName": "Chaneira"},
+    {"id": 114, "name": "Tangela", "germanName": "Tangela"},
+    {"id": 115, "name": "Kangaskhan", "germanName": "Kangama"},
+    {"id": 116, "name": "Horsea", "germanName": "Seeper"},
+    {"id": 117, "name": "Seadra", "germanName": "Seemon"},
+    {"id": 118, "name": "Goldeen", "germanName": "Goldini"},
+    {"id": 119, "name": "Seaking", "germanName": "Golking"},
+    {"id": 120, "name": "Staryu", "germanName": "Sterndu"},
+    {"id": 121, "name": "Starmie", "germanName": "Starmie"},
+    {"id": 122, "name": "Mr-mime", "germanName": "Pantimos"},
+    {"id": 123, "name": "Scyther", "germanName": "Sichlor"},
+    {"id": 124, "name": "Jynx", "germanName": "Rossana"},
+    {"id": 125, "name": "Electabuzz", "germanName": "Elektek"},
+    {"id": 126, "name": "Magmar", "germanName": "Magmar"},
+    {"id": 127, "name": "Pinsir", "germanName": "Pinsir"},
+    {"id": 128, "name": "Tauros", "germanName": "Tauros"},
+    {"id": 129, "name": "Magikarp", "germanName": "Karpador"},
+    {"id": 130, "name": "Gyarados", "germanName": "Garados"},
+    {"id": 131, "name": "Lapras", "germanName": "Lapras"},
+    {"id": 132, "name": "Ditto", "germanName": "Ditto"},
+    {"id": 133, "name": "Eevee", "germanName": "Evoli"},
+    {"id": 134, "name": "Vaporeon", "germanName": "Aquana"},
+    {"id": 135, "name": "Jolteon", "germanName": "Blitza"},
+    {"id": 136, "name": "Flareon", "germanName": "Flamara"},
+    {"id": 137, "name": "Porygon", "germanName": "Porygon"},
+    {"id": 138, "name": "Omanyte", "germanName": "Amonitas"},
+    {"id": 139, "name": "Omastar", "germanName": "Amoroso"},
+    {"id": 140, "name": "Kabuto", "germanName": "Kabuto"},
+    {"id": 141, "name": "Kabutops", "germanName": "Kabutops"},
+    {"id": 142, "name": "Aerodactyl", "germanName": "Aerodactyl"},
+    {"id": 143, "name": "Snorlax", "germanName": "Relaxo"},
+    {"id": 144, "name": "Articuno", "germanName": "Arktos"},
+    {"id": 145, "name": "Zapdos", "germanName": "Zapdos"},
+    {"id": 146, "name": "Moltres", "germanName": "Lavados"},
+    {"id": 147, "name": "Dratini", "germanName": "Dratini"},
+    {"id": 148, "name": "Dragonair", "germanName": "Dragonir"},
+    {"id": 149, "name": "Dragonite", "germanName": "Dragoran"},
+    {"id": 150, "name": "Mewtwo", "germanName": "Mewtu"},
+    {"id": 151, "name": "Mew", "germanName": "Mew"}
+]
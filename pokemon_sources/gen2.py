@@ -0,0 +1,107 @@
+"""Generation 2 Pokémon (Johto region, #152-251)."""
+
+GENERATION = "generation-ii"
+REGION = "Johto"
+
+POKEMON = [
+    {"id": 152, "name": "Chikorita", "germanName": "Endivie"},
+    {"id": 153, "name": "Bayleef", "germanName": "Lorblatt"},
+    {"id": 154, "name": "Meganium", "germanName": "Meganie"},
+    {"id": 155, "name": "Cyndaquil", "germanName": "Feurigel"},
+    {"id": 156, "name": "Quilava", "germanName": "Igelavar"},
+    {"id": 157, "name": "Typhlosion", "germanName": "Tornupto"},
+    {"id": 158, "name": "Totodile", "germanName": "Karnimani"},
+    {"id": 159, "name": "Croconaw", "germanName": "Tyracroc"},
+    {"id": 160, "name": "Feraligatr", "germanName": "Impergator"},
+    {"id": 161, "name": "Sentret", "germanName": "Wiesor"},
+    {"id": 162, "name": "Furret", "germanName": "Wiesenior"},
+    {"id": 163, "name": "Hoothoot", "germanName": "Hoothoot"},
+    {"id": 164, "name": "Noctowl", "germanName": "Noctuh"},
+    {"id": 165, "name": "Ledyba", "germanName": "Ledyba"},
+    {"id": 166, "name": "Ledian", "germanName": "Ledian"},
+    {"id": 167, "name": "Spinarak", "germanName": "Webarak"},
+    {"id": 168, "name": "Ariados", "germanName": "Ariados"},
+    {"id": 169, "name": "Crobat", "germanName": "Iksbat"},
+    {"id": 170, "name": "Chinchou", "germanName": "Lampi"},
+    {"id": 171, "name": "Lanturn", "germanName": "Lanturn"},
+    {"id": 172, "name": "Pichu", "germanName": "Pichu"},
+    {"id": 173, "name": "Cleffa", "germanName": "Pii"},
+    {"id": 174, "name": "Igglybuff", "germanName": "Fluffeluff"},
+    {"id": 175, "name": "Togepi", "germanName": "Togepi"},
+    {"id": 176, "name": "Togetic", "germanName": "Togetic"},
+    {"id": 177, "name": "Natu", "germanName": "Natu"},
+    {"id": 178, "name": "Xatu", "germanName": "Xatu"},
+    {"id": 179, "name": "Mareep", "germanName": "Voltilamm"},
+    {"id": 180, "name": "Flaaffy", "germanName": "Waaty"},
+    {"id": 181, "name": "Ampharos", "germanName": "Ampharos"},
+    {"id": 182, "name": "Bellossom", "germanName": "Blubella"},
+    {"id": 183, "name": "Marill", "germanName": "Marill"},
+    {"id": 184, "name": "Azumarill", "germanName": "Azumarill"},
+    {"id": 185, "name": "Sudowoodo", "germanName": "Mogelbaum"},
+    {"id": 186, "name": "Politoed", "germanName": "Quaxo"},
+    {"id": 187, "name": "Hoppip", "germanName": "Hoppspross"},
+    {"id": 188, "name": "Skiploom", "germanName": "Hubelupf"},
+    {"id": 189, "name": "Jumpluff", "germanName": "Papungha"},
+    {"id": 190, "name": "Aipom", "germanName": "Griffel"},
+    {"id": 191, "name": "Sunkern", "germanName": "Sonnkern"},
+    {"id": 192, "name": "Sunflora", "germanName": "Sonnflora"},
+    {"id": 193, "name": "Yanma", "germanName": "Yanma"},
+    {"id": 194, "name": "Wooper", "germanName": "Felino"},
+    {"id": 195, "name": "Quagsire", "germanName": "Morlord"},
+    {"id": 196, "name": "Espeon", "germanName": "Psiana"},
+    {"id": 197, "name": "Umbreon", "germanName": "Nachtara"},
+    {"id": 198, "name": "Murkrow", "germanName": "Kramurx"},
+    {"id": 199, "name": "Slowking", "germanName": "Laschoking"},
+    {"id": 200, "name": "Misdreavus", "germanName": "Traunfugil"},
+    {"id": 201, "name": "Unown", "germanName": "Icognito"},
+    {"id": 202, "name": "Wobbuffet", "germanName": "Woingenau"},
+    {"id": 203, "name": "Girafarig", "germanName": "Girafarig"},
+    {"id": 204, "name": "Pineco", "germanName": "Tannza"},
+    {"id": 205, "name": "Forretress", "germanName": "Forstellka"},
+    {"id": 206, "name": "Dunsparce", "germanName": "Dummisel"},
+    {"id": 207, "name": "Gligar", "germanName": "Skorgla"},
+    {"id": 208, "name": "Steelix", "germanName": "Stahlos"},
+    {"id": 209, "name": "Snubbull", "germanName": "Snubbull"},
+    {"id": 210, "name": "Granbull", "germanName": "Granbull"},
+    {"id": 211, "name": "Qwilfish", "germanName": "Baldorfish"},
+    {"id": 212, "name": "Scizor", "germanName": "Scherox"},
+    {"id": 213, "name": "Shuckle", "germanName": "Pottrott"},
+    {"id": 214, "name": "Heracross", "germanName": "Skaraborn"},
+    {"id": 215, "name": "Sneasel", "germanName": "Sniebel"},
+    {"id": 216, "name": "Teddiursa", "germanName": "Teddiursa"},
+    {"id": 217, "name": "Ursaring", "germanName": "Ursaring"},
+    {"id": 218, "name": "Slugma", "germanName": "Schneckmag"},
+    {"id": 219, "name": "Magcargo", "germanName": "Magcargo"},
+    {"id": 220, "name": "Swinub", "germanName": "Quiekel"},
+    {"id": 221, "name": "Piloswine", "germanName": "Keifel"},
+    {"id": 222, "name": "Corsola", "germanName": "Corasonn"},
+    {"id": 223, "name": "Remoraid", "germanName": "Remoraid"},
+    {"id": 224, "name": "Octillery", "germanName": "Octillery"},
+    {"id": 225, "name": "Delibird", "germanName": "Botogel"},
+    {"id": 226, "name": "Mantine", "germanName": "Mantax"},
+    {"id": 227, "name": "Skarmory", "germanName": "Panzaeron"},
+    {"id": 228, "name": "Houndour", "germanName": "Hunduster"},
+    {"id": 229, "name": "Houndoom", "germanName": "Hundemon"},
+    {"id": 230, "name": "Kingdra", "germanName": "Seedraking"},
+    {"id": 231, "name": "Phanpy", "germanName": "Phanpy"},
+    {"id": 232, "name": "Donphan", "germanName": "Donphan"},
+    {"id": 233, "name": "Porygon2", "germanName": "Porygon2"},
+    {"id": 234, "name": "Stantler", "germanName": "Damhirplex"},
+    {"id": 235, "name": "Smeargle", "germanName": "Farbeagle"},
+    {"id": 236, "name": "Tyrogue", "germanName": "Rabauz"},
+    {"id": 237, "name": "Hitmontop", "germanName": "Kapoera"},
+    {"id": 238, "name": "Smoochum", "germanName": "Kussilla"},
+    {"id": 239, "name": "Elekid", "germanName": "Elekid"},
+    {"id": 240, "name": "Magby", "germanName": "Magby"},
+    {"id": 241, "name": "Miltank", "germanName": "Miltank"},
+    {"id": 242, "name": "Blissey", "germanName": "Heiteira"},
+    {"id": 243, "name": "Raikou", "germanName": "Raikou"},
+    {"id": 244, "name": "Entei", "germanName": "Entei"},
+    {"id": 245, "name": "Suicune", "germanName": "Suicune"},
+    {"id": 246, "name": "Larvitar", "germanName": "Larvitar"},
+    {"id": 247, "name": "Pupitar", "germanName": "Pupitar"},
+    {"id": 248, "name": "Tyranitar", "germanName": "Despotar"},
+    {"id": 249, "name": "Lugia", "germanName": "Lugia"},
+    {"id": 250, "name": "Ho-Oh", "germanName": "Ho-Oh"},
+    {"id": 251, "name": "Celebi", "germanName": "Celebi"}
+]
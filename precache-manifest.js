@@ -0,0 +1,30 @@
+// Generated by build_artifacts.py - do not edit.
+self.PRECACHE = {
+  "version": "89f42832314c",
+  "urls": [
+    "add-subtract-mission.html",
+    "add-subtract.html",
+    "data/pokemon/decoys.20fd5e47.json",
+    "data/pokemon/johto.ad5ac1ac.json",
+    "data/pokemon/kanto.62c7c17f.json",
+    "data/pokemon/manifest.json",
+    "data/pokemon/medals.1a41e109.json",
+    "data/pokemon/names.077642a6.json",
+    "geotriad-game/data/geo.core.json",
+    "geotriad-game/data/geo.de.json",
+    "geotriad-game/data/geo.en.json",
+    "geotriad-game/data/geo.medals.json",
+    "geotriad-game/data/geo.names.json",
+    "geotriad-game/index.html",
+    "js/medals.js",
+    "js/name-index.js",
+    "js/pokemon-decoys.js",
+    "js/progress-store.js",
+    "js/sampler.js",
+    "js/srs.js",
+    "js/timings.js",
+    "js/typed-answer.js",
+    "pokemon-game.html",
+    "geotriad-game/"
+  ]
+};
@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""
+Local static server for the games, behaving like a production host.
+
+Serves a directory (the repository, or dist/ from build_site.py) with
+asyncio streams:
+
+    compression   Accept-Encoding is negotiated against the precompressed
+                  .br / .gz siblings written by build_artifacts.py and
+                  build_site.py; nothing is compressed on the fly
+    validation    every response carries an ETag (size and mtime of the file
+                  served); If-None-Match answers 304
+    caching       content-hashed names (kanto.1a2b3c4d.json,
+                  shared.5a6a1c01.js) are "immutable" for a year; everything
+                  else must be revalidated ("no-cache")
+    ranges        single byte ranges (Range / If-Range) on uncompressed
+                  responses, e.g. for artwork; 416 when unsatisfiable
+    hot cache     small files are kept in memory in an LRU bounded by total
+                  bytes, checked against os.stat() on every request
+
+Only GET and HEAD are served, with HTTP/1.1 keep-alive. Dotfiles and
+dot-directories (.git, .cache, ...) are never served.
+
+StaticServer runs it in a background thread for benchmarks and tests, like
+fixture_server.FixtureServer:
+
+    with StaticServer(REPO_ROOT / "dist") as server:
+        urllib.request.urlopen(f"{server.url}/pokemon-game.html")
+
+Usage:
+    python static_server.py [DIRECTORY] [--port 8000] [--cache-mb 32] [--verbose]
+"""
+
+import argparse
+import asyncio
+import email.utils
+import mimetypes
+import re
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from build_utils import REPO_ROOT
+
+DEFAULT_CACHE_BYTES = 32 * 1024 * 1024   # 32 MiB
+DEFAULT_CACHE_FILE_BYTES = 1024 * 1024   # files above 1 MiB are streamed from disk
+CHUNK_BYTES = 256 * 1024
+KEEP_ALIVE_TIMEOUT = 15                  # seconds an idle connection stays open
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+HASHED_NAME = re.compile(r"\.[0-9a-f]{8}\.[a-z0-9]+$")
+# Preferred first when the client accepts both
+ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+CONTENT_TYPES = {
+    ".js": "text/javascript",
+    ".json": "application/json",
+    ".webp": "image/webp",
+    ".ndjson": "application/x-ndjson",
+    ".md": "text/markdown",
+}
+REASONS = {200: "OK", 206: "Partial Content", 304: "Not Modified", 400: "Bad Request",
+           404: "Not Found", 405: "Method Not Allowed", 416: "Range Not Satisfiable",
+           500: "Internal Server Error"}
+
+
+def content_type(path: Path) -> str:
+    """Content-Type header for a file, with a charset for text."""
+    kind = CONTENT_TYPES.get(path.suffix) or mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    if kind.startswith("text/") or kind in ("application/json", "application/x-ndjson"):
+        kind += "; charset=utf-8"
+    return kind
+
+
+def accepted_encodings(header: str) -> Dict[str, float]:
+    """Accept-Encoding as {coding: q}."""
+    accepted = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        if not coding:
+            continue
+        q = 1.0
+        match = re.search(r"q=([0-9.]+)", params)
+        if match:
+            try:
+                q = float(match.group(1))
+            except ValueError:
+                q = 0.0
+        accepted[coding.strip().lower()] = q
+    return accepted
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """(start, end) inclusive for a single "bytes=" range; None to ignore it.
+
+    Raises ValueError when the range cannot be satisfied.
+    """
+    match = re.fullmatch(r"\s*bytes=(\d*)-(\d*)\s*", header)
+    if not match or match.group(1) == match.group(2) == "":
+        return None  # malformed or multiple ranges: serve the whole file
+    first, last = match.groups()
+    if first == "":
+        length = int(last)
+        if length == 0:
+            raise ValueError("empty suffix range")
+        return max(0, size - length), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError("range starts past the end")
+    return start, end
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    """Whether an If-None-Match header matches etag (weak comparison)."""
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+class HotFileCache:
+    """LRU of small file bodies bounded by total bytes, keyed by path and stat."""
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES, max_file_bytes: int = DEFAULT_CACHE_FILE_BYTES):
+        self.max_bytes = max_bytes
+        self.max_file_bytes = min(max_file_bytes, max_bytes)
+        self.entries: "OrderedDict[Path, Tuple[Tuple[int, int], bytes]]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, path: Path, version: Tuple[int, int]) -> Optional[bytes]:
+        """Cached body of path if it is still at version (mtime_ns, size)."""
+        entry = self.entries.get(path)
+        if entry is None or entry[0] != version:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(path)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, path: Path, version: Tuple[int, int], data: bytes):
+        """Remember data, evicting the least recently used entries."""
+        if len(data) > self.max_file_bytes:
+            return
+        old = self.entries.pop(path, None)
+        if old is not None:
+            self.bytes -= len(old[1])
+        self.entries[path] = (version, data)
+        self.bytes += len(data)
+        while self.bytes > self.max_bytes:
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.bytes -= len(evicted)
+            self.evictions += 1
+
+
+class StaticHandler:
+    """Answers requests for one directory; one instance serves every connection."""
+
+    def __init__(self, directory: Path, cache: Optional[HotFileCache] = None, verbose: bool = False):
+        self.directory = Path(directory).resolve()
+        self.cache = cache if cache is not None else HotFileCache()
+        self.verbose = verbose
+        self.stats = {"requests": 0, "bytes": 0, "notModified": 0, "partial": 0,
+                      "encodings": {"br": 0, "gzip": 0, "identity": 0}}
+
+    # -------------------------------------------------------------------
+    # Connections
+    # -------------------------------------------------------------------
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve requests on one connection until it closes or idles out."""
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEP_ALIVE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, asyncio.LimitOverrunError):
+                    break
+                keep_alive = await self.handle_request(head, writer)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.CancelledError):
+            # Cancelled when the server shuts down with the connection idle
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, asyncio.CancelledError):
+                pass
+
+    async def handle_request(self, head: bytes, writer: asyncio.StreamWriter) -> bool:
+        """Answer one request. Returns whether the connection stays open."""
+        start = time.perf_counter()
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ")
+        except ValueError:
+            self.send(writer, 400, {}, b"Bad request\n")
+            return False
+        headers = {}
+        for line in lines[1:]:
+            name, sep, value = line.partition(":")
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+        try:
+            status = await self.respond(method, target, headers, writer)
+        except OSError as error:
+            print(f"✗ {method} {target}: {error}")
+            self.send(writer, 500, {}, b"Internal server error\n")
+            return False
+        self.stats["requests"] += 1
+        if self.verbose:
+            print(f"{method} {target} {status} {(time.perf_counter() - start) * 1000:.1f}ms")
+        return keep_alive
+
+    def send(self, writer: asyncio.StreamWriter, status: int, headers: Dict[str, str],
+             body: bytes = b"", head_only: bool = False, length: Optional[int] = None) -> int:
+        """Write a status line, headers and (unless head_only) body."""
+        if status != 304:
+            headers.setdefault("Content-Length", str(len(body) if length is None else length))
+        headers["Date"] = email.utils.formatdate(usegmt=True)
+        headers["Server"] = "small-apps"
+        lines = [f"HTTP/1.1 {status} {REASONS[status]}"] + [f"{name}: {value}" for name, value in headers.items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        if body and not head_only:
+            writer.write(body)
+            self.stats["bytes"] += len(body)
+        return status
+
+    # -------------------------------------------------------------------
+    # Files
+    # -------------------------------------------------------------------
+    def resolve(self, target: str) -> Optional[Path]:
+        """File for a request target, or None if missing or not servable."""
+        path = urllib.parse.unquote(urllib.parse.urlsplit(target).path)
+        parts = [part for part in path.split("/") if part]
+        if "\0" in path or any(part.startswith(".") for part in parts):
+            return None
+        file = self.directory.joinpath(*parts)
+        try:
+            if file.is_dir():
+                file = file / "index.html"
+            file = file.resolve()
+        except (OSError, ValueError):
+            return None
+        if not file.is_relative_to(self.directory) or not file.is_file():
+            return None
+        return file
+
+    def select_encoding(self, file: Path, accept: str) -> Tuple[Path, str, bool]:
+        """(file to send, coding, whether other codings exist) for Accept-Encoding."""
+        accepted = accepted_encodings(accept)
+        has_variants = False
+        chosen = (file, "identity")
+        for coding, suffix in ENCODINGS:
+            sibling = file.with_name(file.name + suffix)
+            if not sibling.is_file():
+                continue
+            has_variants = True
+            q = accepted.get(coding, accepted.get("*", 0.0))
+            if q > 0 and chosen[1] == "identity":
+                chosen = (sibling, coding)
+        return chosen[0], chosen[1], has_variants
+
+    async def read(self, file: Path, version: Tuple[int, int]) -> Optional[bytes]:
+        """Body of a small file from the hot cache or disk; None for large files."""
+        if version[1] > self.cache.max_file_bytes:
+            return None
+        data = self.cache.get(file, version)
+        if data is None:
+            data = await asyncio.get_running_loop().run_in_executor(None, file.read_bytes)
+            self.cache.put(file, version, data)
+        return data
+
+    async def stream(self, writer: asyncio.StreamWriter, file: Path, start: int, length: int):
+        """Send length bytes of a large file from start, a chunk at a time."""
+        loop = asyncio.get_running_loop()
+        with open(file, "rb") as f:
+            f.seek(start)
+            while length > 0:
+                chunk = await loop.run_in_executor(None, f.read, min(CHUNK_BYTES, length))
+                if not chunk:
+                    break
+                writer.write(chunk)
+                self.stats["bytes"] += len(chunk)
+                length -= len(chunk)
+                await writer.drain()
+
+    async def respond(self, method: str, target: str, headers: Dict[str, str],
+                      writer: asyncio.StreamWriter) -> int:
+        """Answer one GET/HEAD request. Returns the status sent."""
+        if method not in ("GET", "HEAD"):
+            return self.send(writer, 405, {"Allow": "GET, HEAD"}, b"Method not allowed\n")
+        head_only = method == "HEAD"
+        file = self.resolve(target)
+        if file is None:
+            return self.send(writer, 404, {"Content-Type": "text/plain; charset=utf-8"},
+                             b"Not found\n", head_only)
+
+        served, coding, has_variants = self.select_encoding(file, headers.get("accept-encoding", ""))
+        stat = served.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}' + ("" if coding == "identity" else f"-{coding}") + '"'
+        response = {
+            "Content-Type": content_type(file),
+            "ETag": etag,
+            "Last-Modified": email.utils.formatdate(stat.st_mtime, usegmt=True),
+            "Cache-Control": IMMUTABLE if HASHED_NAME.search(file.name) else REVALIDATE,
+        }
+        if has_variants:
+            response["Vary"] = "Accept-Encoding"
+        if coding != "identity":
+            response["Content-Encoding"] = coding
+        else:
+            response["Accept-Ranges"] = "bytes"
+
+        if etag_matches(headers.get("if-none-match", ""), etag):
+            self.stats["notModified"] += 1
+            del response["Content-Type"]
+            return self.send(writer, 304, response)
+
+        size = stat.st_size
+        start, end, status = 0, size - 1, 200
+        if "range" in headers and coding == "identity" and headers.get("if-range", etag) == etag:
+            try:
+                byte_range = parse_range(headers["range"], size)
+            except ValueError:
+                return self.send(writer, 416, {"Content-Range": f"bytes */{size}"}, b"", head_only)
+            if byte_range:
+                start, end = byte_range
+                status = 206
+                response["Content-Range"] = f"bytes {start}-{end}/{size}"
+                self.stats["partial"] += 1
+        length = end - start + 1 if size else 0
+        self.stats["encodings"][coding] += 1
+
+        data = await self.read(served, version)
+        if data is not None:
+            return self.send(writer, status, response, data[start:end + 1], head_only)
+        self.send(writer, status, response, head_only=True, length=length)
+        if not head_only:
+            await self.stream(writer, served, start, length)
+        return status
+
+
+class StaticServer:
+    """Static server on a background event loop, usable as a context manager."""
+
+    def __init__(self, directory=REPO_ROOT, port: int = 0, host: str = "127.0.0.1",
+                 cache_bytes: int = DEFAULT_CACHE_BYTES, verbose: bool = False):
+        self.handler = StaticHandler(directory, HotFileCache(cache_bytes), verbose)
+        self.host = host
+        self.port = port
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def stats(self) -> Dict:
+        cache = self.handler.cache
+        return {**self.handler.stats, "cacheHits": cache.hits, "cacheMisses": cache.misses,
+                "cacheBytes": cache.bytes, "cacheEvictions": cache.evictions}
+
+    def __enter__(self):
+        self.thread.start()
+        self.server = asyncio.run_coroutine_threadsafe(
+            asyncio.start_server(self.handler.handle_connection, self.host, self.port), self.loop
+        ).result()
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    def __exit__(self, *exc):
+        async def close():
+            self.server.close()
+            await self.server.wait_closed()
+            # Keep-alive connections outlive the listening socket
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        asyncio.run_coroutine_threadsafe(close(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+async def serve(directory: Path, host: str, port: int, cache_bytes: int, verbose: bool):
+    """Serve directory until cancelled."""
+    handler = StaticHandler(directory, HotFileCache(cache_bytes), verbose)
+    server = await asyncio.start_server(handler.handle_connection, host, port)
+    print(f"Serving {directory} at http://{host}:{port} (Ctrl+C to stop)")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("directory", type=Path, nargs="?", default=REPO_ROOT)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--cache-mb", type=float, default=DEFAULT_CACHE_BYTES / 1024 / 1024,
+                        help="memory for the hot-file cache")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.directory.resolve(), args.host, args.port,
+                          int(args.cache_mb * 1024 * 1024), args.verbose))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+// Service worker shared by all games.
+//
+// - The app shell and game data listed in precache-manifest.js are cached on
+//   install under a version derived from their content hashes (written by
+//   build_artifacts.py), and old versions are dropped on activate.
+// - Pages are served stale-while-revalidate, so repeat loads are instant and
+//   an edited page shows up on the next visit.
+// - Content-hashed local artwork is immutable and served cache-first; other
+//   artwork is served stale-while-revalidate. Both share a cache capped at
+//   ARTWORK_CACHE_LIMIT entries, except opaque (no-CORS cross-origin)
+//   responses: browsers pad each of those to several MB of storage quota,
+//   so they get their own cache of OPAQUE_CACHE_LIMIT entries.
+
+importScripts('precache-manifest.js');
+
+const PRECACHE_NAME = `precache-${self.PRECACHE.version}`;
+const ARTWORK_CACHE_NAME = 'artwork-v2';
+const ARTWORK_CACHE_LIMIT = 300;
+const OPAQUE_CACHE_NAME = 'artwork-opaque-v1';
+const OPAQUE_CACHE_LIMIT = 20;
+const RUNTIME_CACHES = [PRECACHE_NAME, ARTWORK_CACHE_NAME, OPAQUE_CACHE_NAME];
+// build_artwork.py / build_site.py names: <name>.<8 hex digits>.<ext>
+const HASHED_ASSET = /\.[0-9a-f]{8}\.[a-z0-9]+$/;
+
+const precacheUrls = new Set(self.PRECACHE.urls.map(url => new URL(url, self.location).href));
+
+self.addEventListener('install', event => {
+    event.waitUntil(
+        caches.open(PRECACHE_NAME)
+            .then(cache => cache.addAll([...precacheUrls]))
+            .then(() => self.skipWaiting())
+    );
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil(
+        caches.keys()
+            .then(names => Promise.all(
+                names
+                    .filter(name => /^(precache|artwork)-/.test(name) && !RUNTIME_CACHES.includes(name))
+                    .map(name => caches.delete(name))
+            ))
+            .then(() => self.clients.claim())
+    );
+});
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    if (request.method !== 'GET') return;
+
+    const url = new URL(request.url);
+    url.search = '';
+
+    if (request.destination === 'image') {
+        event.respondWith(artwork(request, url));
+    } else if (request.mode === 'navigate') {
+        event.respondWith(staleWhileRevalidate(request, PRECACHE_NAME));
+    } else if (precacheUrls.has(url.href)) {
+        event.respondWith(
+            caches.match(request, { ignoreSearch: true }).then(cached => cached || fetch(request))
+        );
+    }
+});
+
+// Answer from cache when possible and refresh the entry in the background
+async function staleWhileRevalidate(request, cacheName) {
+    const cache = await caches.open(cacheName);
+    const cached = await cache.match(request, { ignoreSearch: true });
+
+    const refresh = fetch(request).then(async response => {
+        if (response.ok) await cache.put(request, response.clone());
+        return response;
+    });
+
+    if (cached) {
+        refresh.catch(() => {});
+        return cached;
+    }
+    return refresh;
+}
+
+// Hashed same-origin artwork: cache first, never revalidated. Otherwise
+// stale-while-revalidate, with opaque responses kept in the small cache.
+async function artwork(request, url) {
+    const cache = await caches.open(ARTWORK_CACHE_NAME);
+    const opaqueCache = await caches.open(OPAQUE_CACHE_NAME);
+    const cached = await cache.match(request, { ignoreSearch: true })
+        || await opaqueCache.match(request, { ignoreSearch: true });
+    if (cached && url.origin === self.location.origin && HASHED_ASSET.test(url.pathname)) {
+        return cached;
+    }
+
+    const refresh = fetch(request).then(async response => {
+        if (response.ok) {
+            await cache.put(request, response.clone());
+            await trimCache(cache, ARTWORK_CACHE_LIMIT);
+        } else if (response.type === 'opaque') {
+            await opaqueCache.put(request, response.clone());
+            await trimCache(opaqueCache, OPAQUE_CACHE_LIMIT);
+        }
+        return response;
+    });
+
+    if (cached) {
+        refresh.catch(() => {});
+        return cached;
+    }
+    return refresh;
+}
+
+// Delete the oldest entries (keys() is in insertion order) beyond limit
+async function trimCache(cache, limit) {
+    const keys = await cache.keys();
+    await Promise.all(keys.slice(0, Math.max(0, keys.length - limit)).map(key => cache.delete(key)));
+}
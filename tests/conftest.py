@@ -0,0 +1,7 @@
+"""Shared pytest setup: make the repository's top-level modules importable."""
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
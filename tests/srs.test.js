@@ -0,0 +1,43 @@
+// js/srs.js: due-order picks and exclusions (node --test tests/)
+
+const test = require('node:test');
+const assert = require('node:assert');
+const { createScheduler, BOX_INTERVALS } = require('../js/srs.js');
+
+const MINUTE = BOX_INTERVALS[1];
+
+test('nextDue returns the earliest due item across boxes', () => {
+    const scheduler = createScheduler();
+    scheduler.answer(1, false, 0);          // box 1, due at 1 minute
+    scheduler.answer(2, false, 10);         // box 1, due just after
+    scheduler.answer(3, true, 0);           // known box, due in an hour
+    assert.strictEqual(scheduler.nextDue(0), null);
+    assert.strictEqual(scheduler.nextDue(MINUTE + 10), 1);
+});
+
+test('an excluded head does not hide due items behind it in its box', () => {
+    const scheduler = createScheduler();
+    scheduler.answer(1, false, 0);
+    scheduler.answer(2, false, 10);
+    scheduler.answer(3, false, 20);
+    const later = MINUTE + 20;
+    assert.strictEqual(scheduler.nextDue(later, id => id === 1), 2);
+    assert.strictEqual(scheduler.nextDue(later, id => id === 1 || id === 2), 3);
+    assert.strictEqual(scheduler.nextDue(later, () => true), null);
+});
+
+test('items behind an excluded head that are not due yet are not picked', () => {
+    const scheduler = createScheduler();
+    scheduler.answer(1, false, 0);
+    scheduler.answer(2, false, 5 * MINUTE);
+    assert.strictEqual(scheduler.nextDue(MINUTE, id => id === 1), null);
+});
+
+test('entries left behind by moved items are skipped', () => {
+    const scheduler = createScheduler();
+    scheduler.answer(1, false, 0);
+    scheduler.answer(2, false, 10);
+    scheduler.answer(3, false, 20);
+    scheduler.answer(2, true, 30);          // 2 leaves box 1
+    assert.strictEqual(scheduler.nextDue(MINUTE + 20, id => id === 1), 3);
+});
@@ -0,0 +1,90 @@
+"""build_artwork.py against a local FixtureServer standing in for the artwork host."""
+
+import io
+import json
+import re
+
+import pytest
+
+pytest.importorskip("PIL")
+from PIL import Image  # noqa: E402
+
+import build_artwork  # noqa: E402
+from fixture_server import FixtureServer  # noqa: E402
+from http_cache import HttpCache  # noqa: E402
+
+
+def png(size: int) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGBA", (size, size), (200, 40, 40, 255)).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def artwork(tmp_path, monkeypatch):
+    """Served originals plus a pokemon.json pointing at them; module paths moved to tmp_path."""
+    images = tmp_path / "images"
+    images.mkdir()
+    (images / "Mr._Mime.png").write_bytes(png(800))
+    (images / "pichu.png").write_bytes(png(200))
+    monkeypatch.setattr(build_artwork, "REPO_ROOT", tmp_path)
+    monkeypatch.setattr(build_artwork, "DATA_PATH", tmp_path / "pokemon.json")
+    monkeypatch.setattr(build_artwork, "ARTWORK_DIR", tmp_path / "assets" / "artwork")
+    monkeypatch.setattr(build_artwork, "MANIFEST_PATH", tmp_path / "artwork-manifest.json")
+    build_artwork.ARTWORK_DIR.mkdir(parents=True)
+    return images
+
+
+def run(tmp_path, server, cache_name):
+    """One build against server, writing the manifest like main() does."""
+    records = [
+        {"id": 122, "imageUrl": f"{server.url}/Mr._Mime.png"},
+        {"id": 172, "imageUrl": f"{server.url}/pichu.png"},
+    ]
+    build_artwork.DATA_PATH.write_text(json.dumps(records))
+    cache = HttpCache(cache_dir=tmp_path / cache_name, verbose=False)
+    manifest = build_artwork.build_artwork(None, cache, workers=2)
+    build_artwork.MANIFEST_PATH.write_text(json.dumps(manifest))
+    return manifest
+
+
+def test_variants_are_named_by_slug_width_and_hash(tmp_path, artwork):
+    with FixtureServer(artwork) as server:
+        manifest = run(tmp_path, server, "cache")
+    entry = manifest["122"]
+    assert entry["width"] == entry["height"] == 640
+    assert entry["src"].startswith("assets/artwork/mr-mime-320.")
+    names = build_artwork.variant_files(entry)
+    assert {re.sub(r"\.[0-9a-f]{8}\.", ".", name) for name in names} >= {
+        "mr-mime-160.webp", "mr-mime-320.webp", "mr-mime-640.webp"
+    }
+    for name in names:
+        assert re.fullmatch(r"mr-mime-(160|320|640)\.[0-9a-f]{8}\.(webp|avif)", name)
+        assert (build_artwork.ARTWORK_DIR / name).exists()
+
+
+def test_small_originals_are_not_upscaled(tmp_path, artwork):
+    with FixtureServer(artwork) as server:
+        manifest = run(tmp_path, server, "cache")
+    entry = manifest["172"]
+    assert (entry["width"], entry["height"]) == (200, 200)
+    assert entry["srcset"]["webp"].endswith(" 200w")
+    assert " 320w" not in entry["srcset"]["webp"]
+    for name in build_artwork.variant_files(entry):
+        with Image.open(build_artwork.ARTWORK_DIR / name) as image:
+            assert image.width <= 200
+
+
+def test_failed_downloads_keep_previous_variants(tmp_path, artwork):
+    with FixtureServer(artwork) as server:
+        first = run(tmp_path, server, "cache")
+    stray = build_artwork.ARTWORK_DIR / "gone-160.00000000.webp"
+    stray.write_bytes(b"")
+    # Fresh cache, every request answered with 503
+    with FixtureServer(artwork, failure_rate=1.0) as server:
+        second = run(tmp_path, server, "cold-cache")
+    assert second == first
+    for entry in second.values():
+        for name in build_artwork.variant_files(entry):
+            assert (build_artwork.ARTWORK_DIR / name).exists()
+    assert not stray.exists()
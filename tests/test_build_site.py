@@ -0,0 +1,143 @@
+"""build_site.py: splitting style sheets must not change the cascade."""
+
+import build_site
+
+
+def page(name, css, html=""):
+    return {"name": name, "path": f"{name}.html", "html": html, "scripts": [],
+            "rules": build_site.parse_rules(css)}
+
+
+def loaded_declarations(page_plan):
+    """(media, selector, declaration) in the order the page applies them: <style>, sheets, <style>."""
+    sheets = [page_plan["inline"]] + [css.decode("utf-8") for _, css in page_plan["sheets"]] + [page_plan["after"]]
+    return [(rule["media"], rule["selector"], declaration) for css in sheets
+            for rule in build_site.parse_rules(css) for declaration in build_site.declarations(rule["body"])]
+
+
+def assert_cascade_kept(pages, plans):
+    """Every declaration of a page is loaded, and conflicting ones last load in source order."""
+    for source in pages:
+        loaded = loaded_declarations(plans[source["name"]])
+        order = {key: index for index, key in enumerate(loaded)}
+        # A declaration repeated in the source takes effect where it last appears
+        declarations = list(reversed(dict.fromkeys(reversed([
+            (rule["media"], rule["selector"], declaration)
+            for rule in source["rules"] for declaration in build_site.declarations(rule["body"])]))))
+        assert set(order) == set(declarations), source["name"]
+        classes = build_site.element_classes([source["html"]])
+        rules = [build_site.make_rule(media, selector, [declaration]) for media, selector, declaration in declarations]
+        for i, earlier in enumerate(declarations):
+            for j in range(i + 1, len(declarations)):
+                if build_site.conflicts(rules[i], rules[j], classes):
+                    assert order[earlier] < order[declarations[j]], (source["name"], earlier, declarations[j])
+
+
+def test_shared_media_rule_after_a_plain_page_rule_stays_last():
+    shared = "@media (max-width:600px){h1{font-size:1.5rem}}"
+    pages = [page("a", f"h1{{font-size:1.8rem;color:red}}{shared}"),
+             page("b", f"h1{{font-size:2rem}}{shared}")]
+    groups, plans = build_site.css_plan(pages, {"a", "b"})
+    assert len(groups) == 1
+    assert_cascade_kept(pages, plans)
+
+
+def test_shared_rule_after_a_page_rule_with_another_selector_stays_last():
+    hover = "button:hover:not(:disabled){transform:translateY(-2px)}"
+    active = "button:active:not(:disabled){transform:translateY(0)}"
+    pages = [page("a", f"{hover}.a{{color:red}}{active}"), page("b", f"{active}.b{{color:blue}}")]
+    _, plans = build_site.css_plan(pages, {"a", "b"})
+    assert_cascade_kept(pages, plans)
+
+
+def test_shared_rules_in_another_order_keep_each_pages_order():
+    first, second = ".x{margin:0}", ".y{margin-top:4px}"
+    pages = [page("a", first + second), page("b", second + first)]
+    _, plans = build_site.css_plan(pages, {"a", "b"})
+    assert_cascade_kept(pages, plans)
+
+
+def test_pages_load_only_shared_rules_they_have():
+    pages = [page("a", ".ab{color:red}.abc{margin:0}"), page("b", ".ab{color:red}.abc{margin:0}"),
+             page("c", ".abc{margin:0}.c{padding:0}")]
+    groups, plans = build_site.css_plan(pages, {"a", "b", "c"})
+    assert {group["pages"] for group in groups} == {("a", "b"), ("a", "b", "c")}
+    assert_cascade_kept(pages, plans)
+
+
+def test_common_declarations_of_differing_rules_are_shared():
+    pages = [page("a", ".card{display:flex;color:gold;gap:8px}"), page("b", ".card{display:flex;color:teal;gap:8px}")]
+    groups, plans = build_site.css_plan(pages, {"a", "b"})
+    assert [rule["text"] for rule in groups[0]["rules"]] == [".card{display:flex;gap:8px}"]
+    assert plans["a"]["inline"] == ".card{color:gold}"
+    assert_cascade_kept(pages, plans)
+
+
+def test_common_declaration_after_a_differing_overlapping_one_is_not_shared():
+    pages = [page("a", ".card{border:1px solid;border-color:red}"), page("b", ".card{border:2px solid;border-color:red}")]
+    groups, plans = build_site.css_plan(pages, {"a", "b"})
+    assert groups == []
+    assert_cascade_kept(pages, plans)
+
+
+def test_inlined_rules_are_not_loaded_again():
+    html = '<main class="card"></main>'
+    pages = [page("a", ".card{color:red}.own{margin:0}", html), page("b", ".card{color:red}.other{padding:0}", html)]
+    groups, plans = build_site.css_plan(pages, {"a", "b"})
+    assert [url for url, _ in plans["a"]["sheets"]] == [groups[0]["url"]]
+    assert plans["a"]["inline"] == ".card{color:red}.own{margin:0}"
+    assert plans["a"]["after"] == ""
+
+
+def test_rules_on_elements_that_never_meet_keep_their_sheets():
+    html = '<p class="label"></p><p class="value"></p>'
+    shared = ".value{color:gold}"
+    pages = [page("a", f"{shared}.label{{color:red}}", html), page("b", shared, html)]
+    _, plans = build_site.css_plan(pages, {"a", "b"})
+    assert plans["a"]["after"] == ""
+    assert_cascade_kept(pages, plans)
+    # Without the markup the classes could meet, so the page's rule must follow the shared one
+    pages = [page("a", f"{shared}.label{{color:red}}"), page("b", shared)]
+    _, plans = build_site.css_plan(pages, {"a", "b"})
+    assert plans["a"]["after"] == ".label{color:red}"
+    assert_cascade_kept(pages, plans)
+
+
+def test_only_equal_specificity_on_one_element_conflicts():
+    rule = build_site.parse_rules
+    assert not build_site.conflicts(rule("#a{color:red}")[0], rule(".b{color:blue}")[0])
+    assert not build_site.conflicts(rule(".a::after{color:red}")[0], rule(".b{color:blue}")[0])
+    assert not build_site.conflicts(rule("p{color:red}")[0], rule("li{color:blue}")[0])
+    assert build_site.conflicts(rule(".a{color:red}")[0], rule(".b{color:blue}")[0])
+    assert build_site.conflicts(rule(".a:hover{color:red}")[0], rule(".b.c{color:blue}")[0])
+    assert build_site.conflicts(rule(".a{margin:0}")[0], rule(".b{margin-top:1px}")[0])
+    classes = build_site.element_classes(['<p class="a x"></p><p class="b"></p>', "el.classList.add('on')"])
+    assert not build_site.conflicts(rule(".a{color:red}")[0], rule(".b{color:blue}")[0], classes)
+    assert build_site.conflicts(rule(".a{color:red}")[0], rule(".x{color:blue}")[0], classes)
+    assert build_site.conflicts(rule(".b{color:red}")[0], rule(".on{color:blue}")[0], classes)
+    assert build_site.element_classes(["el.className = name;"]) is None
+
+
+def test_declarations_split_outside_strings_and_parentheses():
+    body = "background:url(\"data:a;b\");content:';';color:red"
+    assert build_site.declarations(body) == ['background:url("data:a;b")', "content:';'", "color:red"]
+
+
+def test_repository_pages_keep_their_cascade_when_split():
+    pages = [build_site.page_sources(source) for source in build_site.PAGES]
+    _, plans = build_site.css_plan(pages, {source["name"] for source in pages})
+    for source in pages:
+        source["html"] += "".join((build_site.REPO_ROOT / script).read_text(encoding="utf-8")
+                                  for script in source["scripts"])
+    assert_cascade_kept(pages, plans)
+
+
+def test_build_shares_css_and_no_page_gets_heavier(tmp_path):
+    rows = build_site.build_site(tmp_path)
+    assert any(url.endswith(".css") for row in rows for url in row["assets"])
+    for row in rows:
+        assert row["firstVisit"] <= row["before"], row["page"]
+
+
+def test_minify_css_collapses_whitespace_around_comments():
+    assert build_site.minify_css("a {\n  margin: 0; /* note */\n  padding: 0;\n}") == "a{margin:0;padding:0}"
@@ -0,0 +1,115 @@
+"""HttpCache against a local FixtureServer."""
+
+import json
+
+import pytest
+
+from fixture_server import FixtureServer
+from http_cache import HttpCache
+
+
+@pytest.fixture
+def site(tmp_path):
+    """A served directory with two small files."""
+    root = tmp_path / "site"
+    root.mkdir()
+    (root / "a.json").write_text('{"a": 1}')
+    (root / "b.json").write_text('{"b": 2}')
+    return root
+
+
+def make_cache(tmp_path, **options):
+    return HttpCache(cache_dir=tmp_path / "cache", verbose=True, **options)
+
+
+def test_fresh_entry_is_served_without_the_network(tmp_path, site, capsys):
+    with FixtureServer(site) as server:
+        cache = make_cache(tmp_path)
+        assert cache.get(f"{server.url}/a.json") == b'{"a": 1}'
+        (site / "a.json").write_text('{"a": "changed"}')
+        assert cache.get(f"{server.url}/a.json") == b'{"a": 1}'
+    assert "Cache hit" in capsys.readouterr().out
+
+
+def test_stale_entry_is_revalidated_with_etag(tmp_path, site, capsys):
+    with FixtureServer(site) as server:
+        cache = make_cache(tmp_path, ttl=0)
+        url = f"{server.url}/a.json"
+        assert cache.get(url) == b'{"a": 1}'
+        assert cache.index[url]["etag"]
+        assert cache.get(url) == b'{"a": 1}'
+    assert "Revalidated cached copy" in capsys.readouterr().out
+
+
+def test_stale_entry_is_revalidated_with_last_modified(tmp_path, site, capsys):
+    with FixtureServer(site) as server:
+        cache = make_cache(tmp_path, ttl=0)
+        url = f"{server.url}/a.json"
+        cache.get(url)
+        assert cache.index[url]["last_modified"]
+        cache.index[url]["etag"] = None
+        assert cache.get(url) == b'{"a": 1}'
+    assert "Revalidated cached copy" in capsys.readouterr().out
+
+
+def test_expired_entry_picks_up_changes(tmp_path, site):
+    with FixtureServer(site) as server:
+        cache = make_cache(tmp_path, ttl=0)
+        url = f"{server.url}/a.json"
+        cache.get(url)
+        (site / "a.json").write_text('{"a": "changed"}')
+        assert cache.get(url) == b'{"a": "changed"}'
+
+
+def test_offline_serves_cache_and_misses_return_none(tmp_path, site):
+    with FixtureServer(site) as server:
+        url = server.url
+        make_cache(tmp_path).get(f"{url}/a.json")
+    offline = make_cache(tmp_path, offline=True, ttl=0)
+    assert offline.get(f"{url}/a.json") == b'{"a": 1}'
+    assert offline.get(f"{url}/b.json") is None
+
+
+def test_network_error_serves_stale_copy(tmp_path, site, capsys):
+    with FixtureServer(site) as server:
+        url = f"{server.url}/a.json"
+        cache = make_cache(tmp_path, ttl=0)
+        cache.get(url)
+    assert cache.get(url, timeout=1, retries=0) == b'{"a": 1}'
+    assert "serving stale cached copy" in capsys.readouterr().out
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path, site):
+    (site / "c.json").write_text('{"c": 3}')
+    with FixtureServer(site) as server:
+        cache = make_cache(tmp_path, max_bytes=20)
+        a, b, c = (f"{server.url}/{name}.json" for name in "abc")
+        cache.get(a)
+        cache.get(b)
+        cache.index[a]["last_used"] += 1  # a used after b
+        cache.get(c)
+    assert set(cache.index) == {a, c}
+    objects = {path.name for path in cache.objects_dir.iterdir()}
+    assert objects == {cache.index[a]["sha256"], cache.index[c]["sha256"]}
+
+
+def test_eviction_keeps_in_flight_temporary_objects(tmp_path, site):
+    with FixtureServer(site) as server:
+        cache = make_cache(tmp_path, max_bytes=10)
+        in_flight = cache.objects_dir / "0123abcd.tmp"
+        in_flight.write_bytes(b"partial")
+        cache.get(f"{server.url}/a.json")
+        cache.get(f"{server.url}/b.json")
+    assert in_flight.exists()
+
+
+def test_cache_hits_are_persisted_on_flush(tmp_path, site):
+    with FixtureServer(site) as server:
+        url = f"{server.url}/a.json"
+        cache = make_cache(tmp_path)
+        cache.get(url)
+        saved = cache.index_path.read_text()
+        cache.get(url)
+        assert cache.index_path.read_text() == saved
+        cache.flush()
+    assert json.loads(cache.index_path.read_text())[url]["last_used"] == cache.index[url]["last_used"]
@@ -0,0 +1,16 @@
+"""Runs the browser modules' node:test files (tests/*.test.js) under pytest."""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+TESTS_DIR = Path(__file__).resolve().parent
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="needs Node.js")
+@pytest.mark.parametrize("path", sorted(TESTS_DIR.glob("*.test.js")), ids=lambda path: path.name)
+def test_node(path):
+    result = subprocess.run(["node", "--test", str(path)], capture_output=True, text=True)
+    assert result.returncode == 0, result.stdout + result.stderr
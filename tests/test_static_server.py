@@ -0,0 +1,68 @@
+"""static_server.py: negotiation, caching headers, ranges and hostile paths."""
+
+import gzip
+import http.client
+import socket
+
+import pytest
+
+from static_server import IMMUTABLE, REVALIDATE, StaticServer
+
+
+@pytest.fixture
+def server(tmp_path):
+    (tmp_path / "index.html").write_text("<h1>home</h1>")
+    (tmp_path / "app.0123abcd.js").write_text("console.log(1);" * 50)
+    (tmp_path / "app.0123abcd.js.gz").write_bytes(gzip.compress((tmp_path / "app.0123abcd.js").read_bytes()))
+    (tmp_path / "image.png").write_bytes(bytes(range(256)))
+    (tmp_path / ".secret").write_text("hidden")
+    with StaticServer(tmp_path) as running:
+        yield running
+
+
+def get(server, path, headers=None):
+    connection = http.client.HTTPConnection(server.host, server.port, timeout=5)
+    connection.request("GET", path, headers=headers or {})
+    response = connection.getresponse()
+    body = response.read()
+    connection.close()
+    return response, body
+
+
+def test_precompressed_sibling_is_negotiated(server):
+    response, body = get(server, "/app.0123abcd.js", {"Accept-Encoding": "gzip"})
+    assert response.getheader("Content-Encoding") == "gzip"
+    assert response.getheader("Vary") == "Accept-Encoding"
+    assert response.getheader("Cache-Control") == IMMUTABLE
+    assert gzip.decompress(body) == b"console.log(1);" * 50
+
+    response, body = get(server, "/app.0123abcd.js")
+    assert response.getheader("Content-Encoding") is None
+    assert body == b"console.log(1);" * 50
+
+
+def test_unhashed_files_revalidate_with_etag(server):
+    response, _ = get(server, "/")
+    assert response.getheader("Cache-Control") == REVALIDATE
+    etag = response.getheader("ETag")
+    response, body = get(server, "/index.html", {"If-None-Match": etag})
+    assert response.status == 304 and body == b""
+
+
+def test_range_requests(server):
+    response, body = get(server, "/image.png", {"Range": "bytes=10-19"})
+    assert response.status == 206
+    assert response.getheader("Content-Range") == "bytes 10-19/256"
+    assert body == bytes(range(10, 20))
+    response, _ = get(server, "/image.png", {"Range": "bytes=300-"})
+    assert response.status == 416
+
+
+@pytest.mark.parametrize("path", ["/.secret", "/../etc/passwd", "/missing.js", "/%00", "/a%00b.js"])
+def test_unservable_paths_are_404(server, path):
+    with socket.create_connection((server.host, server.port), timeout=5) as sock:
+        sock.sendall(f"GET {path} HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n".encode())
+        reply = b""
+        while chunk := sock.recv(4096):
+            reply += chunk
+    assert reply.startswith(b"HTTP/1.1 404")
@@ -0,0 +1,51 @@
+// js/typed-answer.js and the GeoTriad typed-answer hints (node --test tests/)
+
+const test = require('node:test');
+const assert = require('node:assert');
+const path = require('path');
+const vm = require('vm');
+const { createPageContext, pageScripts } = require('../benchmarks/bench_games.js');
+
+const REPO_ROOT = path.resolve(__dirname, '..');
+
+function load(context, file) {
+    vm.runInContext(require('fs').readFileSync(file, 'utf8'), context, { filename: file });
+}
+
+test('showHint stays visible after the player has typed', () => {
+    const context = createPageContext(REPO_ROOT, REPO_ROOT);
+    load(context, path.join(REPO_ROOT, 'js/typed-answer.js'));
+    const container = context.document.createElement('div');
+    const typed = context.renderTypedAnswer(container, { suggest: () => [], onSubmit() {} });
+    assert.strictEqual(typed.hint.hidden, true);
+    typed.input.value = 'Ber';
+    typed.showHint('Berlin');
+    assert.strictEqual(typed.hint.hidden, false);
+    assert.strictEqual(typed.hint.textContent, 'Berlin');
+    assert.ok(container.querySelectorAll('.typed-hint').includes(typed.hint));
+    assert.strictEqual(typed.input.value, 'Ber');
+});
+
+test('GeoTriad hint 3 shows the answer in typed mode', async () => {
+    const pagePath = path.join(REPO_ROOT, 'geotriad-game/index.html');
+    const context = createPageContext(path.dirname(pagePath), REPO_ROOT);
+    pageScripts(pagePath).forEach(script => vm.runInContext(script.source, context, { filename: script.file }));
+    await Promise.all(context.dispatch('load'));
+    await vm.runInContext('gameState.typedAnswers = true; gameState.coins = 10; loadNameIndex()', context);
+
+    context.startGame();
+    for (let tries = 0; !vm.runInContext('typedAnswer', context); tries++) {
+        assert.ok(tries < 200, 'no typed question drawn');
+        context.nextQuestion();
+    }
+    const typed = vm.runInContext('typedAnswer', context);
+    typed.input.value = 'x';
+    context.useHint(3);
+
+    const answer = vm.runInContext(
+        'currentQuestion.country[`${currentQuestion.mode.id}_${gameState.language}`]', context);
+    assert.ok(answer);
+    assert.strictEqual(typed.hint.hidden, false);
+    assert.strictEqual(typed.hint.textContent, answer);
+    assert.strictEqual(vm.runInContext('gameState.coins', context), 7);
+});
@@ -0,0 +1,563 @@
+#!/usr/bin/env python3
+"""
+Dataset Validator
+Checks data/pokemon.json and geotriad-game/data/geo.json in a single pass
+per dataset, plus the files derived from them (pokemon_sources/, the
+per-game artifacts and continents.json).
+
+Every rule has a severity. Errors make the exit code nonzero; warnings
+(data that works but should be cleaned up, e.g. soft hyphens in flavor
+text) only fail the run with --strict. The report lists each rule with its
+issue count and the first few offending records.
+
+Usage:
+    python validate_data.py [--strict] [--examples N] [--dataset NAME ...]
+"""
+
+import argparse
+import json
+import re
+import time
+import unicodedata
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from build_utils import REPO_ROOT
+
+POKEMON_PATH = REPO_ROOT / "data" / "pokemon.json"
+POKEMON_SHARDS_DIR = REPO_ROOT / "data" / "pokemon"
+ARTWORK_MANIFEST_PATH = REPO_ROOT / "data" / "artwork-manifest.json"
+GEO_PATH = REPO_ROOT / "geotriad-game" / "data" / "geo.json"
+GEO_CORE_PATH = REPO_ROOT / "geotriad-game" / "data" / "geo.core.json"
+CONTINENTS_PATH = REPO_ROOT / "geotriad-game" / "data" / "continents.json"
+
+ERROR = "error"
+WARNING = "warning"
+
+# field: (accepted types, required). Enrichment fields are optional so a
+# freshly added generation validates before it has been enriched.
+POKEMON_SCHEMA = {
+    "id": (int, True),
+    "name": (str, True),
+    "germanName": (str, True),
+    "region": (str, True),
+    "imageUrl": (str, True),
+    "type": (list, False),
+    "types2": (list, False),
+    "heightDm": (int, False),
+    "weightHg": (int, False),
+    "generation": (str, False),
+    "mainRegion": (str, False),
+    "habitat": (str, False),
+    "color": (str, False),
+    "shape": (str, False),
+    "genusEn": (str, False),
+    "flavorTextEn": (str, False),
+    "categoryTag": ((str, type(None)), False),
+}
+
+GEO_SCHEMA = {
+    "id": (str, True),
+    "country_en": (str, True),
+    "country_de": (str, True),
+    "continent_en": (str, True),
+    "continent_de": (str, True),
+    "region_en": (str, False),
+    "region_de": (str, False),
+    "capital_en": (str, True),
+    "capital_de": (str, True),
+    "flag": (str, True),
+    "tags": (list, True),
+}
+# Optional columns for languages beyond en/de, e.g. country_fr
+GEO_LOCALIZED_FIELD = re.compile(r"(country|capital|continent)_[a-z]{2,3}")
+
+# Invisible characters that survive copy/paste from web sources
+INVISIBLE_CHARS = {
+    "\u00ad": "SOFT HYPHEN",
+    "\u200b": "ZERO WIDTH SPACE",
+    "\u200c": "ZERO WIDTH NON-JOINER",
+    "\u200d": "ZERO WIDTH JOINER",
+    "\u2060": "WORD JOINER",
+    "\ufeff": "BYTE ORDER MARK",
+}
+# Fast pre-check; the per-character scan only runs on strings that match
+SUSPECT_CHARS = re.compile("[\x00-\x1f\x7f-\x9f\u00ad\u200b-\u200d\u2060\ufeff]")
+
+
+class Rule:
+    """A named check over one dataset."""
+
+    def __init__(self, dataset: str, name: str, severity: str, description: str,
+                 check: Callable, per_record: bool):
+        self.dataset = dataset
+        self.name = name
+        self.severity = severity
+        self.description = description
+        self.check = check
+        self.per_record = per_record
+
+
+RULES: List[Rule] = []
+
+
+def record_rule(dataset: str, name: str, severity: str, description: str):
+    """Register check(record, state) -> messages, called once per record."""
+    def register(check):
+        RULES.append(Rule(dataset, name, severity, description, check, per_record=True))
+        return check
+    return register
+
+
+def dataset_rule(dataset: str, name: str, severity: str, description: str):
+    """Register check(records) -> messages, called once after the record pass."""
+    def register(check):
+        RULES.append(Rule(dataset, name, severity, description, check, per_record=False))
+        return check
+    return register
+
+
+def pokemon_label(record: Dict) -> str:
+    """Short label for messages, e.g. "#25 Pikachu"."""
+    return f"#{record.get('id', '?')} {record.get('name', '')}".rstrip()
+
+
+def geo_label(record: Dict) -> str:
+    """Short label for messages, e.g. "DE Germany"."""
+    return f"{record.get('id', '?')} {record.get('country_en', '')}".rstrip()
+
+
+def load_json(path: Path):
+    """Parse a JSON file, or None if it does not exist."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def check_schema(record: Dict, schema: Dict, extra_fields=None) -> Iterable[str]:
+    """Missing required fields, wrong types and unknown fields.
+
+    extra_fields is an optional pattern for additional string fields.
+    """
+    for field, (types, required) in schema.items():
+        if field not in record:
+            if required:
+                yield f"missing {field}"
+            continue
+        value = record[field]
+        # bool is an int subclass, but never a valid id or measurement
+        if isinstance(value, bool) or not isinstance(value, types):
+            yield f"{field} is {type(value).__name__}"
+    for field in record:
+        if field in schema:
+            continue
+        if extra_fields is not None and extra_fields.fullmatch(field):
+            if not isinstance(record[field], str):
+                yield f"{field} is {type(record[field]).__name__}"
+        else:
+            yield f"unknown field {field}"
+
+
+def check_text(record: Dict) -> Iterable[str]:
+    """Control and invisible characters, stray whitespace and non-NFC text."""
+    for field, value in record.items():
+        values = value if isinstance(value, list) else [value]
+        for text in values:
+            if not isinstance(text, str):
+                continue
+            if SUSPECT_CHARS.search(text):
+                for position, char in enumerate(text):
+                    if char in INVISIBLE_CHARS:
+                        yield f"{field}: {INVISIBLE_CHARS[char]} at {position}"
+                    elif unicodedata.category(char) == "Cc":
+                        yield f"{field}: control character U+{ord(char):04X} at {position}"
+            if text != text.strip() or "  " in text:
+                yield f"{field}: stray whitespace in {text[:40]!r}"
+            if not unicodedata.is_normalized("NFC", text):
+                yield f"{field}: not NFC-normalized"
+
+
+def check_unique(record: Dict, state: Dict, field: str) -> Iterable[str]:
+    """Report values of field already seen in an earlier record."""
+    value = record.get(field)
+    if value in (None, ""):
+        return
+    seen = state.setdefault(field, {})
+    if value in seen:
+        yield f"duplicate {field} {value!r} (also {seen[value]})"
+    else:
+        seen[value] = record.get("id")
+
+
+# ============================================================================
+# Pokémon rules
+# ============================================================================
+
+@record_rule("pokemon", "schema", ERROR, "required fields and value types")
+def pokemon_schema(record, state):
+    for message in check_schema(record, POKEMON_SCHEMA):
+        yield f"{pokemon_label(record)}: {message}"
+
+
+@record_rule("pokemon", "unique-id", ERROR, "ids are positive and unique")
+def pokemon_unique_id(record, state):
+    if isinstance(record.get("id"), int) and record["id"] < 1:
+        yield f"{pokemon_label(record)}: id must be positive"
+    for message in check_unique(record, state, "id"):
+        yield f"{pokemon_label(record)}: {message}"
+
+
+@record_rule("pokemon", "unique-name", ERROR, "English and German names are unique")
+def pokemon_unique_name(record, state):
+    for field in ("name", "germanName"):
+        for message in check_unique(record, state, field):
+            yield f"{pokemon_label(record)}: {message}"
+
+
+@record_rule("pokemon", "bilingual", ERROR, "every record has an English and a German name")
+def pokemon_bilingual(record, state):
+    for field in ("name", "germanName"):
+        if not record.get(field):
+            yield f"{pokemon_label(record)}: empty {field}"
+
+
+@record_rule("pokemon", "text-hygiene", WARNING, "no invisible/control characters or stray whitespace")
+def pokemon_text(record, state):
+    for message in check_text(record):
+        yield f"{pokemon_label(record)}: {message}"
+
+
+@record_rule("pokemon", "redundant-types2", WARNING, "types2 does not just repeat type")
+def pokemon_redundant_types(record, state):
+    if "types2" in record and record.get("types2") == record.get("type"):
+        yield f"{pokemon_label(record)}: types2 duplicates type {record.get('type')}"
+
+
+@record_rule("pokemon", "null-value", WARNING, "no null values")
+def pokemon_null(record, state):
+    for field, value in record.items():
+        if value is None:
+            yield f"{pokemon_label(record)}: {field} is null"
+
+
+@record_rule("pokemon", "region", ERROR, "region agrees with mainRegion and generation")
+def pokemon_region(record, state):
+    if "mainRegion" in record and record["mainRegion"] != record.get("region"):
+        yield f"{pokemon_label(record)}: region {record.get('region')!r} but mainRegion {record['mainRegion']!r}"
+    if "generation" in record:
+        generations = state.setdefault("generations", {})
+        expected = generations.setdefault(record.get("region"), record["generation"])
+        if record["generation"] != expected:
+            yield f"{pokemon_label(record)}: {record['generation']} in region {record.get('region')} ({expected})"
+
+
+@dataset_rule("pokemon", "sources", ERROR, "records match the modules in pokemon_sources/")
+def pokemon_sources(records):
+    from build_pokemon_data import source_records
+    from pokemon_sources import discover_sources
+
+    by_id = {record.get("id"): record for record in records}
+    expected_ids = set()
+    for module in discover_sources():
+        for expected in source_records(module):
+            expected_ids.add(expected["id"])
+            record = by_id.get(expected["id"])
+            if record is None:
+                yield f"#{expected['id']} {expected['name']}: missing (run build_pokemon_data.py)"
+                continue
+            for field, value in expected.items():
+                if record.get(field) != value:
+                    yield f"{pokemon_label(record)}: {field} is {record.get(field)!r}, source has {value!r}"
+    for pokemon_id in sorted(set(by_id) - expected_ids, key=str):
+        yield f"{pokemon_label(by_id[pokemon_id])}: not defined in any source module"
+
+
+# ============================================================================
+# GeoTriad rules
+# ============================================================================
+
+@record_rule("geo", "schema", ERROR, "required fields and value types")
+def geo_schema(record, state):
+    for message in check_schema(record, GEO_SCHEMA, GEO_LOCALIZED_FIELD):
+        yield f"{geo_label(record)}: {message}"
+    if isinstance(record.get("id"), str) and not re.fullmatch(r"[A-Z]{2}", record["id"]):
+        yield f"{geo_label(record)}: id is not an ISO 3166-1 alpha-2 code"
+
+
+@record_rule("geo", "unique-id", ERROR, "ids are unique")
+def geo_unique_id(record, state):
+    for message in check_unique(record, state, "id"):
+        yield f"{geo_label(record)}: {message}"
+
+
+@record_rule("geo", "unique-name", WARNING, "country names are unique per language")
+def geo_unique_name(record, state):
+    # Two identical names show up as indistinguishable answer options
+    for field in ("country_en", "country_de"):
+        for message in check_unique(record, state, field):
+            yield f"{geo_label(record)}: {message}"
+
+
+@record_rule("geo", "bilingual", ERROR, "country, capital and continent exist in English and German")
+def geo_bilingual(record, state):
+    for field in ("country", "capital", "continent"):
+        for lang in ("en", "de"):
+            if not record.get(f"{field}_{lang}"):
+                yield f"{geo_label(record)}: empty {field}_{lang}"
+
+
+@record_rule("geo", "text-hygiene", WARNING, "no invisible/control characters or stray whitespace")
+def geo_text(record, state):
+    for message in check_text(record):
+        yield f"{geo_label(record)}: {message}"
+
+
+@record_rule("geo", "flag", ERROR, "flag emoji matches the id")
+def geo_flag(record, state):
+    country_id = record.get("id")
+    if not isinstance(country_id, str) or len(country_id) != 2:
+        return
+    expected = "".join(chr(0x1F1E6 + ord(char) - ord("A")) for char in country_id.upper())
+    if record.get("flag") != expected:
+        yield f"{geo_label(record)}: flag {record.get('flag')!r}, expected {expected}"
+
+
+@record_rule("geo", "continent", ERROR, "each continent has exactly one German name")
+def geo_continent(record, state):
+    names = state.setdefault("names", {})
+    continent_en = record.get("continent_en")
+    expected = names.setdefault(continent_en, record.get("continent_de"))
+    if record.get("continent_de") != expected:
+        yield f"{geo_label(record)}: {continent_en} is {record.get('continent_de')!r}, elsewhere {expected!r}"
+
+
+@dataset_rule("geo", "continents-file", ERROR, "continents agree with continents.json")
+def geo_continents_file(records):
+    mapping = load_json(CONTINENTS_PATH)
+    if mapping is None:
+        return
+    for record in records:
+        expected = mapping.get(record.get("id"))
+        if expected is None:
+            yield f"{geo_label(record)}: not in {CONTINENTS_PATH.name}"
+        elif expected != record.get("continent_en"):
+            yield f"{geo_label(record)}: continent {record.get('continent_en')!r}, {CONTINENTS_PATH.name} has {expected!r}"
+
+
+# ============================================================================
+# Artifact rules (files derived by build_artifacts.py / build_artwork.py)
+# ============================================================================
+
+def expected_projection(name: str):
+    """(records, locales) build_artifacts.py would emit for a projection, before artwork.
+
+    Returns (None, {}) if the source is missing.
+    """
+    from build_artifacts import LOCALE_BUILDERS, PROJECTIONS, project
+
+    projection = next(p for p in PROJECTIONS if p["name"] == name)
+    source = load_json(projection["source"])
+    if source is None:
+        return None, {}
+    locales = {}
+    if "locales" in projection:
+        source, locales = LOCALE_BUILDERS[projection["locales"]](source)
+    return project(source, projection["fields"]), locales
+
+
+def compare_projection(expected: List[Dict], actual: List[Dict], artifact: str,
+                       ignore=()) -> Iterable[str]:
+    """Differences between an emitted projection and its source."""
+    if len(expected) != len(actual):
+        yield f"{artifact}: {len(actual)} records, source has {len(expected)} (run build_artifacts.py)"
+        return
+    for row, (want, have) in enumerate(zip(expected, actual)):
+        fields = (set(want) | set(have)) - set(ignore)
+        stale = sorted(field for field in fields if want.get(field) != have.get(field))
+        if stale:
+            yield f"{artifact}[{row}] id {want.get('id')}: {', '.join(stale)} differ from source (run build_artifacts.py)"
+
+
+@dataset_rule("artifacts", "pokemon-shards", ERROR, "data/pokemon/ shards match pokemon.json")
+def artifacts_pokemon_shards(records):
+    manifest = load_json(POKEMON_SHARDS_DIR / "manifest.json")
+    expected, _ = expected_projection("pokemon-game")
+    if manifest is None or expected is None:
+        yield "data/pokemon/manifest.json or its source is missing (run build_artifacts.py)"
+        return
+    actual = []
+    for shard in manifest["shards"]:
+        data = load_json(POKEMON_SHARDS_DIR / shard["file"])
+        if data is None:
+            yield f"{shard['file']}: listed in manifest.json but missing"
+            continue
+        if len(data) != shard["count"]:
+            yield f"{shard['file']}: {len(data)} records, manifest.json says {shard['count']}"
+        actual.extend(data)
+    if manifest["total"] != len(expected):
+        yield f"manifest.json: total {manifest['total']}, source has {len(expected)}"
+    # Shards are grouped by region, so compare by id rather than by position
+    expected.sort(key=lambda record: record["id"])
+    actual.sort(key=lambda record: record.get("id", 0))
+    # Mirrored artwork legitimately replaces imageUrl
+    yield from compare_projection(expected, actual, "data/pokemon", ignore=("imageUrl", "imageSrcset"))
+
+
+@dataset_rule("artifacts", "geo-locales", ERROR, "geo.core.json and geo.<lang>.json match geo.json")
+def artifacts_geo_locales(records):
+    payload = load_json(GEO_CORE_PATH)
+    expected, locales = expected_projection("geotriad")
+    if payload is None or expected is None:
+        yield "geo.core.json or its source is missing (run build_artifacts.py)"
+        return
+    yield from compare_projection(expected, payload["countries"], GEO_CORE_PATH.name)
+    for lang, strings in locales.items():
+        path = GEO_CORE_PATH.with_name(f"geo.{lang}.json")
+        if load_json(path) != strings:
+            yield f"{path.name}: missing or stale (run build_artifacts.py)"
+
+
+@dataset_rule("artifacts", "name-index", ERROR, "typed-answer name indexes match their sources")
+def artifacts_name_index(records):
+    from build_artifacts import geo_name_index, pokemon_name_index
+
+    manifest = load_json(POKEMON_SHARDS_DIR / "manifest.json") or {}
+    pokemon_path = POKEMON_SHARDS_DIR / manifest["names"]["file"] if "names" in manifest else None
+    checks = [
+        (pokemon_path, POKEMON_PATH, pokemon_name_index),
+        (GEO_CORE_PATH.with_name("geo.names.json"), GEO_PATH, geo_name_index),
+    ]
+    for path, source_path, builder in checks:
+        source = load_json(source_path)
+        if source is None:
+            continue
+        if path is None or load_json(path) != builder(source):
+            yield f"{path.name if path else 'names index'}: missing or stale (run build_artifacts.py)"
+
+
+@dataset_rule("artifacts", "artwork", ERROR, "artwork manifest only lists known Pokémon")
+def artifacts_artwork(records):
+    manifest = load_json(ARTWORK_MANIFEST_PATH)
+    pokemon = load_json(POKEMON_PATH) or []
+    if manifest is None:
+        return
+    known = {str(record.get("id")) for record in pokemon}
+    for key in sorted(set(manifest) - known, key=str):
+        yield f"artwork-manifest.json: entry {key} has no Pokémon"
+
+
+# A table kept from an earlier build (no NumPy) may lag behind the data
+@dataset_rule("artifacts", "pokemon-decoys", WARNING, "the decoy table covers every Pokémon")
+def artifacts_pokemon_decoys(records):
+    manifest = load_json(POKEMON_SHARDS_DIR / "manifest.json") or {}
+    if "decoys" not in manifest:
+        return
+    table = load_json(POKEMON_SHARDS_DIR / manifest["decoys"]["file"])
+    if table is None:
+        yield f"{manifest['decoys']['file']}: listed in manifest.json but missing"
+        return
+    known = {record.get("id") for record in load_json(POKEMON_PATH) or []}
+    if set(table["ids"]) != known:
+        yield f"{manifest['decoys']['file']}: ids differ from pokemon.json (run build_artifacts.py)"
+    k = table["k"]
+    if len(table["neighbors"]) != k * len(table["ids"]):
+        yield f"{manifest['decoys']['file']}: expected {k} neighbors per Pokémon"
+        return
+    for row, pokemon_id in enumerate(table["ids"]):
+        neighbors = table["neighbors"][row * k:(row + 1) * k]
+        if pokemon_id in neighbors or len(set(neighbors)) != k:
+            yield f"#{pokemon_id}: decoys repeat or include itself"
+
+
+DATASETS = {
+    "pokemon": POKEMON_PATH,
+    "geo": GEO_PATH,
+    "artifacts": None,
+}
+
+
+def run_dataset(dataset: str, examples: int) -> List[Dict]:
+    """Run every rule for one dataset. Returns one result per rule."""
+    rules = [rule for rule in RULES if rule.dataset == dataset]
+    results = [{"rule": rule, "count": 0, "examples": []} for rule in rules]
+
+    def record_issues(result, messages):
+        for message in messages:
+            result["count"] += 1
+            if len(result["examples"]) < examples:
+                result["examples"].append(message)
+
+    path = DATASETS[dataset]
+    records = []
+    if path is not None:
+        records = load_json(path)
+        if not isinstance(records, list):
+            raise SystemExit(f"✗ {path.relative_to(REPO_ROOT)} is missing or not a JSON list")
+        # Single pass: every record rule sees each record once, with its own state
+        states = [{} for _ in rules]
+        for record in records:
+            for rule, result, state in zip(rules, results, states):
+                if rule.per_record:
+                    record_issues(result, rule.check(record, state))
+
+    for rule, result in zip(rules, results):
+        if not rule.per_record:
+            record_issues(result, rule.check(records))
+    return results
+
+
+def validate(datasets: Optional[List[str]] = None, examples: int = 3,
+             strict: bool = False, verbose: bool = True) -> bool:
+    """Validate datasets and print the report (only failing rules unless verbose).
+
+    Returns True if the run passes.
+    """
+    start = time.perf_counter()
+    failing = {ERROR, WARNING} if strict else {ERROR}
+    passed = True
+    counts = {ERROR: 0, WARNING: 0}
+
+    for dataset in datasets or list(DATASETS):
+        for result in run_dataset(dataset, examples):
+            rule = result["rule"]
+            counts[rule.severity] += result["count"]
+            if result["count"] and rule.severity in failing:
+                passed = False
+            name = f"{rule.dataset}.{rule.name}"
+            if not result["count"]:
+                if verbose:
+                    print(f"✓ {name:<28} {rule.description}")
+                continue
+            if not verbose and rule.severity not in failing:
+                continue
+            print(f"✗ {name:<28} {result['count']} {rule.severity}{'s' if result['count'] != 1 else ''}"
+                  f" - {rule.description}")
+            for message in result["examples"]:
+                print(f"    {message}")
+            if result["count"] > len(result["examples"]):
+                print(f"    … {result['count'] - len(result['examples'])} more")
+
+    elapsed = time.perf_counter() - start
+    print(f"{'✓' if passed else '✗'} Validation {'passed' if passed else 'failed'}: "
+          f"{counts[ERROR]} errors, {counts[WARNING]} warnings ({elapsed * 1000:.0f} ms)")
+    return passed
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Validate the game datasets")
+    parser.add_argument("--dataset", action="append", choices=list(DATASETS),
+                        help="only validate this dataset (repeatable; default: all)")
+    parser.add_argument("--examples", type=int, default=3,
+                        help="offending records to show per rule")
+    parser.add_argument("--strict", action="store_true",
+                        help="treat warnings as errors")
+    args = parser.parse_args()
+    if not validate(args.dataset, args.examples, args.strict):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()